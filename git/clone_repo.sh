@@ -1,21 +1,112 @@
 #!/usr/bin/env zsh
 
+# $1 - ssh link
+# $2 - local repo name
+# $3 - package manager
+#
+# options, every setting given as an option is not prompted for:
+#   --branch NAME        - branch to check out instead of the remote HEAD
+#   --pm yarn|npm|none   - package manager, same as $3
+#   --user-name NAME     - git user name for this repository
+#   --user-email EMAIL   - git user email for this repository
+#   --ide, --no-ide      - launch or don't launch IDE in the cloned project
+#   -y, --yes            - don't prompt at all, settings that are not given fall back to defaults:
+#                          directory named after the repository, no package manager, global identity, no IDE
+#   --blobless           - partial clone, file contents are downloaded on demand (--filter=blob:none)
+#   --treeless           - partial clone, trees and file contents are downloaded on demand (--filter=tree:0)
+#   --depth N            - shallow clone with N latest commits
+#   --shared             - borrow objects from the local shared object store, see shared_objects_repo.sh
+#                          the clone depends on the store: removing it (or the repository in it) breaks the clone
+#   --dissociate         - with --shared, copy the borrowed objects and don't depend on the store afterwards
+
+DIRNAME=$(dirname "$0")
+
+packagemanager=""
+username=""
+useremail=""
+usernameSet=
+useremailSet=
+launchIde=""
+noPrompt=
+cloneOptions=()
+useSharedObjects=
+dissociate=
+positionalArgs=()
+
+# option $1 takes a value, $2 is the number of arguments left including the option
+require_value() {
+    if [ $2 -lt 2 ] || [[ "$3" == -* ]]; then
+        printf "Error: $1 requires a value\n" >&2
+        exit 1
+    fi
+}
+
+while [ $# -gt 0 ]; do
+    case "$1" in
+        --branch ) require_value "$1" $# "$2"; cloneOptions+=(--branch "$2"); shift 2;;
+        --pm ) require_value "$1" $# "$2"; packagemanager="$2"; shift 2;;
+        --user-name ) require_value "$1" $# "$2"; username="$2"; usernameSet=true; shift 2;;
+        --user-email ) require_value "$1" $# "$2"; useremail="$2"; useremailSet=true; shift 2;;
+        --ide ) launchIde="y"; shift;;
+        --no-ide ) launchIde="n"; shift;;
+        -y|--yes ) noPrompt=true; shift;;
+        --blobless ) cloneOptions+=(--filter=blob:none); shift;;
+        --treeless ) cloneOptions+=(--filter=tree:0); shift;;
+        --depth )
+            if [ $# -lt 2 ] || ! [[ "$2" =~ ^[1-9][0-9]*$ ]]; then
+                printf "Error: --depth requires a number of commits\n" >&2
+                exit 1
+            fi
+            cloneOptions+=(--depth "$2")
+            shift 2
+            ;;
+        --shared ) useSharedObjects=true; shift;;
+        --dissociate ) dissociate=true; shift;;
+        -* )
+            printf "Error: Unknown option $1\n" >&2
+            exit 1
+            ;;
+        * ) positionalArgs+=("$1"); shift;;
+    esac
+done
+
+set -- "${positionalArgs[@]}"
+
+[ -n "$3" ] && packagemanager="$3"
+
+if [ -z "$1" ]
+then
+    printf "Error: Repository link is required\n" >&2
+    exit 1
+fi
+
+if [ $useSharedObjects ]
+then
+    sharedRepo=$($DIRNAME/shared_objects_repo.sh $1) && cloneOptions+=(--reference-if-able "$sharedRepo")
+    [ $dissociate ] && cloneOptions+=(--dissociate)
+fi
+
 if [ -n "$2" ]
 then
-    git clone $1 $2
-    cd $2
+    directoryname="$2"
+elif [ $noPrompt ]
+then
+    directoryname="${${1:t}%.git}"
 else
     printf "\nSpecify the directory name:\n"
     read directoryname
     printf "\n"
-    git clone $1 $directoryname
-    cd $directoryname
 fi
 
-if [ -n "$3" ]
+# options go after the positional arguments, git accepts them in any order
+git clone $1 $directoryname "${cloneOptions[@]}"
+cd $directoryname
+
+if [ -n "$packagemanager" ]
+then
+    [ "$packagemanager" != "none" ] && $packagemanager install
+elif [ -z "$noPrompt" ]
 then
-    $3 install
-else
     printf "\n\nSpecify package manager:\n[y - yarn]\n[n - npm]\n[Enter - none]\n"
     read packagemanager
     case $packagemanager in
@@ -25,22 +116,35 @@ else
     esac
 fi
 
-printf "\nType user name or press Enter to use global:\n"
-read username
-git config user.name $username
+if [ -z "$usernameSet" ] && [ -z "$noPrompt" ]
+then
+    printf "\nType user name or press Enter to use global:\n"
+    read username
+fi
+if [ -n "$username" ]; then
+    git config user.name "$username"
+fi
 
-printf "\nType user email or press Enter to use global:\n"
-read useremail
-git config user.email $useremail
+if [ -z "$useremailSet" ] && [ -z "$noPrompt" ]
+then
+    printf "\nType user email or press Enter to use global:\n"
+    read useremail
+fi
+if [ -n "$useremail" ]; then
+    git config user.email "$useremail"
+fi
 
-printf "\n\nRepository successfully cloned \\(^_^)/\n\nYou need to manually add Claude Code, Gemini CLI, Cursor and aider configs to this new project\n\nDo you want to launch IDE in this project? [Y/n]\n"
-read yn
+printf "\n\nRepository successfully cloned \\(^_^)/\n\nYou need to manually add Claude Code, Gemini CLI, Cursor and aider configs to this new project\n"
 
-DIRNAME=$(dirname "$0")
+if [ -z "$launchIde" ] && [ -z "$noPrompt" ]
+then
+    printf "\nDo you want to launch IDE in this project? [Y/n]\n"
+    read launchIde
+fi
 
-case $yn in
+case $launchIde in
     [Yy]* ) $DIRNAME/../ide/launch_current_ide_in_pwd.sh;;
     [Nn]* ) ;;
 esac
 
-printf "\n"
\ No newline at end of file
+printf "\n"
@@ -3,40 +3,124 @@
 # $1 - ssh link
 # $2 - local repo name
 # $3 - package manager
+#
+# options, every setting given as an option is not prompted for:
+#   --branch NAME        - master branch name
+#   --pm yarn|npm|none   - package manager, same as $3
+#   --user-name NAME     - git user name for this repository
+#   --user-email EMAIL   - git user email for this repository
+#   -y, --yes            - don't prompt at all, settings that are not given fall back to defaults:
+#                          directory named after the repository, master branch, no package manager, global identity
+#   --blobless           - partial clone, file contents are downloaded on demand (--filter=blob:none)
+#   --treeless           - partial clone, trees and file contents are downloaded on demand (--filter=tree:0)
+#   --depth N            - shallow clone with N latest commits of every branch
+#   --shared             - borrow objects from the local shared object store, see shared_objects_repo.sh
+#                          the clone depends on the store: removing it (or the repository in it) breaks the clone
+#   --dissociate         - with --shared, copy the borrowed objects and don't depend on the store afterwards
+
+DIRNAME=$(dirname "$0")
+
+masterbranch=""
+packagemanager=""
+username=""
+useremail=""
+usernameSet=
+useremailSet=
+noPrompt=
+cloneOptions=()
+depth=""
+useSharedObjects=
+dissociate=
+positionalArgs=()
+
+# option $1 takes a value, $2 is the number of arguments left including the option
+require_value() {
+    if [ $2 -lt 2 ] || [[ "$3" == -* ]]; then
+        printf "Error: $1 requires a value\n" >&2
+        exit 1
+    fi
+}
+
+while [ $# -gt 0 ]; do
+    case "$1" in
+        --branch ) require_value "$1" $# "$2"; masterbranch="$2"; shift 2;;
+        --pm ) require_value "$1" $# "$2"; packagemanager="$2"; shift 2;;
+        --user-name ) require_value "$1" $# "$2"; username="$2"; usernameSet=true; shift 2;;
+        --user-email ) require_value "$1" $# "$2"; useremail="$2"; useremailSet=true; shift 2;;
+        -y|--yes ) noPrompt=true; shift;;
+        --blobless ) cloneOptions+=(--filter=blob:none); shift;;
+        --treeless ) cloneOptions+=(--filter=tree:0); shift;;
+        --depth )
+            if [ $# -lt 2 ] || ! [[ "$2" =~ ^[1-9][0-9]*$ ]]; then
+                printf "Error: --depth requires a number of commits\n" >&2
+                exit 1
+            fi
+            depth="$2"
+            cloneOptions+=(--depth "$2")
+            shift 2
+            ;;
+        --shared ) useSharedObjects=true; shift;;
+        --dissociate ) dissociate=true; shift;;
+        -* )
+            printf "Error: Unknown option $1\n" >&2
+            exit 1
+            ;;
+        * ) positionalArgs+=("$1"); shift;;
+    esac
+done
+
+set -- "${positionalArgs[@]}"
+
+[ -n "$3" ] && packagemanager="$3"
+
+if [ -z "$1" ]
+then
+    printf "Error: Repository link is required\n" >&2
+    exit 1
+fi
+
+if [ $useSharedObjects ]
+then
+    sharedRepo=$($DIRNAME/shared_objects_repo.sh $1) && cloneOptions+=(--reference-if-able "$sharedRepo")
+    [ $dissociate ] && cloneOptions+=(--dissociate)
+fi
 
 if [ -n "$2" ]
 then
-    git clone --bare $1 $2
-    cd $2
+    directoryname="$2"
+elif [ $noPrompt ]
+then
+    directoryname="${${1:t}%.git}"
 else
     printf "\nSpecify the directory name:\n"
     read directoryname
     printf "\n"
-    git clone --bare $1 $directoryname
-    cd $directoryname
 fi
 
+# options go after the positional arguments, git accepts them in any order
+git clone --bare $1 $directoryname "${cloneOptions[@]}"
+cd $directoryname
+
 mkdir .bare
 mv ./* ./.bare
 echo "gitdir: ./.bare" > .git
 
 # Store the project name for worktree naming
-if [ -n "$2" ]
-then
-    projectname="$2"
-else
-    projectname="$directoryname"
-fi
+projectname="$directoryname"
 
 defaultbranch="master"
-printf "\nSpecify the master branch name: press Enter to use master (default), write main if you use GitHub, or write the name of the branch you want to use\n"
-read masterbranch
+
+if [ -z "$masterbranch" ] && [ -z "$noPrompt" ]
+then
+    printf "\nSpecify the master branch name: press Enter to use master (default), write main if you use GitHub, or write the name of the branch you want to use\n"
+    read masterbranch
+fi
 
 if [ -z "$masterbranch" ]; then
     masterbranch="$defaultbranch"
 fi
 
-printf "Default branch is set to: $defaultbranch\n\n"
+printf "Default branch is set to: $masterbranch\n\n"
 
 # git clone --bare don't add a refspec to the config, thus we add it manually
 echo '        fetch = +refs/heads/*:refs/remotes/origin/*
@@ -45,15 +129,21 @@ echo '        fetch = +refs/heads/*:refs/remotes/origin/*
 	merge = refs/heads/'$masterbranch'
 	vscode-merge-base = origin/'$masterbranch'' >> .bare/config
 
-git fetch origin
+if [ -n "$depth" ]
+then
+    git fetch --depth $depth origin
+else
+    git fetch origin
+fi
 git worktree add ./${projectname}-${masterbranch} origin/$masterbranch
 cd ./${projectname}-${masterbranch}
 git checkout $masterbranch
 
-if [ -n "$3" ]
+if [ -n "$packagemanager" ]
+then
+    [ "$packagemanager" != "none" ] && $packagemanager install
+elif [ -z "$noPrompt" ]
 then
-    $3 install
-else
     printf "\n\nSpecify package manager:\n[Y - yarn]\n[N - npm]\n[Enter - none]\n"
         read -k packagemanager
     case $packagemanager in
@@ -63,14 +153,20 @@ else
     esac
 fi
 
-printf "\nType user name or press Enter to use global:\n"
-read username
+if [ -z "$usernameSet" ] && [ -z "$noPrompt" ]
+then
+    printf "\nType user name or press Enter to use global:\n"
+    read username
+fi
 if [ -n "$username" ]; then
     git config user.name "$username"
 fi
 
-printf "\nType user email or press Enter to use global:\n"
-read useremail
+if [ -z "$useremailSet" ] && [ -z "$noPrompt" ]
+then
+    printf "\nType user email or press Enter to use global:\n"
+    read useremail
+fi
 if [ -n "$useremail" ]; then
     git config user.email "$useremail"
 fi
@@ -1,5 +1,37 @@
 #!/usr/bin/env zsh
 
+# show list of worktrees excluding the default branch
+#
+# --status     - show a dashboard with path, dirty/clean state, ahead/behind vs. upstream,
+#                last commit age and node_modules size of every worktree (gathered concurrently)
+# --porcelain  - with --status, print tab separated fields instead of the table:
+#                branch, path, state, ahead, behind, upstream, last commit age, node_modules size in KB
+# --refresh    - with --status, ignore the cached status
+#
+# WORKTREE_STATUS_CACHE_TTL - seconds the status is cached for (0 by default - no cache). The cache is only
+#                             invalidated by changes of the worktree list, not by edits inside a worktree,
+#                             so a cached dirty/clean state may be stale until the TTL expires
+# WORKTREE_STATUS_JOBS      - number of worktrees inspected in parallel (8 by default)
+
+# EPOCHSECONDS is provided by the zsh/datetime module
+zmodload zsh/datetime
+
+showStatus=
+porcelain=
+refresh=
+
+for arg in "$@"; do
+    case "$arg" in
+        --status ) showStatus=true;;
+        --porcelain ) porcelain=true;;
+        --refresh ) refresh=true;;
+        * )
+            printf "Error: Unknown option $arg\n" >&2
+            exit 1
+            ;;
+    esac
+done
+
 # Detect the default branch from the remote HEAD
 default_branch=$(git symbolic-ref refs/remotes/origin/HEAD 2>/dev/null | sed 's|refs/remotes/origin/||')
 if [ -z "$default_branch" ]; then
@@ -7,32 +39,173 @@ if [ -z "$default_branch" ]; then
     default_branch=$(git symbolic-ref refs/remotes/origin/HEAD 2>/dev/null | sed 's|refs/remotes/origin/||')
 fi
 
-# git worktree list returns a string
-worktreeList=$(git worktree list)
+# git worktree list --porcelain returns one block per worktree, we map branch names to worktree paths
+worktreeListPorcelain=$(git worktree list --porcelain)
+
+typeset -A worktreePaths
+worktreeBranches=()
+currentPath=""
+while IFS= read -r line; do
+    case "$line" in
+        "worktree "* ) currentPath="${line#worktree }";;
+        "branch refs/heads/"* )
+            worktreePaths[${line#branch refs/heads/}]="$currentPath"
+            worktreeBranches+=("${line#branch refs/heads/}")
+            ;;
+    esac
+done <<< "$worktreeListPorcelain"
 
-# git for-each-ref returns an array of all the refs, then we filter out the default branch
-refArray=($(git for-each-ref  --format="%(refname:short)" refs/heads/ | grep -v "^${default_branch}$"))
-refArrayLength=${#refArray[@]}
+if [ -z "$showStatus" ]
+then
+    # git for-each-ref returns an array of all the refs, then we filter out the default branch
+    refArray=($(git for-each-ref  --format="%(refname:short)" refs/heads/ | grep -v "^${default_branch}$"))
 
-isAnyTreePresent=
+    isAnyTreePresent=
 
-printf "\n"
+    printf "\n"
 
-# in bash array starts from 0 idx, but in zsh they start from 1
-for (( i=1; i<=${refArrayLength}; i++ ));
-do
+    for ref in "${refArray[@]}"; do
+        # we display only refs that have a worktree
+        if (( ${+worktreePaths[$ref]} ))
+        then
+            printf "$ref\n"
+            isAnyTreePresent=true
+        fi
+    done
 
-    # we display only refs with names present in the worktree list string
-    if [[ $worktreeList == *"[$refArray[i]]"* ]]
+    if [ $isAnyTreePresent ]
     then
-        printf "$refArray[i]\n"
-        isAnyTreePresent=true
+        printf "\n"
+    else
+        printf "There are no worktrees\n"
     fi
-done
+    exit 0
+fi
+
+# print tab separated status of the worktree $2 checked out on branch $1
+collect_worktree_status() {
+    local branch="$1"
+    local worktreePath="$2"
+    local state="clean"
+    local ahead="0"
+    local behind="0"
+    local upstream="-"
+    local age="-"
+    local nodeModulesSize="-"
+    local statusLine
 
-if [ $isAnyTreePresent ]
+    # a single status call gives both the working tree state and ahead/behind counts
+    while IFS= read -r statusLine; do
+        case "$statusLine" in
+            "# branch.upstream "* ) upstream="${statusLine#\# branch.upstream }";;
+            "# branch.ab "* )
+                ahead="${${statusLine#\# branch.ab +}%% *}"
+                behind="${statusLine##* -}"
+                ;;
+            "#"* ) ;;
+            * ) state="dirty";;
+        esac
+    done < <(git -C "$worktreePath" status --porcelain=v2 --branch 2>/dev/null)
+
+    age=$(git -C "$worktreePath" log -1 --format=%cr 2>/dev/null)
+
+    if [ -d "$worktreePath/node_modules" ]; then
+        nodeModulesSize=$(du -sk "$worktreePath/node_modules" 2>/dev/null | awk '{print $1}')
+    fi
+
+    printf "%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s\n" "$branch" "$worktreePath" "$state" "$ahead" "$behind" "$upstream" "${age:--}" "${nodeModulesSize:--}"
+}
+
+# format size in KB for humans
+format_size() {
+    if [ "$1" = "-" ]; then
+        echo "-"
+    else
+        awk -v kb="$1" 'BEGIN {
+            if (kb >= 1048576) printf "%.1fG", kb / 1048576
+            else if (kb >= 1024) printf "%.0fM", kb / 1024
+            else printf "%dK", kb
+        }'
+    fi
+}
+
+# status is cached in the git directory and invalidated by TTL or any change of the worktree list
+cacheTtl="${WORKTREE_STATUS_CACHE_TTL:-0}"
+cacheFile="$(git rev-parse --git-common-dir)/worktree_status_cache"
+worktreeListChecksum=$(printf "%s" "$worktreeListPorcelain" | cksum | awk '{print $1}')
+statusLines=""
+
+if [ -z "$refresh" ] && [ "$cacheTtl" -gt 0 ] && [ -r "$cacheFile" ]
 then
-    printf "\n"
-else
-    printf "There are no worktrees\n"
-fi
\ No newline at end of file
+    read -r cacheTime cacheChecksum < "$cacheFile"
+    if [ "$cacheChecksum" = "$worktreeListChecksum" ] && [ $(( EPOCHSECONDS - cacheTime )) -lt "$cacheTtl" ]
+    then
+        statusLines=$(tail -n +2 "$cacheFile")
+    fi
+fi
+
+if [ -z "$statusLines" ] && [ ${#worktreeBranches[@]} -gt 0 ]
+then
+    jobsLimit="${WORKTREE_STATUS_JOBS:-8}"
+    resultsDir=$(mktemp -d)
+    pids=()
+    index=0
+
+    for branch in "${worktreeBranches[@]}"; do
+        index=$((index + 1))
+
+        # wait for the oldest job when the limit is reached
+        if [ ${#pids[@]} -ge "$jobsLimit" ]; then
+            wait $pids[1]
+            shift pids
+        fi
+
+        collect_worktree_status "$branch" "$worktreePaths[$branch]" > "$resultsDir/$index" &
+        pids+=($!)
+    done
+    wait
+
+    # results are concatenated in the worktree list order
+    statusLines=$(for (( i=1; i<=index; i++ )); do cat "$resultsDir/$i"; done)
+    rm -rf "$resultsDir"
+
+    if [ "$cacheTtl" -gt 0 ]; then
+        { echo "$EPOCHSECONDS $worktreeListChecksum"; echo "$statusLines"; } >| "$cacheFile" 2>/dev/null
+    fi
+fi
+
+if [ $porcelain ]
+then
+    [ -n "$statusLines" ] && echo "$statusLines"
+    exit 0
+fi
+
+if [ -z "$statusLines" ]
+then
+    printf "\nThere are no worktrees\n"
+    exit 0
+fi
+
+branchWidth=6
+while IFS=$'\t' read -r branch worktreePath state ahead behind upstream age nodeModulesSize; do
+    [ ${#branch} -gt $branchWidth ] && branchWidth=${#branch}
+done <<< "$statusLines"
+# room for the default branch marker
+branchWidth=$((branchWidth + 1))
+
+printf "\n%-${branchWidth}s  %-5s  %-9s  %-16s  %-7s  %s\n" "BRANCH" "STATE" "AHEAD/BEH" "LAST COMMIT" "MODULES" "PATH"
+
+while IFS=$'\t' read -r branch worktreePath state ahead behind upstream age nodeModulesSize; do
+    if [ "$upstream" = "-" ]; then
+        aheadBehind="no remote"
+    else
+        aheadBehind="+$ahead/-$behind"
+    fi
+
+    # mark the default branch worktree
+    [ "$branch" = "$default_branch" ] && branch="$branch*"
+
+    printf "%-${branchWidth}s  %-5s  %-9s  %-16s  %-7s  %s\n" "$branch" "$state" "$aheadBehind" "$age" "$(format_size $nodeModulesSize)" "$worktreePath"
+done <<< "$statusLines"
+
+printf "\n"
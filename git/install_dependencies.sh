@@ -0,0 +1,227 @@
+#!/usr/bin/env zsh
+
+# install dependencies in the current worktree using a lockfile-keyed node_modules cache
+# this command should be run from the root of the worktree
+#
+# $1 - package manager (yarn if not specified)
+#
+# cache entries are keyed on the package manager and the hash of its lockfile and live next to .bare
+# (or inside .git for regular repositories). On a cache hit node_modules is populated with a
+# copy-on-write clone or a plain copy (whichever the file system supports first).
+# In monorepos the node_modules of every workspace package (packages/*/node_modules with non-hoisted
+# dependencies, .bin and pnpm links) is stored and restored together with the root one.
+# On a miss the cache is seeded from a sibling worktree with the same lockfile, and only if there
+# is none a real install is run and its node_modules is stored in the cache.
+#
+# WORKTREE_DEPS_CACHE=0            - disable the cache and always run a real install
+# WORKTREE_DEPS_CACHE_DIR          - override the cache location
+# WORKTREE_DEPS_CACHE_MAX_AGE      - days to keep entries no worktree uses anymore (default 7, 0 - evict right away)
+# WORKTREE_DEPS_CACHE_HARDLINKS=1  - hardlink node_modules when copy-on-write is not supported. Hardlinked files
+#                                    are shared with the cache and every other worktree, so a package manager
+#                                    or a tool that rewrites a file in place modifies all of them
+
+packagemanager="${1:-yarn}"
+
+if [ -n "$1" ]
+then
+    printf "\nUsing ${packagemanager} to install dependencies...\n\n"
+else
+    printf "\nPackage manager not specified, using yarn to install dependencies...\n\n"
+fi
+
+# lockfile used by the package manager, empty if the worktree has none
+get_lockfile() {
+    local candidates
+    case "$1" in
+        yarn ) candidates="yarn.lock";;
+        npm ) candidates="package-lock.json npm-shrinkwrap.json";;
+        pnpm ) candidates="pnpm-lock.yaml";;
+        bun ) candidates="bun.lock bun.lockb";;
+        * ) candidates="yarn.lock package-lock.json pnpm-lock.yaml bun.lock bun.lockb";;
+    esac
+
+    for candidate in $(echo $candidates); do
+        if [ -f "$2/$candidate" ]; then
+            echo "$candidate"
+            return 0
+        fi
+    done
+}
+
+hash_file() {
+    if command -v sha256sum >/dev/null 2>&1; then
+        sha256sum "$1" | awk '{print $1}'
+    else
+        shasum -a 256 "$1" | awk '{print $1}'
+    fi
+}
+
+# cache key of the worktree in $1, empty if it has no lockfile
+get_cache_key() {
+    local lockfile
+    lockfile=$(get_lockfile "$packagemanager" "$1")
+    [ -n "$lockfile" ] && echo "${packagemanager}-$(hash_file "$1/$lockfile")"
+}
+
+# copy directory tree $1 to $2 as cheaply as the file system allows:
+# APFS clone (macOS), reflink (btrfs/xfs), hardlinks (only if enabled), plain copy
+clone_tree() {
+    if [ "$(uname)" = "Darwin" ]; then
+        cp -cR "$1" "$2" 2>/dev/null && return 0
+        rm -rf "$2"
+    fi
+    cp -R --reflink=always "$1" "$2" 2>/dev/null && return 0
+    rm -rf "$2"
+    if [ "$WORKTREE_DEPS_CACHE_HARDLINKS" = "1" ]; then
+        cp -al "$1" "$2" 2>/dev/null && return 0
+        rm -rf "$2"
+    fi
+    cp -R "$1" "$2"
+}
+
+get_worktree_paths() {
+    git worktree list --porcelain | sed -n 's/^worktree //p'
+}
+
+# node_modules directories of the workspace packages in $1, relative to it
+# node_modules nested inside another node_modules belong to the packages installed there and are skipped
+list_workspace_node_modules() {
+    (cd "$1" && find . -path ./node_modules -prune -o -type d -name node_modules -print -prune 2>/dev/null) | sed 's|^\./||'
+}
+
+# store node_modules of the worktree $1 in the cache entry $2
+# root node_modules is moved into place last, its presence marks the entry as complete
+store_in_cache() {
+    local dir
+    mkdir -p "$2" &&
+    rm -rf "$2/node_modules.tmp" "$2/workspaces.tmp" &&
+    clone_tree "$1/node_modules" "$2/node_modules.tmp" &&
+    mkdir "$2/workspaces.tmp" || return 1
+
+    while IFS= read -r dir; do
+        mkdir -p "$2/workspaces.tmp/$(dirname "$dir")" &&
+        clone_tree "$1/$dir" "$2/workspaces.tmp/$dir" || return 1
+    done < <(list_workspace_node_modules "$1")
+
+    rm -rf "$2/node_modules" "$2/workspaces" &&
+    mv "$2/workspaces.tmp" "$2/workspaces" &&
+    mv "$2/node_modules.tmp" "$2/node_modules"
+}
+
+# populate node_modules of the current worktree and of its workspace packages from the cache entry $1
+restore_from_cache() {
+    local dir
+    clone_tree "$1/node_modules" ./node_modules || return 1
+    [ -d "$1/workspaces" ] || return 0
+
+    while IFS= read -r dir; do
+        rm -rf "./$dir"
+        mkdir -p "$(dirname "./$dir")" &&
+        clone_tree "$1/workspaces/$dir" "./$dir" || return 1
+    done < <(list_workspace_node_modules "$1/workspaces")
+}
+
+# remove cache entries that no worktree uses and that were not used for max age days
+evict_stale_entries() {
+    local maxage="${WORKTREE_DEPS_CACHE_MAX_AGE:-7}"
+    local livekeys=""
+    local worktreepath key entry
+
+    while IFS= read -r worktreepath; do
+        key=$(get_cache_key "$worktreepath")
+        [ -n "$key" ] && livekeys="$livekeys $key "
+    done < <(get_worktree_paths)
+
+    while IFS= read -r entry; do
+        [ -z "$entry" ] && continue
+        case "$livekeys" in
+            *" $(basename "$entry") "* ) continue;;
+        esac
+
+        if [ "$maxage" -eq 0 ] || [ -n "$(find "$entry" -maxdepth 0 -mtime +"$maxage")" ]; then
+            printf "Evicting stale dependency cache entry $(basename "$entry")\n"
+            rm -rf "$entry"
+        fi
+    done < <(find "$cachedir" -mindepth 1 -maxdepth 1 -type d 2>/dev/null)
+}
+
+run_install() {
+    $packagemanager install
+}
+
+lockfile=$(get_lockfile "$packagemanager" ".")
+
+if [ "$WORKTREE_DEPS_CACHE" = "0" ] || [ -z "$lockfile" ]
+then
+    run_install
+    exit $?
+fi
+
+if [ -n "$WORKTREE_DEPS_CACHE_DIR" ]
+then
+    cachedir="$WORKTREE_DEPS_CACHE_DIR"
+else
+    commondir=$(cd "$(git rev-parse --git-common-dir)" && pwd) || {
+        printf "Error: Failed to locate the git directory, installing without cache\n" >&2
+        run_install
+        exit $?
+    }
+
+    # bare repository created by clone_repo_bare.sh keeps the cache next to .bare
+    if [ "$(basename "$commondir")" = ".bare" ]; then
+        cachedir="$(dirname "$commondir")/.deps_cache"
+    else
+        cachedir="$commondir/deps_cache"
+    fi
+fi
+
+worktreedir=$(pwd)
+cachekey=$(get_cache_key "$worktreedir")
+cacheentry="$cachedir/$cachekey"
+
+# seed the cache from a sibling worktree that already has node_modules for the same lockfile
+if [ ! -d "$cacheentry/node_modules" ]
+then
+    while IFS= read -r worktreepath; do
+        [ "$worktreepath" = "$worktreedir" ] && continue
+        [ -d "$worktreepath/node_modules" ] || continue
+
+        if [ "$(get_cache_key "$worktreepath")" = "$cachekey" ]; then
+            printf "Seeding dependency cache from $worktreepath\n"
+            store_in_cache "$worktreepath" "$cacheentry" && break
+        fi
+    done < <(get_worktree_paths)
+fi
+
+if [ -d "$cacheentry/node_modules" ]
+then
+    printf "Dependency cache hit ($lockfile), linking node_modules...\n\n"
+    rm -rf ./node_modules
+
+    if restore_from_cache "$cacheentry"; then
+        touch "$cacheentry"
+        evict_stale_entries
+        exit 0
+    fi
+
+    printf "Warning: Failed to populate node_modules from cache, running a full install\n\n" >&2
+    rm -rf ./node_modules
+else
+    printf "Dependency cache miss ($lockfile), running a full install...\n\n"
+fi
+
+run_install
+installstatus=$?
+
+if [ $installstatus -eq 0 ] && [ -d ./node_modules ]
+then
+    if store_in_cache "$worktreedir" "$cacheentry"; then
+        touch "$cacheentry"
+    else
+        printf "Warning: Failed to store node_modules in the dependency cache\n" >&2
+    fi
+fi
+
+evict_stale_entries
+
+exit $installstatus
@@ -0,0 +1,59 @@
+#!/usr/bin/env zsh
+
+# keep a local bare copy of the repository $1 in the shared object store and print its path
+# clones borrow objects from it through --reference (objects/info/alternates),
+# so cloning a repository that is already in the store downloads only the missing objects
+#
+# clones made without --dissociate keep reading objects from the store, removing it breaks them.
+# That is why it lives in the data directory and not in ~/.cache, which may be wiped at any time
+#
+# GIT_SHARED_OBJECTS_DIR - location of the store (${XDG_DATA_HOME:-~/.local/share}/git-shared-objects by default)
+
+if [ -z "$1" ]
+then
+    printf "Error: Repository URL is required\n" >&2
+    exit 1
+fi
+
+storeDir="${GIT_SHARED_OBJECTS_DIR:-${XDG_DATA_HOME:-$HOME/.local/share}/git-shared-objects}"
+
+# git@github.com:org/repo.git and https://github.com/org/repo.git share the same entry
+key="${1#*://}"
+key="${key#*@}"
+key="${key/://}"
+repoPath="$storeDir/${key%.git}.git"
+
+if [ -d "$repoPath" ]
+then
+    printf "\nUpdating shared object store $repoPath...\n" >&2
+    (cd "$repoPath" && git fetch origin) >&2 || printf "Warning: Failed to update $repoPath, using the objects it already has\n" >&2
+else
+    printf "\nCreating shared object store $repoPath...\n" >&2
+
+    # the store is cloned next to its final path and moved into place in one step, so a concurrent
+    # clone of the same repository never borrows from a half-created store, and a failed run
+    # removes only the directory it created itself
+    tmpPath=
+    mkdir -p "${repoPath:h}" &&
+    tmpPath=$(mktemp -d "$repoPath.tmp.XXXXXX") &&
+    git clone --bare $1 "$tmpPath" >&2 &&
+
+    # branches are fetched without pruning and unreachable objects never expire,
+    # repositories that borrow objects from the store rely on them staying in place
+    (cd "$tmpPath" && git config remote.origin.fetch "+refs/heads/*:refs/heads/*" && git config gc.pruneExpire never) >&2 || {
+        printf "Error: Failed to create shared object store for $1\n" >&2
+        [ -n "$tmpPath" ] && rm -rf "$tmpPath"
+        exit 1
+    }
+
+    if [ -d "$repoPath" ]; then
+        # another run created the store in the meantime, its clones may already borrow from it
+        rm -rf "$tmpPath"
+    else
+        mv "$tmpPath" "$repoPath"
+        # lost the race between the check and mv, the clone was moved into the store of the other run
+        [ -d "$repoPath/${tmpPath:t}" ] && rm -rf "$repoPath/${tmpPath:t}"
+    fi
+fi
+
+echo "$repoPath"
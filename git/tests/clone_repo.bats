@@ -148,4 +148,73 @@ teardown() {
     assert_success
     assert_output --partial "Repository successfully cloned"
     assert_output --partial "You need to manually add Claude Code, Gemini CLI, Cursor and aider configs to this new project"
-}
\ No newline at end of file
+}
+
+@test "accepts every setting as an option without prompting" {
+    cd "$TEST_TEMP_DIR"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo.sh" https://github.com/test/repo.git test_repo --pm yarn --user-name testuser --user-email testuser@example.com --ide < /dev/null
+    
+    assert_success
+    refute_output --partial "Specify"
+    refute_output --partial "Type user"
+    refute_output --partial "Do you want to launch IDE"
+    
+    assert_mock_called_with "$TEST_TEMP_DIR/package_manager_calls.log" "yarn install"
+    assert_mock_called_with "$TEST_TEMP_DIR/ide_calls.log" "mock IDE launcher called"
+    cd test_repo
+    assert_git_config "user.name" "testuser"
+    assert_git_config "user.email" "testuser@example.com"
+}
+
+@test "uses defaults for settings that are not given with --yes" {
+    cd "$TEST_TEMP_DIR"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo.sh" --yes https://github.com/test/cloned_defaults.git < /dev/null
+    
+    assert_success
+    refute_output --partial "Specify"
+    refute_output --partial "Do you want to launch IDE"
+    
+    # The directory is named after the repository
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git clone https://github.com/test/cloned_defaults.git cloned_defaults"
+    assert_dir_exists "cloned_defaults"
+    assert_no_mock_calls "$TEST_TEMP_DIR/package_manager_calls.log"
+    assert_no_mock_calls "$TEST_TEMP_DIR/ide_calls.log"
+}
+
+@test "passes partial clone, depth and branch options to git clone" {
+    cd "$TEST_TEMP_DIR"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo.sh" https://github.com/test/repo.git test_repo --yes --blobless --depth 10 --branch develop < /dev/null
+    
+    assert_success
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git clone https://github.com/test/repo.git test_repo --filter=blob:none --depth 10 --branch develop"
+}
+
+@test "borrows objects from the shared object store" {
+    cd "$TEST_TEMP_DIR"
+    export GIT_SHARED_OBJECTS_DIR="$TEST_TEMP_DIR/cloned_shared"
+    store="$GIT_SHARED_OBJECTS_DIR/github.com/test/repo.git"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo.sh" git@github.com:test/repo.git test_repo --yes --shared < /dev/null
+    
+    assert_success
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git clone --bare git@github.com:test/repo.git $store"
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git clone git@github.com:test/repo.git test_repo --reference-if-able $store"
+}
+
+@test "fails on options given without a value" {
+    cd "$TEST_TEMP_DIR"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo.sh" https://github.com/test/repo.git test_repo --yes --depth < /dev/null
+    
+    assert_failure
+    assert_output --partial "Error: --depth requires a number of commits"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo.sh" https://github.com/test/repo.git test_repo --yes --branch < /dev/null
+    
+    assert_failure
+    assert_output --partial "Error: --branch requires a value"
+    assert_no_mock_calls "$TEST_TEMP_DIR/git_calls.log"
+}
@@ -555,4 +555,160 @@ EOF
     assert_output --partial 'remote = origin'
     assert_output --partial 'merge = refs/heads/develop'
     assert_output --partial 'vscode-merge-base = origin/develop'
-}
\ No newline at end of file
+}
+
+@test "accepts every setting as an option without prompting" {
+    cd "$TEST_TEMP_DIR"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo_bare.sh" https://github.com/test/repo.git test_repo --branch main --pm npm --user-name "John Doe" --user-email john@example.com < /dev/null
+    
+    assert_success
+    refute_output --partial "Specify"
+    refute_output --partial "Type user"
+    assert_output --partial "Default branch is set to: main"
+    
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git clone --bare https://github.com/test/repo.git test_repo"
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git worktree add ./test_repo-main origin/main"
+    assert_mock_called_with "$TEST_TEMP_DIR/package_manager_calls.log" "npm install"
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git config user.name John Doe"
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git config user.email john@example.com"
+}
+
+@test "uses defaults for settings that are not given with --yes" {
+    cd "$TEST_TEMP_DIR"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo_bare.sh" --yes git@github.com:test/test_defaults.git < /dev/null
+    
+    assert_success
+    refute_output --partial "Specify"
+    refute_output --partial "Type user"
+    assert_output --partial "Default branch is set to: master"
+    
+    # The directory is named after the repository
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git clone --bare git@github.com:test/test_defaults.git test_defaults"
+    assert_dir_exists "test_defaults/.bare"
+    assert_no_mock_calls "$TEST_TEMP_DIR/package_manager_calls.log"
+    refute grep -q "git config user" "$TEST_TEMP_DIR/git_calls.log"
+}
+
+@test "skips package installation with --pm none" {
+    cd "$TEST_TEMP_DIR"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo_bare.sh" https://github.com/test/repo.git test_repo --yes --pm none < /dev/null
+    
+    assert_success
+    assert_no_mock_calls "$TEST_TEMP_DIR/package_manager_calls.log"
+}
+
+@test "makes a blobless shallow clone" {
+    cd "$TEST_TEMP_DIR"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo_bare.sh" https://github.com/test/repo.git test_repo --yes --blobless --depth 1 < /dev/null
+    
+    assert_success
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git clone --bare https://github.com/test/repo.git test_repo --filter=blob:none --depth 1"
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git fetch --depth 1 origin"
+}
+
+@test "makes a treeless clone" {
+    cd "$TEST_TEMP_DIR"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo_bare.sh" https://github.com/test/repo.git test_repo --yes --treeless < /dev/null
+    
+    assert_success
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git clone --bare https://github.com/test/repo.git test_repo --filter=tree:0"
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git fetch origin"
+}
+
+@test "borrows objects from the shared object store" {
+    cd "$TEST_TEMP_DIR"
+    export GIT_SHARED_OBJECTS_DIR="$TEST_TEMP_DIR/test_shared"
+    store="$GIT_SHARED_OBJECTS_DIR/github.com/test/repo.git"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo_bare.sh" https://github.com/test/repo.git test_repo --yes --shared < /dev/null
+    
+    assert_success
+    assert_output --partial "Creating shared object store $store"
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git clone --bare https://github.com/test/repo.git $store"
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git clone --bare https://github.com/test/repo.git test_repo --reference-if-able $store"
+    
+    # The store keeps every object its borrowers may need
+    run git -C "$store" config gc.pruneExpire
+    assert_output "never"
+}
+
+@test "keeps the shared object store in the data directory by default" {
+    cd "$TEST_TEMP_DIR"
+    unset GIT_SHARED_OBJECTS_DIR
+    export XDG_DATA_HOME="$TEST_TEMP_DIR/data"
+    
+    run "$GIT_SCRIPTS_PATH/shared_objects_repo.sh" https://github.com/test/repo.git
+    
+    assert_success
+    assert_output --partial "$TEST_TEMP_DIR/data/git-shared-objects/github.com/test/repo.git"
+}
+
+@test "updates the existing shared object store instead of cloning it again" {
+    cd "$TEST_TEMP_DIR"
+    export GIT_SHARED_OBJECTS_DIR="$TEST_TEMP_DIR/test_shared"
+    store="$GIT_SHARED_OBJECTS_DIR/github.com/test/repo.git"
+    "$GIT_SCRIPTS_PATH/shared_objects_repo.sh" https://github.com/test/repo.git
+    rm -f "$TEST_TEMP_DIR/git_calls.log"
+    
+    # ssh and https links of the same repository share the store
+    run "$GIT_SCRIPTS_PATH/clone_repo_bare.sh" git@github.com:test/repo.git test_repo --yes --shared --dissociate < /dev/null
+    
+    assert_success
+    assert_output --partial "Updating shared object store $store"
+    refute grep -q "git clone --bare git@github.com:test/repo.git $store" "$TEST_TEMP_DIR/git_calls.log"
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git clone --bare git@github.com:test/repo.git test_repo --reference-if-able $store --dissociate"
+}
+
+@test "removes only its own directory when creating the shared object store fails" {
+    cd "$TEST_TEMP_DIR"
+    export GIT_SHARED_OBJECTS_DIR="$TEST_TEMP_DIR/test_shared"
+    mkdir -p "$GIT_SHARED_OBJECTS_DIR/github.com/test"
+    echo "other" > "$GIT_SHARED_OBJECTS_DIR/github.com/test/other.txt"
+    
+    # Mock git that fails to create the store
+    cat > "$TEST_TEMP_DIR/git" << 'MOCK'
+#!/usr/bin/env bash
+echo "git $*" >> "$TEST_TEMP_DIR/git_calls.log"
+[ "$1" = "clone" ] && exit 128
+exec /usr/bin/git "$@"
+MOCK
+    chmod +x "$TEST_TEMP_DIR/git"
+    
+    run "$GIT_SCRIPTS_PATH/shared_objects_repo.sh" https://github.com/test/repo.git
+    
+    assert_failure
+    assert_output --partial "Error: Failed to create shared object store for https://github.com/test/repo.git"
+    assert_mock_called_with "$TEST_TEMP_DIR/git_calls.log" "git clone --bare https://github.com/test/repo.git $GIT_SHARED_OBJECTS_DIR/github.com/test/repo.git.tmp."
+    run ls -A "$GIT_SHARED_OBJECTS_DIR/github.com/test"
+    assert_output "other.txt"
+}
+
+@test "fails on unknown option" {
+    cd "$TEST_TEMP_DIR"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo_bare.sh" https://github.com/test/repo.git test_repo --mirror
+    
+    assert_failure
+    assert_output --partial "Error: Unknown option --mirror"
+    assert_no_mock_calls "$TEST_TEMP_DIR/git_calls.log"
+}
+
+@test "fails on options given without a value" {
+    cd "$TEST_TEMP_DIR"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo_bare.sh" https://github.com/test/repo.git test_repo --yes --depth < /dev/null
+    
+    assert_failure
+    assert_output --partial "Error: --depth requires a number of commits"
+    
+    run "$GIT_SCRIPTS_PATH/clone_repo_bare.sh" https://github.com/test/repo.git test_repo --yes --branch < /dev/null
+    
+    assert_failure
+    assert_output --partial "Error: --branch requires a value"
+    assert_no_mock_calls "$TEST_TEMP_DIR/git_calls.log"
+}
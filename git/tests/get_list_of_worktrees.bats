@@ -107,4 +107,128 @@ teardown() {
     assert_output --partial "feature/new-ui"
     assert_output --partial "fix-bug-123" 
     assert_output --partial "release-v1.0"
-}
\ No newline at end of file
+}
+
+@test "status mode shows state, path and last commit of every worktree" {
+    create_test_worktree "feature-1"
+    create_test_worktree "feature-2"
+
+    run "$GIT_SCRIPTS_PATH/get_list_of_worktrees.sh" --status
+
+    assert_success
+    assert_output --partial "BRANCH"
+    assert_output --regexp "feature-1 +clean"
+    assert_output --regexp "feature-2 +clean"
+    assert_output --partial "ago"
+    assert_output --partial "$TEST_TEMP_DIR/feature-1"
+}
+
+@test "status mode includes and marks the default branch worktree" {
+    create_test_worktree "feature-1"
+
+    run "$GIT_SCRIPTS_PATH/get_list_of_worktrees.sh" --status
+
+    assert_success
+    assert_output --regexp "master\* +clean"
+}
+
+@test "status mode detects dirty worktrees" {
+    create_test_worktree "feature-dirty"
+    echo "uncommitted" > "$TEST_TEMP_DIR/feature-dirty/dirty.txt"
+
+    run "$GIT_SCRIPTS_PATH/get_list_of_worktrees.sh" --status --refresh
+
+    assert_success
+    assert_output --regexp "feature-dirty +dirty"
+}
+
+@test "status mode reports ahead and behind counts against upstream" {
+    create_test_worktree "feature-tracked"
+    cd "$TEST_TEMP_DIR/feature-tracked"
+    git push -u origin feature-tracked
+    echo "local change" > local.txt
+    git add local.txt
+    git commit -m "Local commit"
+    cd "$TEST_REPO_DIR"
+
+    run "$GIT_SCRIPTS_PATH/get_list_of_worktrees.sh" --status --porcelain
+
+    assert_success
+    assert_output --regexp "feature-tracked	[^	]+	clean	1	0	origin/feature-tracked"
+}
+
+@test "status mode reports worktrees without upstream" {
+    create_test_worktree "feature-local"
+
+    run "$GIT_SCRIPTS_PATH/get_list_of_worktrees.sh" --status
+
+    assert_success
+    assert_output --regexp "feature-local +clean +no remote"
+}
+
+@test "status mode reports node_modules size" {
+    create_test_worktree "feature-deps"
+    mkdir -p "$TEST_TEMP_DIR/feature-deps/node_modules/pkg"
+    head -c 2097152 /dev/zero > "$TEST_TEMP_DIR/feature-deps/node_modules/pkg/index.js"
+
+    run "$GIT_SCRIPTS_PATH/get_list_of_worktrees.sh" --status --porcelain
+
+    assert_success
+    local size_kb
+    size_kb=$(echo "$output" | grep "^feature-deps" | cut -f8)
+    [ "$size_kb" -ge 2048 ]
+}
+
+@test "status is not cached by default" {
+    create_test_worktree "feature-1"
+
+    run "$GIT_SCRIPTS_PATH/get_list_of_worktrees.sh" --status
+    assert_success
+    assert_file_not_exists "$TEST_REPO_DIR/.git/worktree_status_cache"
+
+    echo "uncommitted" > "$TEST_TEMP_DIR/feature-1/dirty.txt"
+
+    run "$GIT_SCRIPTS_PATH/get_list_of_worktrees.sh" --status
+    assert_output --regexp "feature-1 +dirty"
+}
+
+@test "status is served from cache until the worktree list changes" {
+    create_test_worktree "feature-1"
+    export WORKTREE_STATUS_CACHE_TTL=10
+
+    run "$GIT_SCRIPTS_PATH/get_list_of_worktrees.sh" --status
+    assert_success
+    assert_file_exists "$TEST_REPO_DIR/.git/worktree_status_cache"
+
+    # Change that is not visible to the cache while it is fresh
+    echo "uncommitted" > "$TEST_TEMP_DIR/feature-1/dirty.txt"
+
+    run "$GIT_SCRIPTS_PATH/get_list_of_worktrees.sh" --status
+    assert_output --regexp "feature-1 +clean"
+
+    run "$GIT_SCRIPTS_PATH/get_list_of_worktrees.sh" --status --refresh
+    assert_output --regexp "feature-1 +dirty"
+
+    # Adding a worktree invalidates the cache
+    create_test_worktree "feature-2"
+    run "$GIT_SCRIPTS_PATH/get_list_of_worktrees.sh" --status
+    assert_output --partial "feature-2"
+}
+
+@test "status mode gathers status of many worktrees with limited jobs" {
+    for i in 1 2 3 4 5; do
+        create_test_worktree "feature-$i"
+    done
+
+    run bash -c "WORKTREE_STATUS_JOBS=2 $GIT_SCRIPTS_PATH/get_list_of_worktrees.sh --status --porcelain"
+
+    assert_success
+    assert_equal "$(echo "$output" | grep -c '^feature-')" "5"
+}
+
+@test "rejects unknown options" {
+    run "$GIT_SCRIPTS_PATH/get_list_of_worktrees.sh" --unknown
+
+    assert_failure
+    assert_output --partial "Unknown option --unknown"
+}
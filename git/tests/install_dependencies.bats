@@ -0,0 +1,227 @@
+#!/usr/bin/env bats
+
+load test_helper
+
+setup() {
+    create_test_repo
+    setup_test_environment
+    setup_all_mocks
+    create_test_env_files "$TEST_REPO_DIR/.."
+
+    # Commit a lockfile so every worktree gets one
+    cd "$TEST_REPO_DIR"
+    echo "lodash@4.17.21" > yarn.lock
+    git add yarn.lock
+    git commit -m "Add lockfile"
+
+    # Mock yarn that produces node_modules like a real install
+    cat > "$TEST_TEMP_DIR/yarn" << 'EOF'
+#!/usr/bin/env bash
+echo "yarn $@" >> "$TEST_TEMP_DIR/package_manager_calls.log"
+mkdir -p node_modules/lodash
+echo "module.exports = {}" > node_modules/lodash/index.js
+exit 0
+EOF
+    chmod +x "$TEST_TEMP_DIR/yarn"
+}
+
+teardown() {
+    teardown_test_repo
+}
+
+count_installs() {
+    if [ -f "$TEST_TEMP_DIR/package_manager_calls.log" ]; then
+        grep -c "install" "$TEST_TEMP_DIR/package_manager_calls.log"
+    else
+        echo 0
+    fi
+}
+
+@test "runs a full install on cache miss and stores node_modules in the cache" {
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh first-tree"
+
+    assert_success
+    assert_output --partial "Dependency cache miss"
+    assert_equal "$(count_installs)" "1"
+
+    assert_file_exists "$TEST_REPO_DIR/../first-tree/node_modules/lodash/index.js"
+
+    run bash -c "ls $TEST_REPO_DIR/.git/deps_cache"
+    assert_output --partial "yarn-"
+}
+
+@test "populates node_modules from cache on hit without installing" {
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh first-tree"
+    assert_success
+
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh second-tree"
+
+    assert_success
+    assert_output --partial "Dependency cache hit"
+
+    # Only the first worktree paid for a real install
+    assert_equal "$(count_installs)" "1"
+    assert_file_exists "$TEST_REPO_DIR/../second-tree/node_modules/lodash/index.js"
+}
+
+@test "restores node_modules of workspace packages on cache hit" {
+    # Mock yarn that installs a workspace package with its own non-hoisted dependencies
+    cat > "$TEST_TEMP_DIR/yarn" << 'EOF'
+#!/usr/bin/env bash
+echo "yarn $@" >> "$TEST_TEMP_DIR/package_manager_calls.log"
+mkdir -p node_modules/lodash packages/a/node_modules/react/node_modules/scheduler packages/a/node_modules/.bin
+echo "module.exports = {}" > node_modules/lodash/index.js
+echo "module.exports = {}" > packages/a/node_modules/react/index.js
+echo "module.exports = {}" > packages/a/node_modules/react/node_modules/scheduler/index.js
+echo "#!/bin/sh" > packages/a/node_modules/.bin/react-scripts
+exit 0
+EOF
+    chmod +x "$TEST_TEMP_DIR/yarn"
+
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh first-tree"
+    assert_success
+
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh second-tree"
+
+    assert_success
+    assert_output --partial "Dependency cache hit"
+    assert_equal "$(count_installs)" "1"
+    assert_file_exists "$TEST_REPO_DIR/../second-tree/node_modules/lodash/index.js"
+    assert_file_exists "$TEST_REPO_DIR/../second-tree/packages/a/node_modules/react/index.js"
+    assert_file_exists "$TEST_REPO_DIR/../second-tree/packages/a/node_modules/react/node_modules/scheduler/index.js"
+    assert_file_exists "$TEST_REPO_DIR/../second-tree/packages/a/node_modules/.bin/react-scripts"
+}
+
+@test "copies node_modules instead of hardlinking by default" {
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh first-tree"
+    assert_success
+
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh second-tree"
+    assert_success
+
+    # Rewriting a file in one worktree must not leak into the cache or the other worktree
+    echo "patched" > "$TEST_REPO_DIR/../second-tree/node_modules/lodash/index.js"
+
+    run cat "$TEST_REPO_DIR/../first-tree/node_modules/lodash/index.js"
+    assert_output "module.exports = {}"
+    run bash -c "cat $TEST_REPO_DIR/.git/deps_cache/*/node_modules/lodash/index.js"
+    assert_output "module.exports = {}"
+}
+
+@test "seeds cache from sibling worktree with the same lockfile" {
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh first-tree"
+    assert_success
+
+    rm -rf "$TEST_REPO_DIR/.git/deps_cache"
+
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh second-tree"
+
+    assert_success
+    assert_output --partial "Seeding dependency cache"
+    assert_output --partial "Dependency cache hit"
+    assert_equal "$(count_installs)" "1"
+}
+
+@test "misses cache when lockfile changes" {
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh first-tree"
+    assert_success
+
+    cd "$TEST_REPO_DIR"
+    echo "react@18.2.0" >> yarn.lock
+    git commit -am "Update lockfile"
+
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh second-tree"
+
+    assert_success
+    assert_output --partial "Dependency cache miss"
+    assert_equal "$(count_installs)" "2"
+}
+
+@test "cache is keyed on package manager" {
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh first-tree"
+    assert_success
+
+    # npm has no package-lock.json in this repo, so it installs without cache
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh second-tree npm"
+
+    assert_success
+    assert_mock_called_with "$TEST_TEMP_DIR/package_manager_calls.log" "npm install"
+    refute_output --partial "Dependency cache hit"
+}
+
+@test "evicts cache entries for lockfiles no worktree uses" {
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh first-tree"
+    assert_success
+
+    local stale_entry
+    stale_entry=$(ls "$TEST_REPO_DIR/.git/deps_cache")
+
+    # Move every worktree to a new lockfile so the old entry is no longer referenced
+    cd "$TEST_REPO_DIR"
+    echo "react@18.2.0" >> yarn.lock
+    git commit -am "Update lockfile"
+    cp yarn.lock "$TEST_REPO_DIR/../first-tree/yarn.lock"
+
+    run bash -c "cd $TEST_REPO_DIR && WORKTREE_DEPS_CACHE_MAX_AGE=0 $GIT_SCRIPTS_PATH/worktree_add.sh second-tree"
+
+    assert_success
+    assert_output --partial "Evicting stale dependency cache entry $stale_entry"
+    assert_dir_not_exists "$TEST_REPO_DIR/.git/deps_cache/$stale_entry"
+}
+
+@test "keeps unused cache entries younger than max age" {
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh first-tree"
+    assert_success
+
+    local entry
+    entry=$(ls "$TEST_REPO_DIR/.git/deps_cache")
+
+    cd "$TEST_REPO_DIR"
+    echo "react@18.2.0" >> yarn.lock
+    git commit -am "Update lockfile"
+    cp yarn.lock "$TEST_REPO_DIR/../first-tree/yarn.lock"
+
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh second-tree"
+
+    assert_success
+    assert_dir_exists "$TEST_REPO_DIR/.git/deps_cache/$entry"
+}
+
+@test "always installs when cache is disabled" {
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh first-tree"
+    assert_success
+
+    run bash -c "cd $TEST_REPO_DIR && WORKTREE_DEPS_CACHE=0 $GIT_SCRIPTS_PATH/worktree_add.sh second-tree"
+
+    assert_success
+    refute_output --partial "Dependency cache"
+    assert_equal "$(count_installs)" "2"
+}
+
+@test "cache hit is faster than a full install" {
+    # Make the real install noticeably slow
+    cat > "$TEST_TEMP_DIR/yarn" << 'EOF'
+#!/usr/bin/env bash
+echo "yarn $@" >> "$TEST_TEMP_DIR/package_manager_calls.log"
+sleep 2
+mkdir -p node_modules/lodash
+echo "module.exports = {}" > node_modules/lodash/index.js
+exit 0
+EOF
+    chmod +x "$TEST_TEMP_DIR/yarn"
+
+    local start miss_seconds hit_seconds
+
+    start=$SECONDS
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh first-tree"
+    miss_seconds=$((SECONDS - start))
+    assert_success
+
+    start=$SECONDS
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_add.sh second-tree"
+    hit_seconds=$((SECONDS - start))
+    assert_success
+
+    echo "miss: ${miss_seconds}s, hit: ${hit_seconds}s"
+    [ "$hit_seconds" -lt "$miss_seconds" ]
+}
@@ -65,7 +65,7 @@ teardown() {
     assert_output --partial "Error. No ref with such index found"
 }
 
-@test "cleans worktree before deletion" {
+@test "deletes dirty worktree without cleaning it first" {
     create_test_worktree "feature-to-clean"
     
     # Add some changes to the worktree
@@ -74,14 +74,16 @@ teardown() {
     git add dirty.txt
     cd "$TEST_REPO_DIR"
     
-    # The script should attempt to clean the worktree
+    # The worktree is moved away as is, there is no point in cleaning a tree that is about to be removed
     run bash -c "cd $TEST_REPO_DIR && echo '1' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
     
     # Complex to test fully, but verify the script runs
     [ $status -eq 0 ] || [ $status -eq 1 ]
     
     if [ $status -eq 0 ]; then
-        assert_output --partial "Cleaning feature-to-clean branch before deletion..."
+        refute_output --partial "Cleaning feature-to-clean branch before deletion..."
+        assert_output --partial "Deleting feature-to-clean branch and worktree..."
+        assert_worktree_not_exists "feature-to-clean"
     fi
 }
 
@@ -144,7 +146,7 @@ EOF
     
     # Verify it shows the deletion process (if successful)
     if [ $status -eq 0 ]; then
-        assert_output --partial "Cleaning feature-deletion-steps branch before deletion..."
+        assert_output --partial "Removing files of 1 worktree(s) in background..."
         assert_output --partial "Deleting feature-deletion-steps branch and worktree..."
     fi
 }
@@ -159,4 +161,278 @@ EOF
     # Should not show master branch in deletion list
     run bash -c "echo '$output' | grep '\\[.*\\] master' || true"
     assert_output ""
-}
\ No newline at end of file
+}
+
+@test "deletes several worktrees by indexes in one run" {
+    create_test_worktree "feature-1"
+    create_test_worktree "feature-2"
+    create_test_worktree "feature-3"
+
+    run bash -c "cd $TEST_REPO_DIR && echo '1 3' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
+
+    assert_success
+    assert_output --partial "Deleting feature-1 branch and worktree..."
+    assert_output --partial "Deleting feature-3 branch and worktree..."
+    assert_output --partial "Removing files of 2 worktree(s) in background..."
+
+    cd "$TEST_REPO_DIR"
+    assert_worktree_not_exists "feature-1"
+    assert_worktree_exists "feature-2"
+    assert_worktree_not_exists "feature-3"
+    assert_branch_not_exists "feature-1"
+    assert_branch_exists "feature-2"
+    assert_branch_not_exists "feature-3"
+}
+
+@test "accepts comma separated indexes and ranges" {
+    create_test_worktree "feature-1"
+    create_test_worktree "feature-2"
+    create_test_worktree "feature-3"
+    create_test_worktree "feature-4"
+
+    run bash -c "cd $TEST_REPO_DIR && echo '1,3-4' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
+
+    assert_success
+
+    cd "$TEST_REPO_DIR"
+    assert_worktree_not_exists "feature-1"
+    assert_worktree_exists "feature-2"
+    assert_worktree_not_exists "feature-3"
+    assert_worktree_not_exists "feature-4"
+}
+
+@test "accepts selection as arguments without prompting" {
+    create_test_worktree "feature-1"
+    create_test_worktree "feature-2"
+
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_delete.sh 1-2 < /dev/null"
+
+    assert_success
+    refute_output --partial "Enter indexes"
+
+    cd "$TEST_REPO_DIR"
+    assert_worktree_not_exists "feature-1"
+    assert_worktree_not_exists "feature-2"
+}
+
+# Create a worktree whose branch has a commit that is merged into master and origin/master
+create_merged_worktree() {
+    create_test_worktree "$1"
+    cd "$TEST_REPO_DIR"
+    git merge --no-ff "$1" -m "Merge $1"
+    git update-ref refs/remotes/origin/master master
+}
+
+@test "deletes all worktrees with merged branches after confirmation" {
+    create_test_worktree "feature-unmerged"
+    create_merged_worktree "feature-merged"
+
+    run bash -c "cd $TEST_REPO_DIR && printf 'merged\ny\n' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
+
+    assert_success
+    assert_output --partial "Worktrees to delete:"
+    assert_output --partial "Delete these worktrees and their branches? [y/N]"
+    assert_output --partial "Deleting feature-merged branch and worktree..."
+    refute_output --partial "Deleting feature-unmerged branch and worktree..."
+
+    cd "$TEST_REPO_DIR"
+    assert_worktree_not_exists "feature-merged"
+    assert_worktree_exists "feature-unmerged"
+}
+
+@test "keeps fresh branch without commits of its own when deleting merged" {
+    create_merged_worktree "feature-merged"
+
+    # Branch just created from master, like gta does, has no commits yet
+    cd "$TEST_REPO_DIR"
+    git worktree add -b "feature-fresh" "../feature-fresh"
+
+    run bash -c "cd $TEST_REPO_DIR && printf 'merged\ny\n' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
+
+    assert_success
+    assert_output --partial "Skipping feature-fresh: no commits of its own yet"
+    refute_output --partial "Deleting feature-fresh branch and worktree..."
+    assert_output --partial "Deleting feature-merged branch and worktree..."
+
+    cd "$TEST_REPO_DIR"
+    assert_worktree_exists "feature-fresh"
+}
+
+@test "keeps merged worktree with uncommitted changes" {
+    create_merged_worktree "feature-dirty"
+    echo "work in progress" > "$TEST_REPO_DIR/../feature-dirty/wip.txt"
+
+    run bash -c "cd $TEST_REPO_DIR && printf 'merged\ny\n' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
+
+    assert_success
+    assert_output --partial "Skipping feature-dirty: worktree has uncommitted changes"
+    assert_output --partial "Nothing to delete"
+
+    cd "$TEST_REPO_DIR"
+    assert_worktree_exists "feature-dirty"
+    assert_file_exists "$TEST_REPO_DIR/../feature-dirty/wip.txt"
+}
+
+@test "does not delete merged worktrees when confirmation is declined" {
+    create_merged_worktree "feature-merged"
+
+    run bash -c "cd $TEST_REPO_DIR && echo 'merged' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
+
+    assert_success
+    assert_output --partial "[1] feature-merged"
+    assert_output --partial "Cancelled."
+    refute_output --partial "Deleting feature-merged branch and worktree..."
+
+    cd "$TEST_REPO_DIR"
+    assert_worktree_exists "feature-merged"
+}
+
+@test "deletes merged worktrees without confirmation with --yes" {
+    create_merged_worktree "feature-merged"
+
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_delete.sh --yes --no-pull merged < /dev/null"
+
+    assert_success
+    refute_output --partial "Delete these worktrees and their branches?"
+    assert_output --partial "Deleting feature-merged branch and worktree..."
+
+    cd "$TEST_REPO_DIR"
+    assert_worktree_not_exists "feature-merged"
+}
+
+@test "pulls default branch once for several deleted worktrees" {
+    create_test_worktree "feature-1"
+    create_test_worktree "feature-2"
+
+    run bash -c "cd $TEST_REPO_DIR && echo '1-2' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
+
+    assert_success
+    assert_equal "$(grep -c 'git pull' "$TEST_TEMP_DIR/git_calls.log")" "1"
+    assert_output --regexp "(master|main) branch updated"
+}
+
+@test "updates default branch in background with --background-pull" {
+    create_test_worktree "feature-1"
+
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_delete.sh --background-pull 1"
+
+    assert_success
+    assert_output --regexp "Updating (master|main) branch in background"
+    refute_output --regexp "(master|main) branch updated"
+}
+
+@test "does not pull with --no-pull" {
+    create_test_worktree "feature-1"
+
+    run bash -c "cd $TEST_REPO_DIR && $GIT_SCRIPTS_PATH/worktree_delete.sh --no-pull 1"
+
+    assert_success
+    run bash -c "grep 'git pull' '$TEST_TEMP_DIR/git_calls.log' || true"
+    assert_output ""
+}
+
+@test "ignores duplicated indexes" {
+    create_test_worktree "feature-1"
+
+    run bash -c "cd $TEST_REPO_DIR && echo '1 1 1-1' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
+
+    assert_success
+    assert_output --partial "Removing files of 1 worktree(s) in background..."
+}
+
+@test "skips invalid entries and deletes the valid ones" {
+    create_test_worktree "feature-1"
+
+    run bash -c "cd $TEST_REPO_DIR && echo '99 abc 1' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
+
+    assert_success
+    assert_output --partial "Error. No ref with such index found"
+    assert_output --partial "Error. Invalid selection: abc"
+
+    cd "$TEST_REPO_DIR"
+    assert_worktree_not_exists "feature-1"
+}
+
+@test "reports reversed range as invalid selection" {
+    create_test_worktree "feature-1"
+    create_test_worktree "feature-2"
+
+    run bash -c "cd $TEST_REPO_DIR && echo '2-1' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
+
+    assert_success
+    assert_output --partial "Error. Invalid selection: 2-1"
+    assert_output --partial "Nothing to delete"
+    assert_worktree_exists "feature-1"
+    assert_worktree_exists "feature-2"
+}
+
+@test "skips locked worktrees" {
+    create_test_worktree "feature-locked"
+    cd "$TEST_REPO_DIR"
+    git worktree lock "../feature-locked"
+
+    run bash -c "cd $TEST_REPO_DIR && echo '1' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
+
+    assert_success
+    assert_output --partial "Worktree feature-locked is locked"
+    assert_worktree_exists "feature-locked"
+}
+
+@test "removes worktree files in background" {
+    create_test_worktree "feature-1"
+
+    run bash -c "cd $TEST_REPO_DIR && echo '1' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
+
+    assert_success
+    assert_dir_not_exists "$TEST_REPO_DIR/../feature-1"
+
+    # Wait for the background removal to finish
+    for i in $(seq 1 50); do
+        [ -z "$(ls -d "$TEST_REPO_DIR"/../.deleted_worktree.* 2>/dev/null)" ] && break
+        sleep 0.1
+    done
+    run bash -c "ls -d '$TEST_REPO_DIR'/../.deleted_worktree.* 2>/dev/null || true"
+    assert_output ""
+}
+
+@test "removes leftovers of an interrupted background removal" {
+    create_test_worktree "feature-1"
+    mkdir -p "$TEST_REPO_DIR/../.deleted_worktree.abc123/feature-old/src"
+    echo "old" > "$TEST_REPO_DIR/../.deleted_worktree.abc123/feature-old/src/index.js"
+
+    run bash -c "cd $TEST_REPO_DIR && echo '' | $GIT_SCRIPTS_PATH/worktree_delete.sh"
+
+    assert_success
+
+    # Wait for the background removal to finish
+    for i in $(seq 1 50); do
+        [ -d "$TEST_REPO_DIR/../.deleted_worktree.abc123" ] || break
+        sleep 0.1
+    done
+    assert_dir_not_exists "$TEST_REPO_DIR/../.deleted_worktree.abc123"
+    assert_worktree_exists "feature-1"
+}
+
+@test "shows worktree status in the list with --status" {
+    create_test_worktree "feature-1"
+    echo "uncommitted" > "$TEST_REPO_DIR/../feature-1/dirty.txt"
+
+    run bash -c "cd $TEST_REPO_DIR && echo '' | $GIT_SCRIPTS_PATH/worktree_delete.sh --status"
+
+    assert_success
+    assert_output --partial "[1] feature-1 (dirty, no remote,"
+}
+
+@test "shows fresh status with --status even when the status cache is enabled" {
+    create_test_worktree "feature-1"
+
+    # Cache a clean status, then make the worktree dirty
+    run bash -c "cd $TEST_REPO_DIR && WORKTREE_STATUS_CACHE_TTL=60 $GIT_SCRIPTS_PATH/get_list_of_worktrees.sh --status"
+    assert_success
+    echo "uncommitted" > "$TEST_REPO_DIR/../feature-1/dirty.txt"
+
+    run bash -c "cd $TEST_REPO_DIR && echo '' | WORKTREE_STATUS_CACHE_TTL=60 $GIT_SCRIPTS_PATH/worktree_delete.sh --status"
+
+    assert_success
+    assert_output --partial "[1] feature-1 (dirty, no remote,"
+}
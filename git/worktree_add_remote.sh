@@ -3,6 +3,8 @@
 # run fetch and create worktree from already existing branch
 # this command should be run from the repository root, not from the master
 
+DIRNAME=$(dirname "$0")
+
 git fetch || {
     printf "Error: Failed to fetch from remote repository\n" >&2
     exit 1
@@ -31,14 +33,7 @@ cd "$1" || {
     exit 1
 }
 
-if [ -n "$2" ]
-then
-    printf "\nUsing ${2} to install dependencies...\n\n"
-    $2 install
-else
-    printf "\nPackage manager not specified, using yarn to install dependencies...\n\n"
-    yarn install;
-fi
+$DIRNAME/install_dependencies.sh $2
 
 [ -f ../.env.auth ] && cp ../.env.auth ./.env.auth
 [ -f ../.env.local ] && cp ../.env.local ./.env.local
@@ -47,5 +42,4 @@ fi
 [ -d ../.mcp_configs ] && cp -R ../.mcp_configs ./.mcp_configs
 [ -f ../.aider.conf.yml ] && cp -a ../.aider.conf.yml ./
 
-DIRNAME=$(dirname "$0")
 $DIRNAME/../ide/launch_current_ide_in_pwd.sh
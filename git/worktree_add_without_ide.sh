@@ -4,17 +4,12 @@
 # this command should be run from the branch you want to create a worktree from
 # this command does not launch IDE after creating the worktree
 
+DIRNAME=$(dirname "$0")
+
 git worktree add ../$1 &&
 cd ../$1 &&
 
-if [ -n "$2" ]
-then
-    printf "\nUsing ${2} to install dependencies...\n\n"
-    $2 install
-else
-    printf "\nPackage manager not specified, using yarn to install dependencies...\n\n"
-    yarn install
-fi
+$DIRNAME/install_dependencies.sh $2
 
 [ -f ../.env.auth ] && cp ../.env.auth ./.env.auth
 [ -f ../.env.local ] && cp ../.env.local ./.env.local
@@ -1,8 +1,42 @@
 #!/usr/bin/env zsh
 
 # show list of current worktrees with indexes and let user
-# enter an index to delete worktree and corresponding branch
-# then delete worktree and branch, then update master branch
+# enter one or several indexes to delete worktrees and corresponding branches
+# then delete worktrees and branches, then update master branch once
+#
+# selection can be typed in the prompt or passed as arguments:
+#   3               - single index
+#   1 4 7 or 1,4,7  - several indexes
+#   2-5             - range of indexes
+#   merged          - all clean worktrees whose branches are merged into the default branch,
+#                     branches without commits of their own (at the tip of the default branch) are kept,
+#                     the resolved list is shown and has to be confirmed
+#
+# options:
+#   --status           - show state, ahead/behind and last commit age of every worktree in the list
+#   -y, --yes          - delete worktrees resolved from merged without asking for confirmation
+#   --no-pull          - don't update the default branch after deletion
+#   --background-pull  - update the default branch in background, output goes to worktree_delete_pull.log in the git directory
+#
+# worktrees are renamed away and their files are removed in background,
+# so the prompt returns as soon as git metadata and branches are updated.
+# Leftovers of a background removal that was interrupted (logout, reboot) are removed on the next run
+
+DIRNAME=$(dirname "$0")
+pullMode="sync"
+showStatus=
+assumeYes=
+selectionArgs=()
+
+for arg in "$@"; do
+    case "$arg" in
+        --status ) showStatus=true;;
+        -y|--yes ) assumeYes=true;;
+        --no-pull ) pullMode="none";;
+        --background-pull ) pullMode="background";;
+        * ) selectionArgs+=("$arg");;
+    esac
+done
 
 # Detect the default branch from the remote HEAD
 default_branch=$(git symbolic-ref refs/remotes/origin/HEAD 2>/dev/null | sed 's|refs/remotes/origin/||')
@@ -11,67 +45,245 @@ if [ -z "$default_branch" ]; then
     default_branch=$(git symbolic-ref refs/remotes/origin/HEAD 2>/dev/null | sed 's|refs/remotes/origin/||')
 fi
 
-# git worktree list returns a string
-worktreeListString=$(git worktree list)
+# map of branch name to worktree path and set of locked worktree paths, built from a single porcelain call
+typeset -A worktreePaths
+typeset -A lockedPaths
+typeset -aU worktreeParentDirs
+currentPath=""
+while IFS= read -r line; do
+    case "$line" in
+        "worktree "* )
+            currentPath="${line#worktree }"
+            worktreeParentDirs+=("${currentPath:h}")
+            ;;
+        "branch refs/heads/"* ) worktreePaths[${line#branch refs/heads/}]="$currentPath";;
+        "locked"* ) lockedPaths[$currentPath]=1;;
+    esac
+done < <(git worktree list --porcelain)
+
+# renamed worktrees whose background removal never finished stay next to the other worktrees
+staleTrashDirs=()
+for parentDir in "${worktreeParentDirs[@]}"; do
+    staleTrashDirs+=("$parentDir"/.deleted_worktree.*(N/))
+done
+
+if [ ${#staleTrashDirs[@]} -gt 0 ]
+then
+    nohup rm -rf "${staleTrashDirs[@]}" >/dev/null 2>&1 &!
+fi
+
+# status of every worktree comes from the get_list_of_worktrees.sh dashboard data, never from its cache,
+# a stale "clean" right before deleting would hide uncommitted work
+typeset -A worktreeStatus
+if [ $showStatus ]; then
+    while IFS=$'\t' read -r branch worktreePath state ahead behind upstream age nodeModulesSize; do
+        [ -z "$branch" ] && continue
+        if [ "$upstream" = "-" ]; then
+            worktreeStatus[$branch]="$state, no remote, $age"
+        else
+            worktreeStatus[$branch]="$state, +$ahead/-$behind, $age"
+        fi
+    done < <($DIRNAME/get_list_of_worktrees.sh --status --refresh --porcelain)
+fi
 
 # git for-each-ref returns an array of all the refs, then we filter out the default branch
 refArray=($(git for-each-ref  --format="%(refname:short)" refs/heads/ | grep -v "^${default_branch}$"))
 refArrayLength=${#refArray[@]}
 
-worktreeArray=()
-
 printf "\nList fo worktrees:\n\n"
 
 # in bash array starts from 0 idx, but in zsh they start from 1
 for (( i=1; i<=${refArrayLength}; i++ ));
 do
-    # we display only refs with names present in the worktree list string
-    if [[ $worktreeListString == *"[$refArray[i]]"* ]]
+    ref="$refArray[i]"
+
+    # we display only refs that have a worktree
+    if (( ${+worktreePaths[$ref]} ))
     then
-        worktreeArray+=("$refArray[i]")
-        printf "[$i] $refArray[i]\n"
+        if (( ${+worktreeStatus[$ref]} )); then
+            printf "[$i] $ref (${worktreeStatus[$ref]})\n"
+        else
+            printf "[$i] $ref\n"
+        fi
     fi
 done
-printf "\n\nEnter index of the tree to delete it or press enter to cancel:\n\n"
 
-read -r treeIndex
+if [ ${#selectionArgs[@]} -gt 0 ]
+then
+    selection="${selectionArgs[*]}"
+else
+    printf "\n\nEnter indexes of the trees to delete (e.g. 1 3 5-7, or merged) or press enter to cancel:\n\n"
+    read -r selection
+fi
 
-if [ -z $treeIndex ]
+if [ -z "$selection" ]
 then
+    exit 0
+fi
 
-else
-    if [ -z $refArray[$treeIndex] ]
-    then
-        printf "\nError. No ref with such index found\n\n"
+# resolve the selection into a list of indexes without duplicates, keeping the typed order
+selectedIndexes=()
+typeset -A seenIndexes
+confirmSelection=
+
+add_index() {
+    if (( ! ${+seenIndexes[$1]} )); then
+        seenIndexes[$1]=1
+        selectedIndexes+=("$1")
+    fi
+}
+
+for token in ${=selection//,/ }; do
+    if [[ "$token" =~ ^[0-9]+$ ]]; then
+        add_index "$token"
+    elif [[ "$token" =~ ^[0-9]+-[0-9]+$ ]] && [ ${token%-*} -le ${token#*-} ]; then
+        for (( i=${token%-*}; i<=${token#*-}; i++ )); do
+            add_index "$i"
+        done
+    elif [[ "$token" == "merged" || "$token" == "m" ]]; then
+        mergeTarget="$default_branch"
+        git show-ref --verify --quiet "refs/remotes/origin/$default_branch" && mergeTarget="origin/$default_branch"
+        mergeTargetTip=$(git rev-parse "$mergeTarget")
+        confirmSelection=true
+
+        typeset -A mergedTips
+        while read -r tip ref; do
+            mergedTips[$ref]="$tip"
+        done < <(git for-each-ref --merged "$mergeTarget" --format="%(objectname) %(refname:short)" refs/heads/)
+
+        for (( i=1; i<=${refArrayLength}; i++ )); do
+            ref="$refArray[i]"
+            (( ${+worktreePaths[$ref]} )) && (( ${+mergedTips[$ref]} )) || continue
+
+            # a branch at the tip of the default branch has no commits of its own yet (e.g. just created by gta)
+            if [ "${mergedTips[$ref]}" = "$mergeTargetTip" ]
+            then
+                printf "\nSkipping $ref: no commits of its own yet\n"
+                continue
+            fi
+
+            if ! changes=$(git -C "${worktreePaths[$ref]}" status --porcelain 2>/dev/null) || [ -n "$changes" ]
+            then
+                printf "\nSkipping $ref: worktree has uncommitted changes\n"
+                continue
+            fi
+
+            add_index "$i"
+        done
     else
-        if [[ $(echo ${worktreeArray[@]} | fgrep -w $refArray[$treeIndex]) ]]
+        printf "\nError. Invalid selection: $token\n"
+    fi
+done
+
+if [ ${#selectedIndexes[@]} -eq 0 ]
+then
+    printf "\nNothing to delete\n\n"
+    exit 0
+fi
+
+# worktrees resolved from merged are shown and deleted only after confirmation
+if [ $confirmSelection ]
+then
+    printf "\nWorktrees to delete:\n\n"
+    for treeIndex in "${selectedIndexes[@]}"; do
+        printf "[$treeIndex] $refArray[$treeIndex]\n"
+    done
+
+    if [ -z "$assumeYes" ]
+    then
+        printf "\nDelete these worktrees and their branches? [y/N]\n\n"
+        read -r confirmation
+        if [[ ! "$confirmation" =~ ^[Yy]$ ]]
         then
-            printf "\nCleaning $refArray[$treeIndex] branch before deletion...\n\n"
-            originalDir=$(pwd)
-            cd "$originalDir/$refArray[$treeIndex]" && git reset --hard HEAD && git clean -fd && cd "$originalDir"
-
-            printf "\nDeleting $refArray[$treeIndex] branch and worktree...\n\n"
-
-            git worktree remove $refArray[$treeIndex] &&
-            git branch -D $refArray[$treeIndex] &&
-
-            # Find the default branch worktree dynamically
-            master_worktree_info=$(git worktree list | grep -E "\[${default_branch}\]$")
-            
-            if [ -n "$master_worktree_info" ]; then
-                master_path=$(echo "$master_worktree_info" | awk '{print $1}')
-                
-                printf "\nUpdating $default_branch branch...\n\n" &&
-                cd "$master_path" && git pull && cd - &&
-                printf "\n$default_branch branch updated\n\nWorktree list:\n" &&
-            else
-                printf "\nWarning: Could not locate $default_branch worktree, skipping branch update\n\nWorktree list:\n" &&
-            fi
-            
-            DIRNAME=$(dirname "$0") &&
-            $DIRNAME/get_list_of_worktrees.sh
-        else
-            printf "\nError. No worktree with such index found\n\n"
+            printf "\nCancelled.\n\n"
+            exit 0
         fi
     fi
-fi
\ No newline at end of file
+fi
+
+currentDir=$(pwd -P)
+deletedRefs=()
+trashDirs=()
+
+for treeIndex in "${selectedIndexes[@]}"; do
+    ref="$refArray[$treeIndex]"
+
+    if [ -z "$ref" ]
+    then
+        printf "\nError. No ref with such index found\n\n"
+        continue
+    fi
+
+    if (( ! ${+worktreePaths[$ref]} ))
+    then
+        printf "\nError. No worktree with such index found\n\n"
+        continue
+    fi
+
+    worktreePath="${worktreePaths[$ref]}"
+
+    if (( ${+lockedPaths[$worktreePath]} ))
+    then
+        printf "\nError. Worktree $ref is locked, unlock it with git worktree unlock first\n\n"
+        continue
+    fi
+
+    if [[ "$currentDir/" == "${worktreePath:A}/"* ]]
+    then
+        printf "\nError. Can't delete $ref worktree while you are in it\n\n"
+        continue
+    fi
+
+    printf "\nDeleting $ref branch and worktree...\n"
+
+    # renaming is instant on the same file system, the files are removed in background later
+    trashDir=""
+    trashDir=$(mktemp -d "${worktreePath:h}/.deleted_worktree.XXXXXX") &&
+    mv "$worktreePath" "$trashDir/" || {
+        printf "Error: Failed to move worktree $worktreePath away, skipping $ref\n" >&2
+        [ -n "$trashDir" ] && rmdir "$trashDir" 2>/dev/null
+        continue
+    }
+
+    deletedRefs+=("$ref")
+    trashDirs+=("$trashDir")
+done
+
+if [ ${#deletedRefs[@]} -eq 0 ]
+then
+    exit 0
+fi
+
+# drop metadata of the moved worktrees, then delete all branches in one call
+git worktree prune &&
+git branch -D "${deletedRefs[@]}"
+
+printf "\nRemoving files of ${#trashDirs[@]} worktree(s) in background...\n"
+nohup rm -rf "${trashDirs[@]}" >/dev/null 2>&1 &!
+
+if [ "$pullMode" = "none" ]
+then
+    printf "\nWorktree list:\n"
+    $DIRNAME/get_list_of_worktrees.sh
+    exit 0
+fi
+
+# Find the default branch worktree
+master_path="${worktreePaths[$default_branch]}"
+
+if [ -z "$master_path" ]
+then
+    printf "\nWarning: Could not locate $default_branch worktree, skipping branch update\n\nWorktree list:\n"
+elif [ "$pullMode" = "background" ]
+then
+    pullLog="$(git rev-parse --git-common-dir)/worktree_delete_pull.log"
+    pullLog="${pullLog:A}"
+    printf "\nUpdating $default_branch branch in background, see $pullLog\n\nWorktree list:\n"
+    (cd "$master_path" && git pull) >| "$pullLog" 2>&1 &!
+else
+    printf "\nUpdating $default_branch branch...\n\n" &&
+    (cd "$master_path" && git pull) &&
+    printf "\n$default_branch branch updated\n\nWorktree list:\n"
+fi
+
+$DIRNAME/get_list_of_worktrees.sh
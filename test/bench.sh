@@ -0,0 +1,386 @@
+#!/usr/bin/env zsh
+
+# benchmark of the git and utility scripts against synthetic repositories and port fixtures
+# every script is timed non-interactively on each fixture size, the median of the runs is compared
+# with the baseline file, exits with 1 if a script failed or got slower than the threshold allows
+#
+# usage: bench.sh [options]
+#
+# options:
+#   --sizes LIST     - comma separated fixture sizes to run (small,medium by default)
+#   --runs N         - timed runs of every script, the median is reported (5 by default)
+#   --only LIST      - comma separated benchmarks to run (all by default):
+#                      gtl, gtl_status, gta, gtd, gbc, gbd, killport
+#   --baseline FILE  - baseline file (bench_baseline.tsv next to this script by default)
+#   --save           - write the results to the baseline file, entries that were not run are kept
+#   --threshold PCT  - allowed slowdown against the baseline in percent (25 by default)
+#   --keep           - keep the generated fixtures and print their location
+#
+# fixture sizes:   branches   worktrees   listening ports
+#   small          50         5           5
+#   medium         200        20          20
+#   large          1000       50          50
+#
+# BENCH_BASELINE  - baseline file, same as --baseline
+# BENCH_NOISE_MS  - slowdowns smaller than this number of milliseconds are never reported (20 by default)
+# BENCH_PORT_BASE - first port of the port fixtures (39100 by default), ports that are already in use are never touched
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+ROOT_DIR="$(dirname "$SCRIPT_DIR")"
+GIT_SCRIPTS="$ROOT_DIR/git"
+UTILITY_SCRIPTS="$ROOT_DIR/utility"
+
+# EPOCHREALTIME for timing, ztcp to probe the ports of the fixtures
+zmodload zsh/datetime
+zmodload zsh/net/tcp
+
+# the scripts must call the real git, lsof and kill instead of the mocks of the test suite,
+# and user or system git config must not change the results
+unset TEST_TEMP_DIR
+export GIT_CONFIG_GLOBAL=/dev/null
+export GIT_CONFIG_NOSYSTEM=1
+
+typeset -A sizeBranches sizeWorktrees sizePorts
+sizeBranches=(small 50 medium 200 large 1000)
+sizeWorktrees=(small 5 medium 20 large 50)
+sizePorts=(small 5 medium 20 large 50)
+
+allBenchmarks=(gtl gtl_status gta gtd gbc gbd killport)
+
+sizes=(small medium)
+benchmarks=("${allBenchmarks[@]}")
+runs=5
+threshold=25
+baselineFile="${BENCH_BASELINE:-$SCRIPT_DIR/bench_baseline.tsv}"
+saveBaseline=
+keepFixtures=
+noiseMs="${BENCH_NOISE_MS:-20}"
+portBase="${BENCH_PORT_BASE:-39100}"
+
+print_usage() {
+    sed -n '3,/^$/s/^# \{0,1\}//p' "$0"
+}
+
+# option $1 takes a value, $2 is the number of arguments left including the option
+require_value() {
+    if [ $2 -lt 2 ]; then
+        printf "Error: $1 requires a value\n\n" >&2
+        print_usage >&2
+        exit 1
+    fi
+}
+
+while [ $# -gt 0 ]; do
+    case "$1" in
+        --sizes ) require_value "$1" $#; sizes=(${(s:,:)2}); shift 2;;
+        --runs ) require_value "$1" $#; runs="$2"; shift 2;;
+        --only ) require_value "$1" $#; benchmarks=(${(s:,:)2}); shift 2;;
+        --baseline ) require_value "$1" $#; baselineFile="$2"; shift 2;;
+        --save ) saveBaseline=true; shift;;
+        --threshold ) require_value "$1" $#; threshold="$2"; shift 2;;
+        --keep ) keepFixtures=true; shift;;
+        -h|--help )
+            print_usage
+            exit 0
+            ;;
+        * )
+            printf "Error: Unknown option $1\n" >&2
+            exit 1
+            ;;
+    esac
+done
+
+if ! [[ "$runs" =~ ^[1-9][0-9]*$ ]] || ! [[ "$threshold" =~ ^[0-9]+$ ]] || ! [[ "$noiseMs" =~ ^[0-9]+$ ]] || ! [[ "$portBase" =~ ^[1-9][0-9]*$ ]]
+then
+    printf "Error: runs, threshold, BENCH_NOISE_MS and BENCH_PORT_BASE must be numbers\n" >&2
+    exit 1
+fi
+
+for size in "${sizes[@]}"; do
+    (( ${+sizeBranches[$size]} )) || { printf "Error: Unknown size $size, use small, medium or large\n" >&2; exit 1; }
+done
+
+for name in "${benchmarks[@]}"; do
+    (( ${allBenchmarks[(Ie)$name]} )) || { printf "Error: Unknown benchmark $name, use ${(j:, :)allBenchmarks}\n" >&2; exit 1; }
+done
+
+# current time in microseconds
+now_us() {
+    echo "${EPOCHREALTIME/[.,]/}"
+}
+
+# run the benchmarked command $2... with $1 as its input, the duration in microseconds goes to lastDuration
+time_command() {
+    local input="$1"
+    shift
+    local start=$(now_us)
+    "$@" <<< "$input" >/dev/null 2>&1
+    local exitCode=$?
+    lastDuration=$(( $(now_us) - start ))
+    return $exitCode
+}
+
+# bare origin with master and $1 feature branches, its clone in $3/repo/master with a local
+# tracking branch for every feature branch and the first $2 of them checked out in worktrees next to it
+# master has a yarn.lock and node_modules of 50 packages that warm the dependency cache in $3/deps_cache
+create_repo_fixture() {
+    local branchCount=$1 worktreeCount=$2
+    local origin="$3/origin.git"
+    local repo="$3/repo/master"
+    local name i
+
+    git init -q --bare "$origin" &&
+    git -C "$origin" symbolic-ref HEAD refs/heads/master || return 1
+
+    # a single fast-import stream creates all the commits, every feature branch has one commit on top of master
+    {
+        printf "commit refs/heads/master\nmark :1\ncommitter Bench <bench@example.com> 1700000000 +0000\ndata 7\ninitial\nM 644 inline README.md\ndata 6\nbench\n"
+        printf "M 644 inline .gitignore\ndata 13\nnode_modules\nM 644 inline yarn.lock\ndata 12\nbench@1.0.0\n\n"
+        for (( i=1; i<=branchCount; i++ )); do
+            name="feature-${(l:4::0:)i}"
+            printf "commit refs/heads/%s\ncommitter Bench <bench@example.com> 1700000000 +0000\ndata %d\n%s\nfrom :1\nM 644 inline %s.txt\ndata %d\n%s\n\n" \
+                "$name" ${#name} "$name" "$name" ${#name} "$name"
+        done
+    } | git -C "$origin" fast-import --quiet || return 1
+
+    git clone -q "$origin" "$repo" || return 1
+
+    # local branches and their upstream config are written in one go instead of a git call per branch
+    git -C "$repo" for-each-ref --format='create refs/heads/%(refname:lstrip=3) %(objectname)' 'refs/remotes/origin/feature-*' |
+    git -C "$repo" update-ref --stdin || return 1
+
+    for (( i=1; i<=branchCount; i++ )); do
+        name="feature-${(l:4::0:)i}"
+        printf '[branch "%s"]\n\tremote = origin\n\tmerge = refs/heads/%s\n' "$name" "$name"
+    done >> "$repo/.git/config"
+
+    for (( i=1; i<=worktreeCount; i++ )); do
+        git -C "$repo" worktree add -q "../wt-$i" "feature-${(l:4::0:)i}" || return 1
+    done
+
+    for (( i=1; i<=50; i++ )); do
+        mkdir -p "$repo/node_modules/package-$i" &&
+        echo "module.exports = $i" > "$repo/node_modules/package-$i/index.js" || return 1
+    done
+
+    # true as the package manager keeps node_modules as it is and stores it in the cache
+    (cd "$repo" && WORKTREE_DEPS_CACHE_DIR="$3/deps_cache" "$GIT_SCRIPTS/install_dependencies.sh" true >/dev/null) || return 1
+    local cacheEntries=("$3"/deps_cache/*/node_modules(N/))
+    [ ${#cacheEntries[@]} -gt 0 ]
+}
+
+port_is_open() {
+    ztcp 127.0.0.1 $1 2>/dev/null || return 1
+    ztcp -c $REPLY
+}
+
+# listeners on $1 ports starting at portBase, each of them with a child process like a dev server
+# the listeners are started through a subshell, so they are not our children and don't stay
+# zombies that killport would wait for
+start_port_fixture() {
+    local count=$1 port
+    local deadline=$(( $(now_us) + 5000000 ))
+
+    for (( port=portBase; port<portBase+count; port++ )); do
+        ( zsh -c 'echo $$ >| "$2"; zmodload zsh/net/tcp && ztcp -l $1 && { sleep 600 & wait }' \
+            bench-listener $port "$portFixtureDir/$port.pid" >/dev/null 2>&1 & )
+    done
+
+    for (( port=portBase; port<portBase+count; port++ )); do
+        until port_is_open $port; do
+            [ $(now_us) -gt $deadline ] && return 1
+            sleep 0.05
+        done
+    done
+}
+
+# kill whatever is left of the listeners, only processes started by start_port_fixture are touched
+stop_port_fixture() {
+    local pidFile pid
+    for pidFile in "$portFixtureDir"/*.pid(N); do
+        read -r pid < "$pidFile"
+        if [ -n "$pid" ]; then
+            pkill -9 -P "$pid" 2>/dev/null
+            kill -9 "$pid" 2>/dev/null
+        fi
+        rm -f "$pidFile"
+    done
+}
+
+# git benchmarks run in the master worktree of the fixture and restore it after every run,
+# preparation and cleanup are not timed
+
+bench_gtl() {
+    time_command "" "$GIT_SCRIPTS/get_list_of_worktrees.sh"
+}
+
+bench_gtl_status() {
+    time_command "" "$GIT_SCRIPTS/get_list_of_worktrees.sh" --status --refresh
+}
+
+bench_gta() {
+    # the cache was warmed with the lockfile of master, so git and restoring node_modules from the cache are timed
+    time_command "" "$GIT_SCRIPTS/worktree_add_without_ide.sh" bench-added true || return 1
+    git worktree remove --force ../bench-added && git branch -q -D bench-added
+}
+
+bench_gtd() {
+    # feature-0001 is the first entry of the list and is checked out in wt-1
+    time_command "" "$GIT_SCRIPTS/worktree_delete.sh" --no-pull 1 || return 1
+    git worktree add -q -b feature-0001 ../wt-1 origin/feature-0001
+}
+
+bench_gbc() {
+    # the last feature branch is the one before master in the list and has no worktree
+    time_command "$branchCount" "$GIT_SCRIPTS/branch_checkout.sh" || return 1
+    git checkout -q master
+}
+
+bench_gbd() {
+    # master is not listed, the merged zz-bench-delete branch is the last entry
+    git branch -q zz-bench-delete master || return 1
+    time_command "$(( branchCount + 1 ))" "$GIT_SCRIPTS/branch_delete.sh" || {
+        git branch -q -D zz-bench-delete 2>/dev/null
+        return 1
+    }
+}
+
+bench_killport() {
+    start_port_fixture $portCount || { stop_port_fixture; return 1; }
+    time_command "" "$UTILITY_SCRIPTS/killport.sh" "$portBase-$(( portBase + portCount - 1 ))"
+    local exitCode=$?
+    stop_port_fixture
+    return $exitCode
+}
+
+# size/benchmark -> median in milliseconds
+typeset -A baseline
+typeset -A results
+
+if [ -r "$baselineFile" ]
+then
+    while IFS=$'\t' read -r size name ms; do
+        [[ "$size" == \#* ]] || [ -z "$ms" ] && continue
+        baseline[$size/$name]="$ms"
+    done < "$baselineFile"
+fi
+
+workDir=$(mktemp -d "${TMPDIR:-/tmp}/bench.XXXXXX") || { printf "Error: Failed to create work directory\n" >&2; exit 1; }
+portFixtureDir="$workDir/ports"
+mkdir -p "$portFixtureDir"
+
+cleanup() {
+    stop_port_fixture
+    cd /
+    if [ $keepFixtures ]; then
+        printf "Fixtures are kept in $workDir\n"
+    else
+        rm -rf "$workDir" 2>/dev/null
+    fi
+}
+
+trap cleanup EXIT
+trap 'exit 130' INT TERM
+
+gitBenchmarks=(${benchmarks:#killport})
+regressions=0
+failures=0
+
+printf "Benchmarking ${(j:, :)benchmarks}, $runs runs, threshold $threshold%%\n"
+printf "Baseline: $baselineFile\n\n"
+printf "%-8s %-12s %10s %10s %8s\n" SIZE SCRIPT MEDIAN BASELINE CHANGE
+
+for size in "${sizes[@]}"; do
+    branchCount=${sizeBranches[$size]}
+    worktreeCount=${sizeWorktrees[$size]}
+    portCount=${sizePorts[$size]}
+
+    if [ ${#gitBenchmarks[@]} -gt 0 ]; then
+        create_repo_fixture $branchCount $worktreeCount "$workDir/$size" || {
+            printf "Error: Failed to create $size repository fixture\n" >&2
+            exit 1
+        }
+        cd "$workDir/$size/repo/master"
+        export WORKTREE_DEPS_CACHE_DIR="$workDir/$size/deps_cache"
+    fi
+
+    for name in "${benchmarks[@]}"; do
+        if [ "$name" = "killport" ]; then
+            busyPorts=()
+            for (( port=portBase; port<portBase+portCount; port++ )); do
+                port_is_open $port && busyPorts+=($port)
+            done
+            if [ ${#busyPorts[@]} -gt 0 ]; then
+                printf "%-8s %-12s %10s   ports ${(j:,:)busyPorts} are in use, set BENCH_PORT_BASE to free ports\n" "$size" "$name" "skipped"
+                continue
+            fi
+        fi
+
+        # the first run warms up file system caches and is not counted
+        durations=()
+        failed=
+        for (( run=0; run<=runs; run++ )); do
+            if ! bench_$name; then
+                failed=true
+                break
+            fi
+            [ $run -gt 0 ] && durations+=($lastDuration)
+        done
+
+        if [ $failed ]; then
+            results[$size/$name]="failed"
+            failures=$((failures + 1))
+            printf "%-8s %-12s %10s\n" "$size" "$name" "failed"
+            continue
+        fi
+
+        sorted=(${(on)durations})
+        middle=$(( (runs + 1) / 2 ))
+        median=$(( sorted[middle] / 1000 ))
+        results[$size/$name]=$median
+
+        previous="${baseline[$size/$name]}"
+        if [ -z "$previous" ]; then
+            printf "%-8s %-12s %8sms %10s %8s\n" "$size" "$name" "$median" "-" "-"
+            continue
+        fi
+
+        change="-"
+        [ "$previous" -gt 0 ] && change="$(( (median - previous) * 100 / previous ))%"
+        [[ "$change" == [0-9]* ]] && change="+$change"
+
+        if [ $(( median - previous )) -gt "$noiseMs" ] && [ $(( median * 100 )) -gt $(( previous * (100 + threshold) )) ]; then
+            regressions=$((regressions + 1))
+            printf "%-8s %-12s %8sms %8sms %8s  ❌ regression\n" "$size" "$name" "$median" "$previous" "$change"
+        else
+            printf "%-8s %-12s %8sms %8sms %8s\n" "$size" "$name" "$median" "$previous" "$change"
+        fi
+    done
+
+    cd "$workDir"
+done
+
+printf "\n"
+
+if [ $saveBaseline ]
+then
+    for key in "${(@k)results}"; do
+        [ "${results[$key]}" != "failed" ] && baseline[$key]="${results[$key]}"
+    done
+
+    {
+        printf "# size\tscript\tmedian ms\n"
+        for key in "${(@ko)baseline}"; do
+            printf "%s\t%s\t%s\n" "${key%%/*}" "${key#*/}" "${baseline[$key]}"
+        done
+    } >| "$baselineFile"
+    printf "Baseline saved to $baselineFile\n"
+fi
+
+if [ $failures -gt 0 ] || [ $regressions -gt 0 ]
+then
+    printf "❌ $regressions regression(s), $failures failed benchmark(s)\n"
+    exit 1
+fi
+
+printf "✅ No regressions beyond $threshold%% (noise ${noiseMs}ms)\n"
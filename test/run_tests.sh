@@ -10,10 +10,14 @@ NC='\033[0m' # No Color
 
 # Spinner animation with dynamic test statistics
 SPINNER_PID=""
+# Spinner is only drawn on an interactive terminal, CI logs get plain output
+SPINNER_ENABLED=false
+[ -t 1 ] && SPINNER_ENABLED=true
 spinner_chars="⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
 
 start_spinner() {
     local message="$1"
+    [ "$SPINNER_ENABLED" = true ] || return 0
     tput civis # Hide cursor
     (
         i=0
@@ -29,13 +33,15 @@ start_spinner() {
 start_dynamic_spinner() {
     local message="$1"
     local stats_file="$2"
+    [ "$SPINNER_ENABLED" = true ] || return 0
     tput civis # Hide cursor
     (
         i=0
         while true; do
             local stats=""
             if [ -f "$stats_file" ]; then
-                stats=$(cat "$stats_file" 2>/dev/null || echo "")
+                # builtin read instead of $(cat) to avoid forking a process on every frame
+                IFS= read -r stats < "$stats_file" 2>/dev/null
             fi
             printf "\r${CYAN}%s %s${NC}" "${spinner_chars:$i:1}" "$message"
             if [ -n "$stats" ]; then
@@ -55,6 +61,7 @@ stop_spinner() {
         wait "$SPINNER_PID" 2>/dev/null
         SPINNER_PID=""
     fi
+    [ "$SPINNER_ENABLED" = true ] || return 0
     # Clear multiple lines to handle dynamic spinner output
     printf "\r\033[K"     # Clear current line
     printf "\033[1B\033[K" # Move down and clear line
@@ -68,6 +75,11 @@ cleanup_spinner() {
     stop_spinner
     # Kill any running bats processes to prevent freeze
     pkill -f "bats.*\.bats" 2>/dev/null || true
+    # Stop parallel test file workers
+    for worker_pid in "${worker_pids[@]}"; do
+        kill "$worker_pid" 2>/dev/null
+    done
+    [ -n "$RESULTS_DIR" ] && rm -rf "$RESULTS_DIR"
     # Additional terminal cleanup for interrupt scenarios
     printf "\033[2K\r"  # Clear entire line and return to start
     printf "\033[0m"    # Reset all formatting
@@ -88,6 +100,65 @@ trap cleanup_spinner INT TERM
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 ROOT_DIR="$(dirname "$SCRIPT_DIR")"
 
+# EPOCHREALTIME is used for wall-clock timing of test files
+[ -n "$ZSH_VERSION" ] && zmodload zsh/datetime 2>/dev/null
+
+print_usage() {
+    echo "Usage: run_tests.sh [options]"
+    echo
+    echo "Options:"
+    echo "  -j, --jobs N         run up to N test files in parallel (default 1)"
+    echo "  --test-jobs N        run up to N tests of a file in parallel (default 1, bats --jobs, needs GNU parallel)"
+    echo "                       up to jobs x test-jobs bats workers run at once"
+    echo "  --slowest N          number of slowest tests to report (default 10, 0 to disable)"
+    echo "  --tap FILE           write combined results in TAP format to FILE"
+    echo "  --junit FILE         write combined results in JUnit XML format to FILE"
+    echo "  --bench [ARGS...]    run the benchmarks instead of the tests, ARGS are passed to bench.sh (see bench.sh --help)"
+    echo "  -h, --help           show this help"
+}
+
+# option $1 takes a value, $2 is the number of arguments left including the option
+require_value() {
+    if [ "$2" -lt 2 ]; then
+        echo -e "${RED}Error: $1 requires a value${NC}"
+        print_usage
+        exit 1
+    fi
+}
+
+JOBS=1
+TEST_JOBS=1
+SLOWEST_COUNT=10
+TAP_REPORT=""
+JUNIT_REPORT=""
+
+while [ $# -gt 0 ]; do
+    case "$1" in
+        -j|--jobs) require_value "$1" $#; JOBS="$2"; shift 2;;
+        --jobs=*) JOBS="${1#*=}"; shift;;
+        --test-jobs) require_value "$1" $#; TEST_JOBS="$2"; shift 2;;
+        --test-jobs=*) TEST_JOBS="${1#*=}"; shift;;
+        --slowest) require_value "$1" $#; SLOWEST_COUNT="$2"; shift 2;;
+        --slowest=*) SLOWEST_COUNT="${1#*=}"; shift;;
+        --tap) require_value "$1" $#; TAP_REPORT="$2"; shift 2;;
+        --tap=*) TAP_REPORT="${1#*=}"; shift;;
+        --junit) require_value "$1" $#; JUNIT_REPORT="$2"; shift 2;;
+        --junit=*) JUNIT_REPORT="${1#*=}"; shift;;
+        --bench) shift; exec "$SCRIPT_DIR/bench.sh" "$@";;
+        -h|--help) print_usage; exit 0;;
+        *)
+            echo -e "${RED}Error: Unknown option $1${NC}"
+            print_usage
+            exit 1
+            ;;
+    esac
+done
+
+if ! [[ "$JOBS" =~ ^[1-9][0-9]*$ ]] || ! [[ "$TEST_JOBS" =~ ^[1-9][0-9]*$ ]] || ! [[ "$SLOWEST_COUNT" =~ ^[0-9]+$ ]]; then
+    echo -e "${RED}Error: --jobs and --test-jobs must be positive numbers and --slowest a non-negative number${NC}"
+    exit 1
+fi
+
 echo -e "${CYAN}=== Bash Scripts Test Suite ===${NC}"
 echo
 
@@ -121,6 +192,179 @@ if ! command -v bats &> /dev/null; then
     exit 1
 fi
 
+# bats runs tests of a single file in parallel only with GNU parallel installed
+BATS_ARGS=(--tap --timing)
+if [ "$TEST_JOBS" -gt 1 ]; then
+    if command -v parallel &> /dev/null; then
+        BATS_ARGS+=(--jobs "$TEST_JOBS")
+    else
+        echo -e "${YELLOW}Warning: GNU parallel is not installed, individual tests will run sequentially${NC}"
+        echo "Install it with: brew install parallel"
+        echo
+    fi
+fi
+
+if [ "$JOBS" -gt 1 ]; then
+    echo -e "${CYAN}Running test files with $JOBS parallel jobs${NC}"
+    echo
+fi
+
+# Current time in microseconds
+now_us() {
+    echo "${EPOCHREALTIME/[.,]/}"
+}
+
+# Format milliseconds as seconds with two decimals
+format_ms() {
+    printf "%d.%02ds" $(( $1 / 1000 )) $(( ($1 % 1000) / 10 ))
+}
+
+# Record a single TAP result line of a test file
+# Updates the global result arrays and the per-file counters of the caller
+record_tap_line() {
+    local file_name="$1"
+    local line="$2"
+    local test_status test_name duration_ms=0
+
+    if [[ $line =~ ^ok\ [0-9]+\ (.+)$ ]]; then
+        test_status="passed"
+        test_name="${line#ok * }"
+    elif [[ $line =~ ^not\ ok\ [0-9]+\ (.+)$ ]]; then
+        test_status="failed"
+        test_name="${line#not ok * }"
+    else
+        return 1
+    fi
+
+    # bats --timing appends " in <N>ms" to every result line
+    if [[ $test_name =~ \ in\ [0-9]+ms$ ]]; then
+        duration_ms="${test_name##* in }"
+        duration_ms="${duration_ms%ms}"
+        test_name="${test_name% in *}"
+    fi
+
+    all_tests+=("$file_name: $test_name")
+    test_files+=("$file_name")
+    test_results+=("$test_status|$duration_ms|$file_name|$test_name")
+    file_test_count=$((file_test_count + 1))
+
+    if [ "$test_status" = "passed" ]; then
+        passed_tests+=("$file_name: $test_name")
+        file_passed_count=$((file_passed_count + 1))
+        dir_passed_tests=$((dir_passed_tests + 1))
+    else
+        failed_tests+=("$file_name: $test_name")
+        file_failed_count=$((file_failed_count + 1))
+        dir_failed_tests=$((dir_failed_tests + 1))
+    fi
+}
+
+# Run a single test file in the background worker, results are written next to $2
+run_test_file_worker() {
+    local test_file="$1"
+    local result_prefix="$2"
+    local start_us=$(now_us)
+
+    bats "${BATS_ARGS[@]}" "$test_file" > "$result_prefix.tap" 2>/dev/null
+    local exit_code=$?
+
+    echo $(( ($(now_us) - start_us) / 1000 )) > "$result_prefix.ms"
+    # exit file is written last, its presence marks the worker as finished
+    echo $exit_code > "$result_prefix.exit"
+}
+
+# Print the result of a finished test file and update directory counters
+report_test_file() {
+    local file_name="$1"
+    local bats_exit_code="$2"
+    local file_duration_ms="$3"
+
+    file_results+=("$bats_exit_code|$file_duration_ms|$file_name|$file_passed_count|$file_failed_count")
+
+    if [ "$bats_exit_code" -eq 0 ]; then
+        echo -e "${GREEN}✓ $file_name passed${NC} ($(format_ms $file_duration_ms))"
+    else
+        echo -e "${RED}✗ $file_name failed${NC} ($(format_ms $file_duration_ms))"
+        failed_files=$((failed_files + 1))
+    fi
+
+    total_files=$((total_files + 1))
+    total_test_count=$((total_test_count + file_test_count))
+    echo "  Individual tests: $file_test_count total, $file_passed_count passed, $file_failed_count failed"
+    echo
+}
+
+# Count finished workers of the results directory $1 into finished_count and update the stats file $3
+# Exit files are counted with a glob, so polling does not fork any process
+update_parallel_stats() {
+    local results_dir="$1"
+    local file_count="$2"
+    local stats_file="$3"
+    local exit_files=("$results_dir"/*.exit(N))
+    finished_count=${#exit_files[@]}
+    echo "Finished: $finished_count/$file_count files" > "$stats_file"
+}
+
+# Run all test files of a directory with up to $JOBS files at a time
+run_test_files_in_parallel() {
+    local test_name="$1"
+    shift
+    local results_dir="$RESULTS_DIR/$(echo "$test_name" | tr ' ' '_')"
+    mkdir -p "$results_dir"
+
+    local stats_file=$(mktemp)
+    local file_count=$#
+    echo "Finished: 0/$file_count files" > "$stats_file"
+    start_dynamic_spinner "Running $test_name tests with $JOBS jobs..." "$stats_file"
+
+    worker_pids=()
+    local index=0
+    local finished_count=0
+    for test_file in "$@"; do
+        index=$((index + 1))
+
+        # Wait for a free job slot
+        update_parallel_stats "$results_dir" "$file_count" "$stats_file"
+        while [ $(( ${#worker_pids[@]} - finished_count )) -ge "$JOBS" ]; do
+            sleep 0.1
+            update_parallel_stats "$results_dir" "$file_count" "$stats_file"
+        done
+
+        run_test_file_worker "$test_file" "$results_dir/$index" &
+        worker_pids+=($!)
+    done
+
+    # Wait for the remaining workers
+    update_parallel_stats "$results_dir" "$file_count" "$stats_file"
+    while [ "$finished_count" -lt "$file_count" ]; do
+        sleep 0.1
+        update_parallel_stats "$results_dir" "$file_count" "$stats_file"
+    done
+    for worker_pid in "${worker_pids[@]}"; do
+        wait "$worker_pid" 2>/dev/null
+    done
+    worker_pids=()
+
+    stop_spinner
+    rm -f "$stats_file"
+
+    # Aggregate results in the original file order so the output is deterministic
+    index=0
+    for test_file in "$@"; do
+        index=$((index + 1))
+        local file_name=$(basename "$test_file")
+        local file_test_count=0
+        local file_failed_count=0
+        local file_passed_count=0
+
+        while IFS= read -r line; do
+            record_tap_line "$file_name" "$line"
+        done < "$results_dir/$index.tap"
+
+        report_test_file "$file_name" "$(cat "$results_dir/$index.exit")" "$(cat "$results_dir/$index.ms")"
+    done
+}
+
 # Function to run tests in a directory
 run_test_directory() {
     local test_dir="$1"
@@ -148,84 +392,58 @@ run_test_directory() {
     local total_files=0
     local dir_failed_tests=0
     local dir_passed_tests=0
-    
-    for test_file in "${test_file_array[@]}"; do
-        local file_name=$(basename "$test_file")
-        
-        # Create temporary file for dynamic stats
-        local stats_file=$(mktemp)
-        echo "Passed: 0 | Failed: 0 | Executed: 0" > "$stats_file"
-        
-        # Start dynamic spinner animation
-        start_dynamic_spinner "Running $file_name..." "$stats_file"
-        
-        # Initialize counters for this file
-        local file_test_count=0
-        local file_failed_count=0
-        local file_passed_count=0
-        local file_total_tests=0
-        
-        # Get total test count first
-        if command -v grep &> /dev/null; then
-            file_total_tests=$(grep -c "^@test" "$test_file" 2>/dev/null || echo "?")
-        else
-            file_total_tests="?"
-        fi
-        
-        # Run bats with TAP format and process output in real-time
-        local bats_exit_code=0
-        local temp_exit_file=$(mktemp)
-        
-        while IFS= read -r line; do
-            if [[ $line =~ ^ok\ [0-9]+\ (.+)$ ]]; then
-                # Passed test
-                local passed_test_name="${line#ok * }"
-                all_tests+=("$file_name: $passed_test_name")
-                passed_tests+=("$file_name: $passed_test_name")
-                test_files+=("$file_name")
-                file_test_count=$((file_test_count + 1))
-                file_passed_count=$((file_passed_count + 1))
-                dir_passed_tests=$((dir_passed_tests + 1))
-                
-                # Update dynamic stats
-                echo "Passed: $file_passed_count | Failed: $file_failed_count | Executed: $file_test_count/$file_total_tests" > "$stats_file"
-                
-            elif [[ $line =~ ^not\ ok\ [0-9]+\ (.+)$ ]]; then
-                # Failed test
-                local failed_test_name="${line#not ok * }"
-                all_tests+=("$file_name: $failed_test_name")
-                failed_tests+=("$file_name: $failed_test_name")
-                test_files+=("$file_name")
-                file_test_count=$((file_test_count + 1))
-                file_failed_count=$((file_failed_count + 1))
-                dir_failed_tests=$((dir_failed_tests + 1))
-                
-                # Update dynamic stats
-                echo "Passed: $file_passed_count | Failed: $file_failed_count | Executed: $file_test_count/$file_total_tests" > "$stats_file"
+
+    if [ "$JOBS" -gt 1 ]; then
+        run_test_files_in_parallel "$test_name" "${test_file_array[@]}"
+    else
+        for test_file in "${test_file_array[@]}"; do
+            local file_name=$(basename "$test_file")
+
+            # Create temporary file for dynamic stats
+            local stats_file=$(mktemp)
+            echo "Passed: 0 | Failed: 0 | Executed: 0" > "$stats_file"
+
+            # Start dynamic spinner animation
+            start_dynamic_spinner "Running $file_name..." "$stats_file"
+
+            # Initialize counters for this file
+            local file_test_count=0
+            local file_failed_count=0
+            local file_passed_count=0
+            local file_total_tests=0
+
+            # Get total test count first
+            if command -v grep &> /dev/null; then
+                file_total_tests=$(grep -c "^@test" "$test_file" 2>/dev/null || echo "?")
+            else
+                file_total_tests="?"
             fi
-        done < <(bats --tap "$test_file" 2>/dev/null; echo $? > "$temp_exit_file")
-        
-        # Get the exit code
-        bats_exit_code=$(cat "$temp_exit_file")
-        rm -f "$temp_exit_file"
-        
-        # Stop spinner and show results
-        stop_spinner
-        rm -f "$stats_file"
-        
-        if [ $bats_exit_code -eq 0 ]; then
-            echo -e "${GREEN}✓ $file_name passed${NC}"
-        else
-            echo -e "${RED}✗ $file_name failed${NC}"
-            failed_files=$((failed_files + 1))
-        fi
-        
-        total_files=$((total_files + 1))
-        total_test_count=$((total_test_count + file_test_count))
-        echo "  Individual tests: $file_test_count total, $file_passed_count passed, $file_failed_count failed"
-        echo
-    done
-    
+
+            # Run bats with TAP format and process output in real-time
+            local bats_exit_code=0
+            local temp_exit_file=$(mktemp)
+            local file_start_us=$(now_us)
+
+            while IFS= read -r line; do
+                if record_tap_line "$file_name" "$line"; then
+                    # Update dynamic stats
+                    echo "Passed: $file_passed_count | Failed: $file_failed_count | Executed: $file_test_count/$file_total_tests" > "$stats_file"
+                fi
+            done < <(bats "${BATS_ARGS[@]}" "$test_file" 2>/dev/null; echo $? > "$temp_exit_file")
+
+            # Get the exit code
+            bats_exit_code=$(cat "$temp_exit_file")
+            rm -f "$temp_exit_file"
+            local file_duration_ms=$(( ($(now_us) - file_start_us) / 1000 ))
+
+            # Stop spinner and show results
+            stop_spinner
+            rm -f "$stats_file"
+
+            report_test_file "$file_name" "$bats_exit_code" "$file_duration_ms"
+        done
+    fi
+
     if [ $failed_files -eq 0 ]; then
         echo -e "${GREEN}All $test_name test files passed! ($total_files/$total_files files, $dir_passed_tests/$((dir_passed_tests + dir_failed_tests)) tests)${NC}"
     else
@@ -243,7 +461,19 @@ declare -a all_tests=()
 declare -a passed_tests=()
 declare -a failed_tests=()
 declare -a test_files=()
+# "status|duration ms|file|test name" for every test, used for timing and report output
+declare -a test_results=()
+# "exit code|duration ms|file|passed|failed" for every test file
+declare -a file_results=()
+declare -a worker_pids=()
 total_test_count=0
+suite_start_us=$(now_us)
+
+# Temporary directory for the output of parallel test file workers
+RESULTS_DIR=""
+if [ "$JOBS" -gt 1 ]; then
+    RESULTS_DIR=$(mktemp -d)
+fi
 
 # Run git script tests
 if [ -d "$ROOT_DIR/git/tests" ]; then
@@ -295,9 +525,80 @@ if [ ${#passed_tests[@]} -gt 0 ]; then
     echo
 fi
 
+[ -n "$RESULTS_DIR" ] && rm -rf "$RESULTS_DIR"
+suite_duration_ms=$(( ($(now_us) - suite_start_us) / 1000 ))
+
+# Display the slowest tests
+if [ "$SLOWEST_COUNT" -gt 0 ] && [ ${#test_results[@]} -gt 0 ]; then
+    echo -e "${CYAN}=== Slowest Tests ===${NC}"
+    printf '%s\n' "${test_results[@]}" | sort -t '|' -k2,2nr | head -n "$SLOWEST_COUNT" |
+    while IFS='|' read -r test_status duration_ms file_name test_name; do
+        printf "  %8s  %s: %s\n" "$(format_ms $duration_ms)" "$file_name" "$test_name"
+    done
+    echo
+fi
+
+# Escape a string for use in XML attributes and text
+xml_escape() {
+    local value="$1"
+    value="${value//&/&amp;}"
+    value="${value//</&lt;}"
+    value="${value//>/&gt;}"
+    value="${value//\"/&quot;}"
+    echo "$value"
+}
+
+# Write combined TAP report
+if [ -n "$TAP_REPORT" ]; then
+    {
+        echo "TAP version 13"
+        echo "1..${#test_results[@]}"
+        test_number=0
+        for result in "${test_results[@]}"; do
+            test_number=$((test_number + 1))
+            IFS='|' read -r test_status duration_ms file_name test_name <<< "$result"
+            if [ "$test_status" = "passed" ]; then
+                echo "ok $test_number $file_name: $test_name # time=${duration_ms}ms"
+            else
+                echo "not ok $test_number $file_name: $test_name # time=${duration_ms}ms"
+            fi
+        done
+    } > "$TAP_REPORT"
+    echo -e "${CYAN}TAP report written to $TAP_REPORT${NC}"
+fi
+
+# Write JUnit XML report, one testsuite per test file
+if [ -n "$JUNIT_REPORT" ]; then
+    {
+        echo '<?xml version="1.0" encoding="UTF-8"?>'
+        echo "<testsuites tests=\"$total_test_count\" failures=\"${#failed_tests[@]}\" time=\"$(format_ms $suite_duration_ms | tr -d s)\">"
+        for file_result in "${file_results[@]}"; do
+            IFS='|' read -r bats_exit_code file_duration_ms file_name file_passed file_failed <<< "$file_result"
+            echo "  <testsuite name=\"$(xml_escape "$file_name")\" tests=\"$((file_passed + file_failed))\" failures=\"$file_failed\" time=\"$(format_ms $file_duration_ms | tr -d s)\">"
+            for result in "${test_results[@]}"; do
+                IFS='|' read -r test_status duration_ms result_file test_name <<< "$result"
+                [ "$result_file" = "$file_name" ] || continue
+                if [ "$test_status" = "passed" ]; then
+                    echo "    <testcase classname=\"$(xml_escape "$file_name")\" name=\"$(xml_escape "$test_name")\" time=\"$(format_ms $duration_ms | tr -d s)\"/>"
+                else
+                    echo "    <testcase classname=\"$(xml_escape "$file_name")\" name=\"$(xml_escape "$test_name")\" time=\"$(format_ms $duration_ms | tr -d s)\">"
+                    echo "      <failure message=\"test failed\"/>"
+                    echo "    </testcase>"
+                fi
+            done
+            echo "  </testsuite>"
+        done
+        echo "</testsuites>"
+    } > "$JUNIT_REPORT"
+    echo -e "${CYAN}JUnit report written to $JUNIT_REPORT${NC}"
+fi
+
+[ -n "$TAP_REPORT$JUNIT_REPORT" ] && echo
+
 # Final results
 echo -e "${CYAN}=== Test Summary ===${NC}"
 echo -e "${CYAN}Total Tests: $total_test_count | Passed: ${#passed_tests[@]} | Failed: ${#failed_tests[@]}${NC}"
+echo -e "${CYAN}Total Time: $(format_ms $suite_duration_ms) | Jobs: $JOBS${NC}"
 echo
 
 # Display test suite summary
@@ -0,0 +1,80 @@
+#!/usr/bin/env zsh
+
+# measures startup time of an interactive zsh by timing repeated `zsh -i -c exit` runs
+# exits with 1 if the average startup time exceeds the budget, so it can be used as a gate
+#
+# $1 - number of runs (10 by default)
+# $2 - budget for the average startup time in milliseconds (300 by default)
+#
+# --profile - print zprof output of a single startup instead (needs ZSH_STARTUP_PROFILE support in .zshrc)
+
+# Use mock shell if in test environment
+ZSH_CMD=${TEST_TEMP_DIR:+$TEST_TEMP_DIR/mock_zsh}
+ZSH_CMD=${ZSH_CMD:-zsh}
+
+# EPOCHREALTIME is provided by the zsh/datetime module
+[ -n "$ZSH_VERSION" ] && zmodload zsh/datetime
+
+if [ "$1" = "--profile" ]
+then
+    ZSH_STARTUP_PROFILE=1 $ZSH_CMD -i -c exit
+    exit $?
+fi
+
+runs="${1:-10}"
+budget="${2:-300}"
+
+if ! [[ "$runs" =~ ^[1-9][0-9]*$ ]] || ! [[ "$budget" =~ ^[1-9][0-9]*$ ]]
+then
+    printf "Error: number of runs and budget must be positive numbers\n" >&2
+    exit 1
+fi
+
+# current time in microseconds
+now_us() {
+    echo "${EPOCHREALTIME/[.,]/}"
+}
+
+# format microseconds as milliseconds with one decimal
+format_us() {
+    printf "%d.%dms" $(( $1 / 1000 )) $(( ($1 % 1000) / 100 ))
+}
+
+printf "Measuring zsh startup time, $runs runs, budget $budget ms...\n\n"
+
+# warm up file system caches, the first run is not counted
+$ZSH_CMD -i -c exit >/dev/null 2>&1 || {
+    printf "Error: Failed to start interactive zsh\n" >&2
+    exit 1
+}
+
+durations=()
+total=0
+
+for (( i=1; i<=runs; i++ ));
+do
+    start=$(now_us)
+    $ZSH_CMD -i -c exit >/dev/null 2>&1
+    duration=$(( $(now_us) - start ))
+
+    durations+=($duration)
+    total=$(( total + duration ))
+    printf "Run $i: $(format_us $duration)\n"
+done
+
+sorted=($(printf "%s\n" "${durations[@]}" | sort -n))
+min=$(printf "%s\n" "${sorted[@]}" | head -n1)
+max=$(printf "%s\n" "${sorted[@]}" | tail -n1)
+median=$(printf "%s\n" "${sorted[@]}" | head -n $(( (runs + 1) / 2 )) | tail -n1)
+mean=$(( total / runs ))
+
+printf "\nMin: $(format_us $min) | Median: $(format_us $median) | Mean: $(format_us $mean) | Max: $(format_us $max)\n"
+
+if [ $mean -gt $(( budget * 1000 )) ]
+then
+    printf "\n❌ Average startup time $(format_us $mean) exceeds the budget of ${budget}ms\n"
+    printf "Run with --profile to see which part of .zshrc is slow\n"
+    exit 1
+fi
+
+printf "\n✅ Average startup time is within the budget of ${budget}ms\n"
@@ -19,4 +19,4 @@ if [ -z "$1" ]
 printf "Restarting App-Shell and Spend dev servers...\n\n"
 
 DIRNAME=$(dirname "$0")
-$DIRNAME/launch_appshell_and_spend_dev_servers.sh
\ No newline at end of file
+$DIRNAME/dev_servers.sh restart appshell spend
\ No newline at end of file
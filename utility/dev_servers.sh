@@ -0,0 +1,431 @@
+#!/usr/bin/env zsh
+
+# supervisor for the dev servers listed in the service registry (dev_servers.conf next to this script)
+#
+# usage: dev_servers.sh <command> [service...] [options]
+#
+# commands:
+#   start    - start services that are not running and wait until their ports accept connections
+#   stop     - stop services, SIGTERM first and SIGKILL if they are still alive after the timeout
+#   restart  - stop and start services in parallel and report restart latency of every service,
+#              a service that could not be stopped is not started again
+#   status   - show pid and port state of services
+#   logs     - follow logs of services
+#   list     - print the service registry
+#
+# all services from the registry are used when no service names are given
+#
+# options:
+#   --hard                 - stop with SIGKILL right away
+#   --timeout SEC          - seconds to wait after SIGTERM before sending SIGKILL (5 by default)
+#   --ready-timeout SEC    - seconds to wait for a started service to open its port (120 by default)
+#   --no-wait              - don't wait for started services to open their ports
+#
+# every service runs in its own process group, so stopping it stops its child processes too.
+# A service started outside of the supervisor is stopped with killport.sh by its port.
+# PID files and logs are kept in DEV_SERVERS_STATE_DIR (~/.local/state/dev_servers by default),
+# DEV_SERVERS_CONFIG overrides the path to the service registry.
+# A PID file also keeps the start time of the process, a PID left over from a reboot, a crash
+# or reused by another process is not trusted and never signaled
+
+DIRNAME=$(dirname "$0")
+
+configFile="${DEV_SERVERS_CONFIG:-$DIRNAME/dev_servers.conf}"
+stateDir="${DEV_SERVERS_STATE_DIR:-${XDG_STATE_HOME:-$HOME/.local/state}/dev_servers}"
+
+# Use mock commands if in test environment
+NC_CMD=${TEST_TEMP_DIR:+$TEST_TEMP_DIR/nc}
+KILLPORT_CMD=${TEST_TEMP_DIR:+$TEST_TEMP_DIR/killport.sh}
+KILLPORT_CMD=${KILLPORT_CMD:-$DIRNAME/killport.sh}
+
+# EPOCHREALTIME for latency measurement, ztcp for port polling without forking a process every 100ms,
+# nc only for ports that listen on IPv6 loopback alone
+zmodload zsh/datetime
+zmodload zsh/net/tcp 2>/dev/null || NC_CMD=${NC_CMD:-nc}
+
+usage="Usage: dev_servers.sh <start|stop|restart|status|logs|list> [service...] [--hard] [--timeout SEC] [--ready-timeout SEC] [--no-wait]\n"
+
+command="$1"
+[ $# -gt 0 ] && shift
+
+hardStop=
+stopTimeout=5
+readyTimeout=120
+waitForReady=true
+requestedServices=()
+
+# value of the option $1 has to be a number of seconds
+require_seconds() {
+    if [ $2 -lt 2 ] || ! [[ "$3" =~ ^[0-9]+$ ]]; then
+        printf "Error: $1 requires a number of seconds\n$usage" >&2
+        exit 1
+    fi
+}
+
+while [ $# -gt 0 ]; do
+    case "$1" in
+        --hard ) hardStop=true; shift;;
+        --timeout ) require_seconds "$1" $# "$2"; stopTimeout="$2"; shift 2;;
+        --ready-timeout ) require_seconds "$1" $# "$2"; readyTimeout="$2"; shift 2;;
+        --no-wait ) waitForReady=; shift;;
+        -* )
+            printf "Error: Unknown option $1\n" >&2
+            exit 1
+            ;;
+        * ) requestedServices+=("$1"); shift;;
+    esac
+done
+
+if [ ! -r "$configFile" ]
+then
+    printf "Error: Service registry not found: $configFile\n" >&2
+    exit 1
+fi
+
+trim() {
+    local value="$1"
+    value="${value#"${value%%[![:space:]]*}"}"
+    value="${value%"${value##*[![:space:]]}"}"
+    echo "$value"
+}
+
+# read the registry: name | directory | command | port
+typeset -A serviceDir
+typeset -A serviceCommand
+typeset -A servicePort
+serviceNames=()
+
+while IFS='|' read -r name dir cmd port; do
+    name=$(trim "$name")
+    [[ -z "$name" || "$name" == \#* ]] && continue
+
+    port=$(trim "$port")
+    if ! [[ "$port" =~ ^[0-9]+$ ]]; then
+        printf "Error: Invalid port for service $name in $configFile\n" >&2
+        exit 1
+    fi
+
+    serviceNames+=("$name")
+    serviceDir[$name]=$(trim "$dir")
+    serviceCommand[$name]=$(trim "$cmd")
+    servicePort[$name]="$port"
+done < "$configFile"
+
+if [ ${#requestedServices[@]} -eq 0 ]
+then
+    requestedServices=("${serviceNames[@]}")
+fi
+
+for name in "${requestedServices[@]}"; do
+    if (( ! ${+servicePort[$name]} )); then
+        printf "Error: Unknown service $name, available services: ${serviceNames[*]}\n" >&2
+        exit 1
+    fi
+done
+
+mkdir -p "$stateDir"
+
+# current time in microseconds
+now_us() {
+    echo "${EPOCHREALTIME/[.,]/}"
+}
+
+# format microseconds as seconds with one decimal
+format_us() {
+    printf "%d.%ds" $(( $1 / 1000000 )) $(( ($1 % 1000000) / 100000 ))
+}
+
+port_is_open() {
+    if [ -n "$NC_CMD" ]; then
+        $NC_CMD -z localhost "$1" >/dev/null 2>&1
+        return
+    fi
+
+    if ztcp localhost "$1" 2>/dev/null; then
+        ztcp -c "$REPLY"
+        return 0
+    fi
+
+    # ztcp connects over IPv4 only, servers that bind localhost may listen on ::1 alone (Node 17+ on macOS)
+    nc -z ::1 "$1" >/dev/null 2>&1
+}
+
+# start time of process $1, empty if it is not running
+process_start_time() {
+    ps -o lstart= -p "$1" 2>/dev/null
+}
+
+# pid of the service started by the supervisor, empty if it is not running
+# the pid counts only while it belongs to the process that was started, not to one that reused it
+running_pid() {
+    local pidFile="$stateDir/$1.pid"
+    local pid startTime
+
+    [ -r "$pidFile" ] || return 1
+    { read -r pid; read -r startTime } < "$pidFile"
+
+    if [ -n "$pid" ] && [ -n "$startTime" ] && kill -0 "$pid" 2>/dev/null && [ "$(process_start_time "$pid")" = "$startTime" ]; then
+        echo "$pid"
+        return 0
+    fi
+
+    rm -f "$pidFile"
+    return 1
+}
+
+# send signal $2 to the process group of pid $1, or to the pid alone if it is not a group leader
+signal_process() {
+    command kill -s "$2" -- "-$1" 2>/dev/null || command kill -s "$2" "$1" 2>/dev/null
+}
+
+# poll every 100ms until pid $1 is gone and port $2 is closed, gives up after $3 seconds
+wait_until_stopped() {
+    local deadline=$(( $(now_us) + $3 * 1000000 ))
+
+    while kill -0 "$1" 2>/dev/null || port_is_open "$2"; do
+        [ $(now_us) -ge $deadline ] && return 1
+        sleep 0.1
+    done
+    return 0
+}
+
+# stop service $1, writes how long it took in microseconds to file $2
+stop_service() {
+    local name="$1"
+    local port="${servicePort[$1]}"
+    local startedAt=$(now_us)
+    local pid
+
+    pid=$(running_pid "$name")
+
+    if [ -n "$pid" ]; then
+        stop_process "$name" "$pid" "$port" || return 1
+    elif port_is_open "$port"; then
+        # the service was started outside of the supervisor, killport stops all the listeners
+        # of the port with their child processes and never signals init or this script
+        printf "Stopping $name on port $port, it was not started by dev_servers.sh...\n"
+        if ! $KILLPORT_CMD ${hardStop:+--hard} --timeout "$stopTimeout" "$port"; then
+            printf "Error: Failed to stop $name\n"
+            return 1
+        fi
+    else
+        printf "$name is not running\n"
+        echo 0 > "$2"
+        return 0
+    fi
+
+    local elapsed=$(( $(now_us) - startedAt ))
+    rm -f "$stateDir/$name.pid"
+    echo $elapsed > "$2"
+    printf "$name stopped in $(format_us $elapsed)\n"
+}
+
+# signal the process group of service $1 with pid $2 and wait until it is gone and its port $3 is closed
+stop_process() {
+    local name="$1"
+    local pid="$2"
+    local port="$3"
+
+    if [ $hardStop ]; then
+        printf "Killing $name (pid $pid, port $port)...\n"
+        signal_process "$pid" KILL
+    else
+        printf "Terminating $name (pid $pid, port $port)...\n"
+        signal_process "$pid" TERM
+
+        if ! wait_until_stopped "$pid" "$port" "$stopTimeout"; then
+            printf "$name is still running after ${stopTimeout}s, sending SIGKILL...\n"
+            signal_process "$pid" KILL
+        fi
+    fi
+
+    if ! wait_until_stopped "$pid" "$port" 5; then
+        printf "Error: Failed to stop $name\n"
+        return 1
+    fi
+}
+
+# start service $1 in its own process group, has to run in the main shell for job control
+start_service() {
+    local name="$1"
+    local dir="${serviceDir[$1]}"
+
+    if [ ! -d "$dir" ]; then
+        printf "Error: Directory of $name does not exist: $dir\n"
+        return 1
+    fi
+
+    setopt local_options monitor
+    ( cd "$dir" && exec nohup zsh -c "${serviceCommand[$name]}" ) >> "$stateDir/$name.log" 2>&1 &!
+    local pid=$!
+    printf "%s\n%s\n" "$pid" "$(process_start_time "$pid")" > "$stateDir/$name.pid"
+
+    printf "Launching $name on port ${servicePort[$name]}...\n"
+}
+
+# poll every 100ms until service $1 opens its port, writes how long it took in microseconds to file $3
+wait_until_ready() {
+    local name="$1"
+    local port="${servicePort[$1]}"
+    local startedAt="$2"
+    local pid
+    local deadline=$(( startedAt + readyTimeout * 1000000 ))
+
+    read -r pid < "$stateDir/$name.pid"
+
+    until port_is_open "$port"; do
+        if ! kill -0 "$pid" 2>/dev/null; then
+            printf "Error: $name exited before opening port $port, last lines of $stateDir/$name.log:\n"
+            tail -n 5 "$stateDir/$name.log"
+            return 1
+        fi
+        if [ $(now_us) -ge $deadline ]; then
+            printf "Error: $name did not open port $port within ${readyTimeout}s\n"
+            return 1
+        fi
+        sleep 0.1
+    done
+
+    echo $(( $(now_us) - startedAt )) > "$3"
+    printf "$name is ready on port $port\n"
+}
+
+# run function $1 for every requested service in parallel, results are printed in registry order
+# services the function failed for are stored in failedServices
+run_in_parallel() {
+    local action="$1"
+    local resultsDir="$2"
+    local name
+    typeset -A pids
+    failedServices=()
+
+    for name in "${requestedServices[@]}"; do
+        $action "$name" "$resultsDir/$name.$action" > "$resultsDir/$name.$action.log" 2>&1 &
+        pids[$name]=$!
+    done
+
+    for name in "${requestedServices[@]}"; do
+        wait "${pids[$name]}" || failedServices+=("$name")
+    done
+
+    for name in "${requestedServices[@]}"; do
+        cat "$resultsDir/$name.$action.log"
+    done
+
+    [ ${#failedServices[@]} -eq 0 ]
+}
+
+# start services and wait for their ports in parallel, stop durations are taken from results dir $1
+start_services() {
+    local resultsDir="$1"
+    local name startedAt failed=0
+
+    for name in "${requestedServices[@]}"; do
+        if running_pid "$name" >/dev/null || port_is_open "${servicePort[$name]}"; then
+            printf "$name is already running on port ${servicePort[$name]}\n"
+            continue
+        fi
+
+        startedAt=$(now_us)
+        start_service "$name" || { failed=1; continue; }
+
+        if [ $waitForReady ]; then
+            wait_until_ready "$name" "$startedAt" "$resultsDir/$name.ready" > "$resultsDir/$name.ready.log" 2>&1 &
+        fi
+    done
+
+    [ $waitForReady ] || return $failed
+    wait
+
+    printf "\n"
+    for name in "${requestedServices[@]}"; do
+        [ -f "$resultsDir/$name.ready.log" ] && cat "$resultsDir/$name.ready.log"
+    done
+
+    printf "\n"
+    local stopUs readyUs
+    for name in "${requestedServices[@]}"; do
+        if [ ! -f "$resultsDir/$name.ready" ]; then
+            [ -f "$resultsDir/$name.ready.log" ] && failed=1
+            continue
+        fi
+
+        read -r readyUs < "$resultsDir/$name.ready"
+        stopUs=0
+        [ -f "$resultsDir/$name.stop_service" ] && read -r stopUs < "$resultsDir/$name.stop_service"
+
+        printf "%-12s %s (stop %s, ready %s)\n" "$name" "$(format_us $(( stopUs + readyUs )))" "$(format_us $stopUs)" "$(format_us $readyUs)"
+    done
+
+    return $failed
+}
+
+show_status() {
+    local name pid portState
+
+    printf "%-12s %-8s %-8s %-6s %s\n" "SERVICE" "STATE" "PID" "PORT" "DIRECTORY"
+    for name in "${requestedServices[@]}"; do
+        pid=$(running_pid "$name")
+        portState="${servicePort[$name]}"
+        port_is_open "${servicePort[$name]}" && portState="$portState*"
+
+        if [ -n "$pid" ]; then
+            printf "%-12s %-8s %-8s %-6s %s\n" "$name" "running" "$pid" "$portState" "${serviceDir[$name]}"
+        else
+            printf "%-12s %-8s %-8s %-6s %s\n" "$name" "stopped" "-" "$portState" "${serviceDir[$name]}"
+        fi
+    done
+    printf "\n* - port accepts connections\n"
+}
+
+resultsDir=$(mktemp -d)
+trap 'rm -rf "$resultsDir"' EXIT
+
+case "$command" in
+    start )
+        start_services "$resultsDir"
+        ;;
+    stop )
+        run_in_parallel stop_service "$resultsDir" || exit 1
+        ;;
+    restart )
+        printf "Restarting ${requestedServices[*]}...\n\n"
+        restartFailed=
+
+        # a service that survived the stop would only be reported as already running
+        if ! run_in_parallel stop_service "$resultsDir"; then
+            printf "\nError: ${failedServices[*]} could not be stopped and will not be started again\n"
+            requestedServices=(${requestedServices:|failedServices})
+            restartFailed=true
+        fi
+
+        if [ ${#requestedServices[@]} -gt 0 ]; then
+            printf "\n"
+            start_services "$resultsDir" || restartFailed=true
+        fi
+
+        if [ $restartFailed ]; then
+            exit 1
+        fi
+        ;;
+    status )
+        show_status
+        ;;
+    logs )
+        logFiles=()
+        for name in "${requestedServices[@]}"; do
+            touch "$stateDir/$name.log"
+            logFiles+=("$stateDir/$name.log")
+        done
+        tail -n 20 -f "${logFiles[@]}"
+        ;;
+    list )
+        for name in "${serviceNames[@]}"; do
+            printf "%-12s port %-6s %-20s %s\n" "$name" "${servicePort[$name]}" "${serviceCommand[$name]}" "${serviceDir[$name]}"
+        done
+        ;;
+    * )
+        printf "$usage" >&2
+        exit 1
+        ;;
+esac
@@ -1,10 +1,50 @@
-#!/bin/bash
+#!/usr/bin/env zsh
 
 # Export prompt library entries to Downloads folder
 # This script copies all entries from the prompt_library directory to exported-prompts in Downloads
+#
+# The export is incremental: a manifest with path, size, mtime and content hash of every source file
+# is kept in the destination, so only new and changed files are copied, and exported copies of
+# deleted sources are removed. Files that share a name with a file in another subdirectory are
+# exported as <subdir>__<name>, only the one in the library root keeps its plain name. A generated
+# name that is already taken (a/x.md next to a root a__x.md) gets a numeric suffix: a__x_2.md.
+#
+# Options:
+#   --full            - copy every file again, exported copies of deleted sources are still removed
+#   --archive [FILE]  - also pack the exported files into a single tar.gz archive,
+#                       exported-prompts.tar.gz next to the destination directory by default
 
 SOURCE_DIR="/Users/user/My stuff/Coding/llm_stuff/prompt_library/prompt_library"
 DEST_DIR="/Users/user/Downloads/exported-prompts"
+MANIFEST_FILE="$DEST_DIR/.export_manifest"
+
+# number of files passed to a single cp call
+COPY_BATCH_SIZE=500
+
+# zstat reads size and mtime without forking a process per file
+zmodload -F zsh/stat b:zstat
+
+fullExport=
+archiveFile=
+
+while [ $# -gt 0 ]; do
+    case "$1" in
+        --full ) fullExport=true; shift;;
+        --archive )
+            if [ -n "$2" ] && [[ "$2" != -* ]]; then
+                archiveFile="$2"
+                shift 2
+            else
+                archiveFile="$DEST_DIR.tar.gz"
+                shift
+            fi
+            ;;
+        * )
+            echo "Error: Unknown option $1"
+            exit 1
+            ;;
+    esac
+done
 
 # Check if source directory exists
 if [ ! -d "$SOURCE_DIR" ]; then
@@ -18,18 +58,150 @@ if [ ! -d "$DEST_DIR" ]; then
     mkdir -p "$DEST_DIR"
 fi
 
-# Copy all contents from source to destination without subdirectories
 echo "Exporting prompt library entries..."
 echo "From: $SOURCE_DIR"
 echo "To: $DEST_DIR"
 
-# Find all files recursively and copy them to destination directory (flattened)
-find "$SOURCE_DIR" -type f -exec cp {} "$DEST_DIR/" \;
+# All files recursively, sorted by path so the export names are deterministic
+sourceFiles=("$SOURCE_DIR"/**/*(.ND))
+relativePaths=("${sourceFiles[@]#${(b)SOURCE_DIR}/}")
+
+# Files with the same name in different subdirectories get the subdirectory in their exported name
+typeset -A nameCounts
+for rel in "${relativePaths[@]}"; do
+    nameCounts[${rel:t}]=$(( ${nameCounts[${rel:t}]:-0} + 1 ))
+done
+
+typeset -A exportNames
+typeset -A takenNames
+for rel in "${relativePaths[@]}"; do
+    if [ ${nameCounts[${rel:t}]} -eq 1 ] || [[ "$rel" != */* ]]; then
+        exportNames[$rel]="${rel:t}"
+        takenNames[${rel:t}]=1
+    fi
+done
+
+# Plain names are taken first, generated names that clash get the lowest free suffix in path order
+for rel in "${relativePaths[@]}"; do
+    (( ${+exportNames[$rel]} )) && continue
+
+    name="${rel//\//__}"
+    extension=
+    [[ "${rel:t}" == ?*.* ]] && extension=".${rel:t:e}"
+    candidate="$name"
+    suffix=1
+    while (( ${+takenNames[$candidate]} )); do
+        suffix=$(( suffix + 1 ))
+        candidate="${name%$extension}_$suffix$extension"
+    done
+
+    exportNames[$rel]="$candidate"
+    takenNames[$candidate]=1
+done
+
+# Manifest line: relative path, size, mtime, sha256, exported name (tab separated)
+# A full export still reads it to remove exported copies of deleted sources
+typeset -A manifest
+if [ -r "$MANIFEST_FILE" ]; then
+    while IFS=$'\t' read -r rel size mtime hash name; do
+        manifest[$rel]="$size"$'\t'"$mtime"$'\t'"$hash"$'\t'"$name"
+    done < "$MANIFEST_FILE"
+fi
+
+# Unchanged size and mtime means unchanged file, everything else is hashed in a single call
+typeset -A fileStats
+typeset -A fileHashes
+filesToHash=()
+
+for rel in "${relativePaths[@]}"; do
+    zstat -H fileInfo -- "$SOURCE_DIR/$rel" || continue
+    fileStats[$rel]="${fileInfo[size]}"$'\t'"${fileInfo[mtime]}"
+
+    IFS=$'\t' read -r size mtime hash name <<< "${manifest[$rel]}"
+    if [ -z "$fullExport" ] && [ "$size"$'\t'"$mtime" = "${fileStats[$rel]}" ] && [ "$name" = "${exportNames[$rel]}" ] && [ -f "$DEST_DIR/$name" ]; then
+        fileHashes[$rel]="$hash"
+    else
+        filesToHash+=("$rel")
+    fi
+done
+
+if [ ${#filesToHash[@]} -gt 0 ]; then
+    if command -v shasum >/dev/null; then
+        hashCmd=(shasum -a 256)
+    else
+        hashCmd=(sha256sum)
+    fi
+
+    while IFS= read -r line; do
+        fileHashes[${line#*  }]="${line%%  *}"
+    done < <(cd "$SOURCE_DIR" && $hashCmd -- "${filesToHash[@]}")
+fi
+
+# Touched files with the same content are not copied again
+plainCopies=()
+renamedCopies=()
+
+for rel in "${filesToHash[@]}"; do
+    IFS=$'\t' read -r size mtime hash name <<< "${manifest[$rel]}"
+    if [ -z "$fullExport" ] && [ -n "$hash" ] && [ "$hash" = "${fileHashes[$rel]}" ] && [ "$name" = "${exportNames[$rel]}" ] && [ -f "$DEST_DIR/$name" ]; then
+        continue
+    fi
+
+    if [ "${exportNames[$rel]}" = "${rel:t}" ]; then
+        plainCopies+=("$SOURCE_DIR/$rel")
+    else
+        renamedCopies+=("$rel")
+    fi
+done
 
-if [ $? -eq 0 ]; then
-    echo "✅ Successfully exported prompt library entries to $DEST_DIR"
-    echo "📁 All files have been copied to a single directory without subdirectories"
-else
+copyFailed=
+
+# Files that keep their name are copied in batches, one cp call per batch instead of one per file
+for (( i=1; i<=${#plainCopies[@]}; i+=COPY_BATCH_SIZE )); do
+    cp -p -- "${(@)plainCopies[i,i+COPY_BATCH_SIZE-1]}" "$DEST_DIR/" || copyFailed=true
+done
+
+for rel in "${renamedCopies[@]}"; do
+    cp -p -- "$SOURCE_DIR/$rel" "$DEST_DIR/${exportNames[$rel]}" || copyFailed=true
+done
+
+if [ $copyFailed ]; then
     echo "❌ Error occurred during export"
     exit 1
-fi 
\ No newline at end of file
+fi
+
+# Remove exported copies of deleted or renamed sources
+typeset -A currentNames
+for rel in "${relativePaths[@]}"; do
+    currentNames[${exportNames[$rel]}]=1
+done
+
+staleFiles=()
+for rel in "${(@k)manifest}"; do
+    name="${manifest[$rel]##*$'\t'}"
+    if [ -n "$name" ] && (( ! ${+currentNames[$name]} )) && (( ! ${staleFiles[(Ie)$DEST_DIR/$name]} )); then
+        staleFiles+=("$DEST_DIR/$name")
+    fi
+done
+
+[ ${#staleFiles[@]} -gt 0 ] && rm -f -- "${staleFiles[@]}"
+
+for rel in "${relativePaths[@]}"; do
+    [ -n "${fileHashes[$rel]}" ] && printf "%s\t%s\t%s\t%s\n" "$rel" "${fileStats[$rel]}" "${fileHashes[$rel]}" "${exportNames[$rel]}"
+done >| "$MANIFEST_FILE.tmp"
+mv "$MANIFEST_FILE.tmp" "$MANIFEST_FILE"
+
+copiedCount=$(( ${#plainCopies[@]} + ${#renamedCopies[@]} ))
+echo "Copied: $copiedCount, unchanged: $(( ${#relativePaths[@]} - copiedCount )), removed: ${#staleFiles[@]}"
+
+# A single archive lets the library be shipped in one piece
+if [ -n "$archiveFile" ]; then
+    if ! tar -czf "$archiveFile" -C "$DEST_DIR" --exclude "${MANIFEST_FILE:t}" .; then
+        echo "❌ Error occurred while creating archive $archiveFile"
+        exit 1
+    fi
+    echo "📦 Archive created: $archiveFile"
+fi
+
+echo "✅ Successfully exported prompt library entries to $DEST_DIR"
+echo "📁 All files have been copied to a single directory without subdirectories"
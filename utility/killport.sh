@@ -1,26 +1,344 @@
 #!/usr/bin/env zsh
 
-# terminates the process by port
-# normal and "polite" termination
+# terminates processes listening on the given ports together with their child processes
+# normal and "polite" termination, SIGKILL is sent to processes that are still alive after the timeout
+#
+# usage: killport.sh [--hard] [--timeout SEC] <port|from-to>...
+#   killport.sh 3000
+#   killport.sh 3000-3010 5173
+#
+# options:
+#   --hard         - send SIGKILL right away, immediate and "rude" termination without the cleanup
+#   --timeout SEC  - seconds to wait after SIGTERM before sending SIGKILL (5 by default)
+#
+# listeners of all the ports are found in a single scan: /proc/net/tcp{,6} and /proc/*/fd on Linux,
+# one lsof call on other systems or for sockets of processes that can't be inspected through /proc
+#
+# init (PID 1), killport itself and its ancestors are never signaled: a port held by one of them
+# (e.g. the IDE whose terminal runs killport) is reported as failed, and descendants that run
+# killport are skipped together with their children
 
 # Use mock commands if in test environment
 LSOF_CMD=${TEST_TEMP_DIR:+$TEST_TEMP_DIR/lsof}
 LSOF_CMD=${LSOF_CMD:-lsof}
 KILL_CMD=${TEST_TEMP_DIR:+$TEST_TEMP_DIR/kill}
 KILL_CMD=${KILL_CMD:-kill}
+PS_CMD=${TEST_TEMP_DIR:+$TEST_TEMP_DIR/ps}
+PS_CMD=${PS_CMD:-ps}
+PROC_DIR=${TEST_TEMP_DIR:+$TEST_TEMP_DIR/proc}
+PROC_DIR=${PROC_DIR:-/proc}
 
-# "lsof -ti:$1" returns a PID of the process by port
-pid=$($LSOF_CMD -ti:$1)
+# EPOCHREALTIME for the timeout, zstat to read /proc/*/fd links without forking readlink
+zmodload zsh/datetime
+zmodload -F zsh/stat b:zstat
 
-if [ -z "$pid" ]
+usage="Usage: killport.sh [--hard] [--timeout SEC] <port|from-to>...\n"
+
+hardKill=
+timeout=5
+specs=()
+
+while [ $# -gt 0 ]; do
+    case "$1" in
+        --hard ) hardKill=true; shift;;
+        --timeout )
+            if [ $# -lt 2 ] || ! [[ "$2" =~ ^[0-9]+$ ]]; then
+                printf "Error: --timeout requires a number of seconds\n$usage" >&2
+                exit 1
+            fi
+            timeout="$2"
+            shift 2
+            ;;
+        * ) specs+=(${(s:,:)1}); shift;;
+    esac
+done
+
+if [ ${#specs[@]} -eq 0 ]
+then
+    printf "$usage" >&2
+    exit 1
+fi
+
+# expand the ranges into the list of requested ports
+ports=()
+typeset -A requestedPorts
+
+for spec in "${specs[@]}"; do
+    if [[ "$spec" =~ ^[0-9]+$ ]]; then
+        from="$spec"
+        to="$spec"
+    elif [[ "$spec" =~ ^[0-9]+-[0-9]+$ ]]; then
+        from="${spec%-*}"
+        to="${spec#*-}"
+    else
+        from=1
+        to=0
+    fi
+
+    if [ "$from" -gt "$to" ] || [ "$to" -gt 65535 ]; then
+        printf "Error: Invalid port $spec\n" >&2
+        exit 1
+    fi
+
+    for (( port=from; port<=to; port++ )); do
+        if (( ! ${+requestedPorts[$port]} )); then
+            requestedPorts[$port]=1
+            ports+=("$port")
+        fi
+    done
+done
+
+# port -> space separated PIDs of the processes listening on it
+typeset -A portPids
+
+add_listener() {
+    (( ${+requestedPorts[$1]} )) || return
+    [[ " ${portPids[$1]} " == *" $2 "* ]] && return
+    portPids[$1]="${portPids[$1]:+${portPids[$1]} }$2"
+}
+
+# find listeners of the ports $1 (comma separated list of ports and ranges) with a single lsof call
+scan_lsof() {
+    local line pid
+
+    while IFS= read -r line; do
+        case "$line" in
+            p* ) pid="${line#p}";;
+            n* ) add_listener "${line##*:}" "$pid";;
+        esac
+    done < <($LSOF_CMD -nP -iTCP:$1 -sTCP:LISTEN -Fpn 2>/dev/null)
+}
+
+# find listeners through /proc: socket inodes of the listening ports come from net/tcp{,6},
+# then the inodes are matched against the fd links of every process we are allowed to inspect
+scan_proc() {
+    local hexPorts=()
+    local port inode hexPort fd
+    local tcpFiles=("$PROC_DIR"/net/tcp(N) "$PROC_DIR"/net/tcp6(N))
+    typeset -A inodePorts
+    typeset -A resolvedInodes
+
+    for port in "${ports[@]}"; do
+        hexPorts+=($(printf "%04X" "$port"))
+    done
+
+    # state 0A is LISTEN, the local address is "hexip:hexport", the inode is the 10th column
+    while read -r inode hexPort; do
+        [ "$inode" = "0" ] && continue
+        inodePorts[$inode]=$(( 16#$hexPort ))
+    done < <(awk -v ports="${hexPorts[*]}" '
+        BEGIN { n = split(ports, list, " "); for (i = 1; i <= n; i++) wanted[list[i]] = 1 }
+        FNR > 1 && $4 == "0A" { split($2, address, ":"); if (address[2] in wanted) print $10, address[2] }
+    ' "${tcpFiles[@]}")
+
+    [ ${#inodePorts[@]} -eq 0 ] && return
+
+    local target=()
+    for fd in "$PROC_DIR"/<->/fd/<->(N); do
+        zstat -L -A target +link "$fd" 2>/dev/null || continue
+        [[ "$target[1]" == "socket:["*"]" ]] || continue
+
+        inode="${${target[1]#socket:\[}%\]}"
+        if (( ${+inodePorts[$inode]} )); then
+            add_listener "${inodePorts[$inode]}" "${${fd:h:h}:t}"
+            resolvedInodes[$inode]=1
+        fi
+    done
+
+    # sockets of other users' processes are not visible in /proc/*/fd, lsof may still see them
+    local unresolvedPorts=()
+    for inode in "${(@k)inodePorts}"; do
+        (( ${+resolvedInodes[$inode]} )) || unresolvedPorts+=("${inodePorts[$inode]}")
+    done
+
+    [ ${#unresolvedPorts[@]} -gt 0 ] && scan_lsof ${(j:,:)${(u)unresolvedPorts}}
+}
+
+if [ -r "$PROC_DIR/net/tcp" ]
 then
-    printf "No process on port $1\n"
+    scan_proc
 else
-    # Handle multiple PIDs by killing only the first one
-    first_pid=$(echo "$pid" | head -n1)
-    if $KILL_CMD -15 "$first_pid" 2>/dev/null; then
-        printf "Process on port $1 terminated\n"
+    scan_lsof "${(j:,:)specs}"
+fi
+
+if [ ${#portPids[@]} -eq 0 ]
+then
+    for spec in "${specs[@]}"; do
+        if [[ "$spec" == *-* ]]; then
+            printf "No process on ports $spec\n"
+        else
+            printf "No process on port $spec\n"
+        fi
+    done
+    exit 0
+fi
+
+# parent -> space separated PIDs of its children and child -> parent, from /proc/*/stat or a single ps call
+typeset -A childPids
+typeset -A parentPids
+
+load_process_tree() {
+    local statFile statLine pid ppid
+
+    if [ -r "$PROC_DIR/net/tcp" ]; then
+        for statFile in "$PROC_DIR"/<->/stat(N); do
+            read -r statLine < "$statFile" || continue
+            # the command name in parentheses may contain spaces, ppid is the second field after it
+            ppid="${${(s: :)${statLine##*) }}[2]}"
+            pid="${${statFile:h}:t}"
+            childPids[$ppid]+=" $pid"
+            parentPids[$pid]="$ppid"
+        done
     else
-        printf "Failed to terminate process on port $1\n"
+        while read -r pid ppid; do
+            [ -n "$ppid" ] || continue
+            childPids[$ppid]+=" $pid"
+            parentPids[$pid]="$ppid"
+        done < <($PS_CMD -A -o pid= -o ppid= 2>/dev/null)
     fi
-fi
\ No newline at end of file
+}
+
+load_process_tree
+
+# init, killport and the chain of its ancestors up to init
+typeset -A protectedPids
+protectedPids[1]=1
+pid=$$
+while [ -n "$pid" ] && [ "$pid" -gt 1 ] && (( ! ${+protectedPids[$pid]} )); do
+    protectedPids[$pid]=1
+    if (( ${+parentPids[$pid]} )); then
+        pid="${parentPids[$pid]}"
+    elif [ "$pid" = "$$" ]; then
+        pid=$PPID
+    else
+        break
+    fi
+done
+
+# port -> PIDs of the listeners and all their descendants, every PID is signaled only once
+typeset -A portTrees
+typeset -A portListeners
+typeset -A refusedPids
+typeset -A seenPids
+allPids=()
+
+for port in "${ports[@]}"; do
+    (( ${+portPids[$port]} )) || continue
+
+    queue=()
+    for pid in ${=portPids[$port]}; do
+        if (( ${+protectedPids[$pid]} )); then
+            refusedPids[$port]+=" $pid"
+        else
+            queue+=("$pid")
+        fi
+    done
+    [ ${#queue[@]} -gt 0 ] && portListeners[$port]=${#queue[@]}
+
+    while [ ${#queue[@]} -gt 0 ]; do
+        pid="$queue[1]"
+        shift queue
+        (( ${+protectedPids[$pid]} )) && continue
+        portTrees[$port]+=" $pid"
+
+        if (( ! ${+seenPids[$pid]} )); then
+            seenPids[$pid]=1
+            allPids+=("$pid")
+        fi
+        queue+=(${=childPids[$pid]})
+    done
+done
+
+now_us() {
+    echo "${EPOCHREALTIME/[.,]/}"
+}
+
+# print PIDs from $@ that are still alive
+alive_pids() {
+    local pid
+    for pid in "$@"; do
+        $KILL_CMD -s 0 "$pid" 2>/dev/null && echo "$pid"
+    done
+}
+
+# poll every 100ms until PIDs $2... exit, gives up after $1 seconds, prints PIDs that are still alive
+wait_for_exit() {
+    local deadline=$(( $(now_us) + $1 * 1000000 ))
+    shift
+    local remaining=("$@")
+
+    while [ ${#remaining[@]} -gt 0 ] && [ $(now_us) -lt $deadline ]; do
+        sleep 0.1
+        remaining=($(alive_pids "${remaining[@]}"))
+    done
+
+    [ ${#remaining[@]} -gt 0 ] && echo "${remaining[@]}"
+}
+
+# signal all the process trees at once and wait for them together, so the ports are freed concurrently
+typeset -A killedPids
+survivors=()
+
+if [ $hardKill ]
+then
+    for pid in "${allPids[@]}"; do
+        $KILL_CMD -9 "$pid" 2>/dev/null
+    done
+    survivors=($(wait_for_exit 2 $(alive_pids "${allPids[@]}")))
+else
+    for pid in "${allPids[@]}"; do
+        $KILL_CMD -15 "$pid" 2>/dev/null
+    done
+    stubbornPids=($(wait_for_exit "$timeout" $(alive_pids "${allPids[@]}")))
+
+    if [ ${#stubbornPids[@]} -gt 0 ]; then
+        for pid in "${stubbornPids[@]}"; do
+            killedPids[$pid]=1
+            $KILL_CMD -9 "$pid" 2>/dev/null
+        done
+        survivors=($(wait_for_exit 2 "${stubbornPids[@]}"))
+    fi
+fi
+
+failed=0
+
+for port in "${ports[@]}"; do
+    if (( ${+refusedPids[$port]} )); then
+        printf "Refusing to terminate process on port $port, PID${refusedPids[$port]} is init or runs killport\n"
+        failed=1
+    fi
+
+    (( ${+portTrees[$port]} )) || continue
+
+    tree=(${=portTrees[$port]})
+    children=$(( ${#tree[@]} - ${portListeners[$port]} ))
+    details=""
+    [ $children -gt 0 ] && details=" with $children child process(es)"
+
+    state="terminated"
+    for pid in "${tree[@]}"; do
+        if (( ${survivors[(Ie)$pid]} )); then
+            state="failed"
+            break
+        fi
+        (( ${+killedPids[$pid]} )) && state="killed"
+    done
+
+    case "$state" in
+        terminated ) printf "Process on port $port terminated$details\n";;
+        killed ) printf "Process on port $port terminated$details, SIGKILL was sent after ${timeout}s timeout\n";;
+        failed )
+            printf "Failed to terminate process on port $port\n"
+            failed=1
+            ;;
+    esac
+done
+
+# ports given one by one are reported even when nothing listens on them
+for spec in "${specs[@]}"; do
+    if [[ "$spec" != *-* ]] && (( ! ${+portPids[$spec]} )); then
+        printf "No process on port $spec\n"
+    fi
+done
+
+exit $failed
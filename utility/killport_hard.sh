@@ -1,20 +1,8 @@
 #!/usr/bin/env zsh
 
-# kills the process by port
-# immediate and "rude" termination without the cleanup
+# kills processes by port together with their child processes
+# immediate and "rude" termination without the cleanup, accepts the same ports and ranges as killport.sh
 
-# Use external kill command if KILL_CMD is not set (for test mocking)
-KILL_CMD=${KILL_CMD:-kill}
+DIRNAME=$(dirname "$0")
 
-# "lsof -ti:$1" returns PIDs of processes by port
-pids=$(lsof -ti:$1)
-
-if [[ -z "$pids" ]]
-then
-    printf "No process on port $1\n"
-else
-    # Handle multiple PIDs - kill the first one found
-    first_pid=$(echo "$pids" | head -n1)
-    $KILL_CMD -9 "$first_pid" 2>/dev/null
-    printf "Process on port $1 terminated\n"
-fi
\ No newline at end of file
+exec $DIRNAME/killport.sh --hard "$@"
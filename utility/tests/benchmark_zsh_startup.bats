@@ -0,0 +1,102 @@
+#!/usr/bin/env bats
+
+load test_helper
+
+setup() {
+    setup_test_environment
+}
+
+teardown() {
+    teardown_utility_tests
+}
+
+# Create mock interactive shell that logs its arguments and takes $1 seconds to start
+create_mock_zsh() {
+    local startup_delay="${1:-0}"
+
+    cat > "$TEST_TEMP_DIR/mock_zsh" << EOF
+#!/usr/bin/env bash
+echo "zsh \$* (profile: \$ZSH_STARTUP_PROFILE)" >> "$TEST_TEMP_DIR/zsh_calls.log"
+sleep $startup_delay
+exit 0
+EOF
+    chmod +x "$TEST_TEMP_DIR/mock_zsh"
+}
+
+@test "runs interactive zsh the requested number of times plus a warm up run" {
+    create_mock_zsh 0
+
+    run "$UTILITY_SCRIPTS_PATH/benchmark_zsh_startup.sh" 3 1000
+
+    assert_success
+    assert_output --partial "Run 3:"
+    refute_output --partial "Run 4:"
+
+    assert_mock_called_with "$TEST_TEMP_DIR/zsh_calls.log" "zsh -i -c exit"
+    assert_equal "$(wc -l < "$TEST_TEMP_DIR/zsh_calls.log" | tr -d ' ')" "4"
+}
+
+@test "reports min, median, mean and max" {
+    create_mock_zsh 0
+
+    run "$UTILITY_SCRIPTS_PATH/benchmark_zsh_startup.sh" 5 1000
+
+    assert_success
+    assert_output --partial "Min:"
+    assert_output --partial "Median:"
+    assert_output --partial "Mean:"
+    assert_output --partial "Max:"
+    assert_output --partial "within the budget of 1000ms"
+}
+
+@test "fails when average startup time exceeds the budget" {
+    create_mock_zsh 0.2
+
+    run "$UTILITY_SCRIPTS_PATH/benchmark_zsh_startup.sh" 2 50
+
+    assert_failure
+    assert_output --partial "exceeds the budget of 50ms"
+}
+
+@test "uses 10 runs and 300ms budget by default" {
+    create_mock_zsh 0
+
+    run "$UTILITY_SCRIPTS_PATH/benchmark_zsh_startup.sh"
+
+    assert_success
+    assert_output --partial "Run 10:"
+    assert_output --partial "budget 300 ms"
+}
+
+@test "rejects invalid number of runs" {
+    create_mock_zsh 0
+
+    run "$UTILITY_SCRIPTS_PATH/benchmark_zsh_startup.sh" abc
+
+    assert_failure
+    assert_output --partial "must be positive numbers"
+    assert_no_mock_calls "$TEST_TEMP_DIR/zsh_calls.log"
+}
+
+@test "fails when zsh can't start" {
+    cat > "$TEST_TEMP_DIR/mock_zsh" << 'EOF'
+#!/usr/bin/env bash
+exit 1
+EOF
+    chmod +x "$TEST_TEMP_DIR/mock_zsh"
+
+    run "$UTILITY_SCRIPTS_PATH/benchmark_zsh_startup.sh" 3
+
+    assert_failure
+    assert_output --partial "Failed to start interactive zsh"
+}
+
+@test "profile mode runs a single startup with profiling enabled" {
+    create_mock_zsh 0
+
+    run "$UTILITY_SCRIPTS_PATH/benchmark_zsh_startup.sh" --profile
+
+    assert_success
+    assert_mock_called_with "$TEST_TEMP_DIR/zsh_calls.log" "zsh -i -c exit (profile: 1)"
+    assert_equal "$(wc -l < "$TEST_TEMP_DIR/zsh_calls.log" | tr -d ' ')" "1"
+}
@@ -12,13 +12,13 @@ setup() {
     echo "REACT_APP_API_URL=https://dev1-mysky.com/api" > "$TEST_TEMP_DIR/mock_projects/app_shell/.env.local"
     echo "REACT_APP_API_URL=https://dev1-mysky.com/api" > "$TEST_TEMP_DIR/mock_projects/mysky_spend/.env.local"
     
-    # Create mock launch script that logs calls
-    cat > "$TEST_TEMP_DIR/launch_appshell_and_spend_dev_servers.sh" << 'EOF'
+    # Create mock dev server supervisor that logs calls
+    cat > "$TEST_TEMP_DIR/dev_servers.sh" << 'EOF'
 #!/usr/bin/env zsh
-echo "mock_launcher_called" >> "$TEST_TEMP_DIR/script_calls.log"
+echo "dev_servers.sh $*" >> "$TEST_TEMP_DIR/script_calls.log"
 exit 0
 EOF
-    chmod +x "$TEST_TEMP_DIR/launch_appshell_and_spend_dev_servers.sh"
+    chmod +x "$TEST_TEMP_DIR/dev_servers.sh"
     
     # Create a mock sed wrapper script that handles the new -E pattern
     cat > "$TEST_TEMP_DIR/mock_sed_wrapper.sh" << EOF
@@ -72,7 +72,7 @@ if [ -z "$1" ]
 printf "Restarting App-Shell and Spend dev servers...\n\n"
 
 DIRNAME=$(dirname "$0")
-$DIRNAME/launch_appshell_and_spend_dev_servers.sh
+$DIRNAME/dev_servers.sh restart appshell spend
 SCRIPT_EOF
 
     # Replace placeholder with actual TEST_TEMP_DIR
@@ -91,8 +91,8 @@ teardown() {
     assert_output --partial "Dev server in App-Shell and Spend changed to 5"
     assert_output --partial "Restarting App-Shell and Spend dev servers..."
     
-    # Verify launcher script was called
-    assert_mock_called_with "$TEST_TEMP_DIR/script_calls.log" "mock_launcher_called"
+    # Verify dev servers were restarted through the supervisor
+    assert_mock_called_with "$TEST_TEMP_DIR/script_calls.log" "dev_servers.sh restart appshell spend"
 }
 
 @test "prompts for server when no argument provided" {
@@ -130,8 +130,8 @@ teardown() {
 
     assert_success
 
-    # Verify launcher script was called
-    assert_mock_called_with "$TEST_TEMP_DIR/script_calls.log" "mock_launcher_called"
+    # Verify dev servers were restarted through the supervisor
+    assert_mock_called_with "$TEST_TEMP_DIR/script_calls.log" "dev_servers.sh restart appshell spend"
 }
 
 @test "uses correct sed pattern for dev server replacement" {
@@ -178,7 +178,7 @@ teardown() {
     assert_success
 
     # Verify the launcher script was found and executed
-    assert_mock_called_with "$TEST_TEMP_DIR/script_calls.log" "mock_launcher_called"
+    assert_mock_called_with "$TEST_TEMP_DIR/script_calls.log" "dev_servers.sh restart appshell spend"
 }
 
 @test "handles empty interactive input gracefully" {
@@ -197,7 +197,7 @@ teardown() {
     assert_output --partial "Restarting App-Shell and Spend dev servers..."
 
     # This message should appear before the launcher is called
-    assert_mock_called_with "$TEST_TEMP_DIR/script_calls.log" "mock_launcher_called"
+    assert_mock_called_with "$TEST_TEMP_DIR/script_calls.log" "dev_servers.sh restart appshell spend"
 }
 
 @test "handles different server names" {
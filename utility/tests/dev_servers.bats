@@ -0,0 +1,283 @@
+#!/usr/bin/env bats
+
+load test_helper
+
+setup() {
+    setup_test_environment
+
+    # dev_servers.sh signals real background processes and checks their start time
+    rm -f "$TEST_TEMP_DIR/kill" "$TEST_TEMP_DIR/ps"
+
+    export DEV_SERVERS_CONFIG="$TEST_TEMP_DIR/dev_servers.conf"
+    export DEV_SERVERS_STATE_DIR="$TEST_TEMP_DIR/state"
+
+    # Mock nc, a port is open while its marker file exists
+    cat > "$TEST_TEMP_DIR/nc" << 'EOF'
+#!/usr/bin/env bash
+echo "nc $*" >> "$TEST_TEMP_DIR/nc_calls.log"
+[ -f "$TEST_TEMP_DIR/open_port_$3" ]
+EOF
+    chmod +x "$TEST_TEMP_DIR/nc"
+
+    # Fake dev server: opens port $1 after $2 seconds, ignores SIGTERM when $3 is "stubborn"
+    cat > "$TEST_TEMP_DIR/fake_server" << 'EOF'
+#!/usr/bin/env bash
+echo "started in $(pwd)"
+if [ "$3" = "stubborn" ]; then
+    trap '' TERM
+else
+    trap 'rm -f "$TEST_TEMP_DIR/open_port_$1"; exit 0' TERM
+fi
+sleep "${2:-0}"
+touch "$TEST_TEMP_DIR/open_port_$1"
+while true; do sleep 0.1; done
+EOF
+    chmod +x "$TEST_TEMP_DIR/fake_server"
+
+    cat > "$DEV_SERVERS_CONFIG" << EOF
+# test services
+appshell | $MOCK_APPSHELL_DIR | $TEST_TEMP_DIR/fake_server 3000 0.3 | 3000
+spend    | $MOCK_SPEND_DIR    | $TEST_TEMP_DIR/fake_server 3001 0   | 3001
+EOF
+}
+
+teardown() {
+    # make sure no fake server outlives the test
+    for pidFile in "$DEV_SERVERS_STATE_DIR"/*.pid; do
+        [ -f "$pidFile" ] && kill -9 -- "-$(cat "$pidFile")" 2>/dev/null
+    done
+    rm -f "$TEST_TEMP_DIR/open_port_"*
+    teardown_utility_tests
+}
+
+@test "lists services from the registry" {
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" list
+
+    assert_success
+    assert_output --partial "appshell"
+    assert_output --partial "port 3000"
+    assert_output --partial "spend"
+    assert_output --partial "port 3001"
+    refute_output --partial "test services"
+}
+
+@test "starts all services and waits until their ports are open" {
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" start
+
+    assert_success
+    assert_output --partial "Launching appshell on port 3000..."
+    assert_output --partial "Launching spend on port 3001..."
+    assert_output --partial "appshell is ready on port 3000"
+    assert_output --partial "spend is ready on port 3001"
+    assert_file_exist "$DEV_SERVERS_STATE_DIR/appshell.pid"
+    assert_file_exist "$DEV_SERVERS_STATE_DIR/spend.pid"
+    assert_file_contains "$DEV_SERVERS_STATE_DIR/appshell.log" "started in $MOCK_APPSHELL_DIR"
+}
+
+@test "does not start a service that is already running" {
+    "$UTILITY_SCRIPTS_PATH/dev_servers.sh" start spend
+
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" start spend
+
+    assert_success
+    assert_output --partial "spend is already running on port 3001"
+    refute_output --partial "Launching spend"
+}
+
+@test "stops services and removes their pid files" {
+    "$UTILITY_SCRIPTS_PATH/dev_servers.sh" start
+    appshellPid=$(cat "$DEV_SERVERS_STATE_DIR/appshell.pid")
+
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" stop
+
+    assert_success
+    assert_output --partial "Terminating appshell (pid $appshellPid, port 3000)..."
+    assert_output --partial "appshell stopped in"
+    assert_output --partial "spend stopped in"
+    assert_file_not_exist "$DEV_SERVERS_STATE_DIR/appshell.pid"
+    assert_file_not_exist "$TEST_TEMP_DIR/open_port_3000"
+    run kill -0 "$appshellPid"
+    assert_failure
+}
+
+@test "does not signal a process that reused the pid of a service" {
+    sleep 30 &
+    strangerPid=$!
+    mkdir -p "$DEV_SERVERS_STATE_DIR"
+    printf "%s\n%s\n" "$strangerPid" "Thu Jan  1 00:00:00 1970" > "$DEV_SERVERS_STATE_DIR/spend.pid"
+    
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" stop spend
+    
+    assert_success
+    assert_output --partial "spend is not running"
+    assert_file_not_exist "$DEV_SERVERS_STATE_DIR/spend.pid"
+    run kill -0 "$strangerPid"
+    assert_success
+    kill "$strangerPid"
+}
+
+@test "sends SIGKILL when a service ignores SIGTERM for longer than the timeout" {
+    cat > "$DEV_SERVERS_CONFIG" << EOF
+stubborn | $MOCK_APPSHELL_DIR | $TEST_TEMP_DIR/fake_server 3000 0 stubborn | 3000
+EOF
+    "$UTILITY_SCRIPTS_PATH/dev_servers.sh" start
+    pid=$(cat "$DEV_SERVERS_STATE_DIR/stubborn.pid")
+    rm -f "$TEST_TEMP_DIR/open_port_3000"
+
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" stop --timeout 1
+
+    assert_success
+    assert_output --partial "stubborn is still running after 1s, sending SIGKILL..."
+    assert_output --partial "stubborn stopped in"
+    run kill -0 "$pid"
+    assert_failure
+}
+
+@test "hard stop kills services right away" {
+    "$UTILITY_SCRIPTS_PATH/dev_servers.sh" start spend
+    rm -f "$TEST_TEMP_DIR/open_port_3001"
+
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" stop spend --hard
+
+    assert_success
+    assert_output --partial "Killing spend"
+    refute_output --partial "Terminating spend"
+}
+
+@test "stop fails when a service keeps its port open" {
+    "$UTILITY_SCRIPTS_PATH/dev_servers.sh" start spend
+
+    # SIGKILL skips the cleanup of the fake server, so its port stays open
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" stop spend --hard
+
+    assert_failure
+    assert_output --partial "Error: Failed to stop spend"
+}
+
+@test "restart does not start a service that could not be stopped" {
+    "$UTILITY_SCRIPTS_PATH/dev_servers.sh" start spend
+
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" restart spend --hard
+
+    assert_failure
+    assert_output --partial "Error: spend could not be stopped and will not be started again"
+    refute_output --partial "spend is already running"
+    refute_output --partial "Launching spend"
+}
+
+@test "restart reports latency of every service" {
+    "$UTILITY_SCRIPTS_PATH/dev_servers.sh" start
+    oldPid=$(cat "$DEV_SERVERS_STATE_DIR/spend.pid")
+
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" restart
+
+    assert_success
+    assert_output --partial "Restarting appshell spend..."
+    assert_output --partial "appshell stopped in"
+    assert_output --regexp "appshell +[0-9]+\.[0-9]s \(stop [0-9]+\.[0-9]s, ready [0-9]+\.[0-9]s\)"
+    assert_output --regexp "spend +[0-9]+\.[0-9]s \(stop [0-9]+\.[0-9]s, ready [0-9]+\.[0-9]s\)"
+    refute [ "$(cat "$DEV_SERVERS_STATE_DIR/spend.pid")" = "$oldPid" ]
+}
+
+@test "restart of a single service leaves the others alone" {
+    "$UTILITY_SCRIPTS_PATH/dev_servers.sh" start
+    appshellPid=$(cat "$DEV_SERVERS_STATE_DIR/appshell.pid")
+
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" restart spend
+
+    assert_success
+    refute_output --partial "appshell"
+    assert_equal "$(cat "$DEV_SERVERS_STATE_DIR/appshell.pid")" "$appshellPid"
+}
+
+@test "stops a listener that was started outside of the supervisor with killport" {
+    touch "$TEST_TEMP_DIR/open_port_3000"
+    cat > "$TEST_TEMP_DIR/killport.sh" << 'EOF'
+#!/usr/bin/env bash
+echo "killport.sh $*" >> "$TEST_TEMP_DIR/killport_calls.log"
+rm -f "$TEST_TEMP_DIR/open_port_3000"
+EOF
+    chmod +x "$TEST_TEMP_DIR/killport.sh"
+    
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" stop appshell --timeout 2
+    
+    assert_success
+    assert_output --partial "Stopping appshell on port 3000, it was not started by dev_servers.sh..."
+    assert_output --partial "appshell stopped in"
+    assert_mock_called_with "$TEST_TEMP_DIR/killport_calls.log" "killport.sh --timeout 2 3000"
+}
+
+@test "reports a failed killport and passes --hard to it" {
+    touch "$TEST_TEMP_DIR/open_port_3000"
+    cat > "$TEST_TEMP_DIR/killport.sh" << 'EOF'
+#!/usr/bin/env bash
+echo "killport.sh $*" >> "$TEST_TEMP_DIR/killport_calls.log"
+exit 1
+EOF
+    chmod +x "$TEST_TEMP_DIR/killport.sh"
+    
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" stop appshell --hard
+    
+    assert_failure
+    assert_output --partial "Error: Failed to stop appshell"
+    assert_mock_called_with "$TEST_TEMP_DIR/killport_calls.log" "killport.sh --hard --timeout 5 3000"
+}
+
+@test "reports a service that exits before opening its port" {
+    cat > "$DEV_SERVERS_CONFIG" << EOF
+broken | $MOCK_APPSHELL_DIR | echo "compilation failed"; exit 1 | 3000
+EOF
+
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" start
+
+    assert_failure
+    assert_output --partial "Error: broken exited before opening port 3000"
+    assert_output --partial "compilation failed"
+}
+
+@test "shows status of services" {
+    "$UTILITY_SCRIPTS_PATH/dev_servers.sh" start spend
+
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" status
+
+    assert_success
+    assert_output --regexp "appshell +stopped"
+    assert_output --regexp "spend +running +[0-9]+ +3001\*"
+}
+
+@test "fails on unknown service" {
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" restart unknown
+
+    assert_failure
+    assert_output --partial "Error: Unknown service unknown, available services: appshell spend"
+}
+
+@test "fails when the registry is missing" {
+    export DEV_SERVERS_CONFIG="$TEST_TEMP_DIR/missing.conf"
+
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" status
+
+    assert_failure
+    assert_output --partial "Error: Service registry not found"
+}
+
+@test "requires a number of seconds after --timeout and --ready-timeout" {
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" stop --timeout
+    
+    assert_failure
+    assert_output --partial "Error: --timeout requires a number of seconds"
+    assert_output --partial "Usage: dev_servers.sh"
+    
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" start --ready-timeout later
+    
+    assert_failure
+    assert_output --partial "Error: --ready-timeout requires a number of seconds"
+    refute_output --partial "Launching"
+}
+
+@test "prints usage on unknown command" {
+    run "$UTILITY_SCRIPTS_PATH/dev_servers.sh" bounce
+
+    assert_failure
+    assert_output --partial "Usage: dev_servers.sh"
+}
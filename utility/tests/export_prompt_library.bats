@@ -3,13 +3,12 @@
 load test_helper
 
 setup() {
-    # Skip mock launch scripts creation for this test
-    export SKIP_MOCK_LAUNCH_SCRIPTS="true"
     setup_test_environment
     
     # Create a modified version of the script that uses our test paths
     sed "s|SOURCE_DIR=\"/Users/user/My stuff/Coding/llm_stuff/prompt_library/prompt_library\"|SOURCE_DIR=\"$MOCK_PROMPT_LIBRARY_SOURCE\"|g; s|DEST_DIR=\"/Users/user/Downloads/exported-prompts\"|DEST_DIR=\"$MOCK_DOWNLOADS_DIR/exported-prompts\"|g" \
         "$UTILITY_SCRIPTS_PATH/export_prompt_library.sh" > "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    chmod +x "$TEST_TEMP_DIR/test_export_prompt_library.sh"
 }
 
 teardown() {
@@ -17,7 +16,7 @@ teardown() {
 }
 
 @test "successfully exports prompt library when source exists" {
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_success
     assert_output --partial "Exporting prompt library entries..."
@@ -31,7 +30,7 @@ teardown() {
     # Remove the destination directory
     rm -rf "$MOCK_DOWNLOADS_DIR/exported-prompts"
     
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_success
     assert_output --partial "Creating destination directory: $MOCK_DOWNLOADS_DIR/exported-prompts"
@@ -44,7 +43,7 @@ teardown() {
     # Remove the source directory
     rm -rf "$MOCK_PROMPT_LIBRARY_SOURCE"
     
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_failure
     assert_output --partial "Error: Source directory does not exist: $MOCK_PROMPT_LIBRARY_SOURCE"
@@ -54,12 +53,13 @@ teardown() {
 }
 
 @test "copies all files recursively and flattens directory structure" {
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_success
     
-    # Verify find command was called with correct parameters
-    assert_mock_called_with "$TEST_TEMP_DIR/find_calls.log" "find $MOCK_PROMPT_LIBRARY_SOURCE -type f -exec cp {} $MOCK_DOWNLOADS_DIR/exported-prompts/ ;"
+    # Verify all files were copied with a single cp call
+    assert_equal "$(wc -l < "$TEST_TEMP_DIR/cp_calls.log" | tr -d ' ')" "1"
+    assert_mock_called_with "$TEST_TEMP_DIR/cp_calls.log" "cp -p -- $MOCK_PROMPT_LIBRARY_SOURCE/prompt1.txt $MOCK_PROMPT_LIBRARY_SOURCE/prompt2.md $MOCK_PROMPT_LIBRARY_SOURCE/subdir/nested.txt $MOCK_DOWNLOADS_DIR/exported-prompts/"
     
     # Verify files were copied and flattened
     assert_file_exists "$MOCK_DOWNLOADS_DIR/exported-prompts/prompt1.txt"
@@ -68,7 +68,7 @@ teardown() {
 }
 
 @test "preserves file contents during export" {
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_success
     
@@ -82,7 +82,7 @@ teardown() {
     # Pre-create destination directory
     mkdir -p "$MOCK_DOWNLOADS_DIR/exported-prompts"
     
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_success
     
@@ -94,7 +94,7 @@ teardown() {
 }
 
 @test "displays informative messages during export process" {
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_success
     
@@ -106,13 +106,17 @@ teardown() {
     assert_output --partial "📁 All files have been copied to a single directory without subdirectories"
 }
 
-@test "uses correct find command with exec cp" {
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+@test "copies files in bulk instead of one cp call per file" {
+    for i in $(seq 1 20); do
+        echo "Prompt $i" > "$MOCK_PROMPT_LIBRARY_SOURCE/bulk_$i.txt"
+    done
     
-    assert_success
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
-    # Verify the exact find command used
-    assert_mock_called_with "$TEST_TEMP_DIR/find_calls.log" "find $MOCK_PROMPT_LIBRARY_SOURCE -type f -exec cp {} $MOCK_DOWNLOADS_DIR/exported-prompts/ ;"
+    assert_success
+    assert_output --partial "Copied: 23, unchanged: 0, removed: 0"
+    assert_equal "$(wc -l < "$TEST_TEMP_DIR/cp_calls.log" | tr -d ' ')" "1"
+    assert_file_exists "$MOCK_DOWNLOADS_DIR/exported-prompts/bulk_20.txt"
 }
 
 @test "handles empty source directory" {
@@ -120,26 +124,28 @@ teardown() {
     rm -rf "$MOCK_PROMPT_LIBRARY_SOURCE"/*
     rm -rf "$MOCK_PROMPT_LIBRARY_SOURCE"/subdir
     
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_success
     assert_output --partial "✅ Successfully exported prompt library entries"
     
-    # Find command should still be called
-    assert_mock_called_with "$TEST_TEMP_DIR/find_calls.log" "find $MOCK_PROMPT_LIBRARY_SOURCE -type f -exec cp {} $MOCK_DOWNLOADS_DIR/exported-prompts/ ;"
+    assert_output --partial "Copied: 0, unchanged: 0, removed: 0"
+    
+    # Nothing to copy
+    assert_no_mock_calls "$TEST_TEMP_DIR/cp_calls.log"
 }
 
 @test "exits with error code 1 when source doesn't exist" {
     rm -rf "$MOCK_PROMPT_LIBRARY_SOURCE"
     
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_failure
     [ "$status" -eq 1 ]
 }
 
 @test "checks source directory before attempting export" {
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_success
     
@@ -153,7 +159,7 @@ teardown() {
     # Create a file with spaces in the name
     echo "Spaced file content" > "$MOCK_PROMPT_LIBRARY_SOURCE/file with spaces.txt"
     
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_success
     
@@ -167,7 +173,7 @@ teardown() {
     echo "Special content" > "$MOCK_PROMPT_LIBRARY_SOURCE/file-with-dashes.txt"
     echo "Underscore content" > "$MOCK_PROMPT_LIBRARY_SOURCE/file_with_underscores.txt"
     
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_success
     
@@ -177,7 +183,7 @@ teardown() {
 }
 
 @test "uses absolute paths for source and destination" {
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_success
     
@@ -191,11 +197,157 @@ teardown() {
 }
 
 @test "reports success with emoji and descriptive message" {
-    run bash "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
     
     assert_success
     
     # Verify success message format
     assert_output --partial "✅ Successfully exported prompt library entries to $MOCK_DOWNLOADS_DIR/exported-prompts"
     assert_output --partial "📁 All files have been copied to a single directory without subdirectories"
-}
\ No newline at end of file
+}
+
+@test "second run copies nothing when the library is unchanged" {
+    "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    rm -f "$TEST_TEMP_DIR/cp_calls.log"
+    
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    
+    assert_success
+    assert_output --partial "Copied: 0, unchanged: 3, removed: 0"
+    assert_no_mock_calls "$TEST_TEMP_DIR/cp_calls.log"
+}
+
+@test "writes a manifest with path, size, mtime, hash and exported name" {
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    
+    assert_success
+    assert_file_exists "$MOCK_DOWNLOADS_DIR/exported-prompts/.export_manifest"
+    
+    hash=$(shasum -a 256 "$MOCK_PROMPT_LIBRARY_SOURCE/subdir/nested.txt" 2>/dev/null || sha256sum "$MOCK_PROMPT_LIBRARY_SOURCE/subdir/nested.txt")
+    tab=$'\t'
+    assert_file_contains "$MOCK_DOWNLOADS_DIR/exported-prompts/.export_manifest" "^subdir/nested.txt${tab}14${tab}[0-9]*${tab}${hash%% *}${tab}nested.txt$"
+}
+
+@test "copies only changed and new files" {
+    "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    rm -f "$TEST_TEMP_DIR/cp_calls.log"
+    
+    echo "Prompt 1 content, updated" > "$MOCK_PROMPT_LIBRARY_SOURCE/prompt1.txt"
+    echo "New prompt" > "$MOCK_PROMPT_LIBRARY_SOURCE/prompt3.txt"
+    
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    
+    assert_success
+    assert_output --partial "Copied: 2, unchanged: 2, removed: 0"
+    assert_file_contains "$MOCK_DOWNLOADS_DIR/exported-prompts/prompt1.txt" "Prompt 1 content, updated"
+    assert_file_contains "$MOCK_DOWNLOADS_DIR/exported-prompts/prompt3.txt" "New prompt"
+    refute grep -q "prompt2.md" "$TEST_TEMP_DIR/cp_calls.log"
+}
+
+@test "does not copy touched files with unchanged content" {
+    "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    rm -f "$TEST_TEMP_DIR/cp_calls.log"
+    
+    touch -d "2030-01-01 00:00:00" "$MOCK_PROMPT_LIBRARY_SOURCE/prompt2.md" 2>/dev/null ||
+        touch -t 203001010000 "$MOCK_PROMPT_LIBRARY_SOURCE/prompt2.md"
+    
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    
+    assert_success
+    assert_output --partial "Copied: 0, unchanged: 3, removed: 0"
+    assert_no_mock_calls "$TEST_TEMP_DIR/cp_calls.log"
+}
+
+@test "recopies exported files that were deleted from the destination" {
+    "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    rm "$MOCK_DOWNLOADS_DIR/exported-prompts/prompt2.md"
+    
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    
+    assert_success
+    assert_output --partial "Copied: 1, unchanged: 2, removed: 0"
+    assert_file_exists "$MOCK_DOWNLOADS_DIR/exported-prompts/prompt2.md"
+}
+
+@test "removes exported copies of deleted sources" {
+    "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    rm "$MOCK_PROMPT_LIBRARY_SOURCE/subdir/nested.txt"
+    
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    
+    assert_success
+    assert_output --partial "removed: 1"
+    assert_file_not_exists "$MOCK_DOWNLOADS_DIR/exported-prompts/nested.txt"
+    assert_file_exists "$MOCK_DOWNLOADS_DIR/exported-prompts/prompt1.txt"
+}
+
+@test "resolves files with the same name in different subdirectories" {
+    mkdir -p "$MOCK_PROMPT_LIBRARY_SOURCE/other"
+    echo "Other nested prompt" > "$MOCK_PROMPT_LIBRARY_SOURCE/other/nested.txt"
+    echo "Root prompt" > "$MOCK_PROMPT_LIBRARY_SOURCE/prompt1.md"
+    mkdir -p "$MOCK_PROMPT_LIBRARY_SOURCE/subdir/deep"
+    echo "Deep prompt 1" > "$MOCK_PROMPT_LIBRARY_SOURCE/subdir/deep/prompt2.md"
+    
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    
+    assert_success
+    assert_file_contains "$MOCK_DOWNLOADS_DIR/exported-prompts/other__nested.txt" "Other nested prompt"
+    assert_file_contains "$MOCK_DOWNLOADS_DIR/exported-prompts/subdir__nested.txt" "Nested prompt"
+    assert_file_not_exists "$MOCK_DOWNLOADS_DIR/exported-prompts/nested.txt"
+    
+    # The file in the library root keeps its name
+    assert_file_contains "$MOCK_DOWNLOADS_DIR/exported-prompts/prompt2.md" "Prompt 2 content"
+    assert_file_contains "$MOCK_DOWNLOADS_DIR/exported-prompts/subdir__deep__prompt2.md" "Deep prompt 1"
+}
+
+@test "gives a numeric suffix to generated names that are already taken" {
+    mkdir -p "$MOCK_PROMPT_LIBRARY_SOURCE/other"
+    echo "Other nested prompt" > "$MOCK_PROMPT_LIBRARY_SOURCE/other/nested.txt"
+    echo "Root prompt" > "$MOCK_PROMPT_LIBRARY_SOURCE/subdir__nested.txt"
+    
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    
+    assert_success
+    assert_file_contains "$MOCK_DOWNLOADS_DIR/exported-prompts/subdir__nested.txt" "Root prompt"
+    assert_file_contains "$MOCK_DOWNLOADS_DIR/exported-prompts/subdir__nested_2.txt" "Nested prompt"
+    assert_file_contains "$MOCK_DOWNLOADS_DIR/exported-prompts/other__nested.txt" "Other nested prompt"
+}
+
+@test "full export still removes exported copies of deleted sources" {
+    "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    rm "$MOCK_PROMPT_LIBRARY_SOURCE/subdir/nested.txt"
+    
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh" --full
+    
+    assert_success
+    assert_output --partial "Copied: 2, unchanged: 0, removed: 1"
+    assert_file_not_exists "$MOCK_DOWNLOADS_DIR/exported-prompts/nested.txt"
+}
+
+@test "full export copies every file again" {
+    "$TEST_TEMP_DIR/test_export_prompt_library.sh"
+    
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh" --full
+    
+    assert_success
+    assert_output --partial "Copied: 3, unchanged: 0, removed: 0"
+}
+
+@test "creates a single archive of the exported files" {
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh" --archive "$TEST_TEMP_DIR/prompts.tar.gz"
+    
+    assert_success
+    assert_output --partial "📦 Archive created: $TEST_TEMP_DIR/prompts.tar.gz"
+    
+    run tar -tzf "$TEST_TEMP_DIR/prompts.tar.gz"
+    assert_output --partial "prompt1.txt"
+    assert_output --partial "nested.txt"
+    refute_output --partial ".export_manifest"
+}
+
+@test "creates the archive next to the destination directory by default" {
+    run "$TEST_TEMP_DIR/test_export_prompt_library.sh" --archive
+    
+    assert_success
+    assert_file_exists "$MOCK_DOWNLOADS_DIR/exported-prompts.tar.gz"
+}
@@ -20,7 +20,7 @@ teardown() {
     assert_output --partial "Process on port 3000 terminated"
     
     # Verify lsof was called to find the process
-    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -ti:3000"
+    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -nP -iTCP:3000 -sTCP:LISTEN -Fpn"
     
     # Verify kill was called with SIGTERM (-15)
     assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 12345"
@@ -35,7 +35,7 @@ teardown() {
     assert_output --partial "No process on port 8080"
     
     # Verify lsof was called
-    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -ti:8080"
+    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -nP -iTCP:8080 -sTCP:LISTEN -Fpn"
     
     # Verify kill was not called
     assert_no_mock_calls "$TEST_TEMP_DIR/kill_calls.log"
@@ -53,10 +53,11 @@ teardown() {
     assert_output --partial "Process on port 3000 terminated"
     
     # Verify lsof was called
-    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -ti:3000"
+    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -nP -iTCP:3000 -sTCP:LISTEN -Fpn"
     
-    # Should attempt to kill the first PID found
+    # Every process listening on the port is killed
     assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 12345"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 67890"
 }
 
 @test "works with standard web development ports" {
@@ -89,25 +90,37 @@ teardown() {
     assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 33333"
 }
 
-@test "handles invalid port argument gracefully" {
-    # The script doesn't validate port numbers, so this should still work
-    # but lsof will return nothing
-    
+@test "rejects invalid port argument" {
     run "$UTILITY_SCRIPTS_PATH/killport.sh" "invalid"
     
-    assert_success
-    assert_output --partial "No process on port invalid"
-    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -ti:invalid"
+    assert_failure
+    assert_output --partial "Error: Invalid port invalid"
+    
+    # Nothing is scanned or killed
+    assert_no_mock_calls "$TEST_TEMP_DIR/lsof_calls.log"
+    assert_no_mock_calls "$TEST_TEMP_DIR/kill_calls.log"
 }
 
 @test "requires port argument" {
     run "$UTILITY_SCRIPTS_PATH/killport.sh"
     
-    assert_success
-    assert_output --partial "No process on port"
+    assert_failure
+    assert_output --partial "Usage: killport.sh"
+    assert_no_mock_calls "$TEST_TEMP_DIR/lsof_calls.log"
+}
+
+@test "requires a number of seconds after --timeout" {
+    run "$UTILITY_SCRIPTS_PATH/killport.sh" 3000 --timeout
+    
+    assert_failure
+    assert_output --partial "Error: --timeout requires a number of seconds"
+    assert_output --partial "Usage: killport.sh"
     
-    # Should still call lsof but with empty port
-    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -ti:"
+    run "$UTILITY_SCRIPTS_PATH/killport.sh" --timeout soon 3000
+    
+    assert_failure
+    assert_output --partial "Error: --timeout requires a number of seconds"
+    assert_no_mock_calls "$TEST_TEMP_DIR/kill_calls.log"
 }
 
 @test "uses SIGTERM signal for graceful termination" {
@@ -124,4 +137,153 @@ teardown() {
     if grep -q "kill -9" "$TEST_TEMP_DIR/kill_calls.log" 2>/dev/null; then
         fail "Script should use SIGTERM (-15), not SIGKILL (-9)"
     fi
-}
\ No newline at end of file
+}
+
+@test "terminates listeners of several ports and ranges with a single lsof scan" {
+    create_mock_process "3000" "11111"
+    create_mock_process "3005" "22222"
+    create_mock_process "5173" "33333"
+    
+    run "$UTILITY_SCRIPTS_PATH/killport.sh" 3000-3010 5173
+    
+    assert_success
+    assert_output --partial "Process on port 3000 terminated"
+    assert_output --partial "Process on port 3005 terminated"
+    assert_output --partial "Process on port 5173 terminated"
+    
+    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -nP -iTCP:3000-3010,5173 -sTCP:LISTEN -Fpn"
+    assert_equal "$(wc -l < "$TEST_TEMP_DIR/lsof_calls.log" | tr -d ' ')" "1"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 11111"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 22222"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 33333"
+}
+
+@test "reports empty ranges and ports" {
+    create_mock_process "5173" "33333"
+    
+    run "$UTILITY_SCRIPTS_PATH/killport.sh" 3000-3010,8080 5173
+    
+    assert_success
+    assert_output --partial "Process on port 5173 terminated"
+    assert_output --partial "No process on port 8080"
+    refute_output --partial "No process on port 3000"
+}
+
+@test "terminates the whole process tree of the listener" {
+    create_mock_process "3000" "12345"
+    create_mock_child_process "12346" "12345"
+    create_mock_child_process "12347" "12346"
+    create_mock_child_process "50000" "1"
+    
+    run "$UTILITY_SCRIPTS_PATH/killport.sh" 3000
+    
+    assert_success
+    assert_output --partial "Process on port 3000 terminated with 2 child process(es)"
+    assert_mock_called_with "$TEST_TEMP_DIR/ps_calls.log" "ps -A -o pid= -o ppid="
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 12346"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 12347"
+    refute grep -q "50000" "$TEST_TEMP_DIR/kill_calls.log"
+}
+
+@test "sends SIGKILL to processes that ignore SIGTERM after the timeout" {
+    create_mock_process "3000" "12345"
+    
+    # Mock kill that ignores SIGTERM
+    cat > "$TEST_TEMP_DIR/kill" << 'MOCK'
+#!/usr/bin/env bash
+echo "kill $*" >> "$TEST_TEMP_DIR/kill_calls.log"
+case "$1" in
+    "-9") rm -f "$TEST_TEMP_DIR/mock_process_by_pid_$2";;
+    "-s") [ -f "$TEST_TEMP_DIR/mock_process_by_pid_$3" ] || exit 1;;
+esac
+exit 0
+MOCK
+    chmod +x "$TEST_TEMP_DIR/kill"
+    
+    run "$UTILITY_SCRIPTS_PATH/killport.sh" --timeout 1 3000
+    
+    assert_success
+    assert_output --partial "Process on port 3000 terminated, SIGKILL was sent after 1s timeout"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 12345"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -9 12345"
+}
+
+@test "fails when a process survives SIGKILL" {
+    create_mock_process "3000" "12345"
+    
+    # Mock kill that can't kill anything
+    cat > "$TEST_TEMP_DIR/kill" << 'MOCK'
+#!/usr/bin/env bash
+echo "kill $*" >> "$TEST_TEMP_DIR/kill_calls.log"
+exit 0
+MOCK
+    chmod +x "$TEST_TEMP_DIR/kill"
+    
+    run "$UTILITY_SCRIPTS_PATH/killport.sh" --timeout 0 3000
+    
+    assert_failure
+    assert_output --partial "Failed to terminate process on port 3000"
+}
+
+@test "finds listeners through /proc without lsof" {
+    create_mock_proc_process "12345" "1" "3000"
+    create_mock_proc_process "12346" "12345"
+    create_mock_proc_process "22222" "1" "5173" "tcp6"
+    create_mock_proc_process "33333" "1" "8080"
+    
+    run "$UTILITY_SCRIPTS_PATH/killport.sh" 3000-3001 5173
+    
+    assert_success
+    assert_output --partial "Process on port 3000 terminated with 1 child process(es)"
+    assert_output --partial "Process on port 5173 terminated"
+    refute_output --partial "8080"
+    
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 12345"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 12346"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 22222"
+    refute grep -q "33333" "$TEST_TEMP_DIR/kill_calls.log"
+    assert_no_mock_calls "$TEST_TEMP_DIR/lsof_calls.log"
+    assert_no_mock_calls "$TEST_TEMP_DIR/ps_calls.log"
+}
+
+@test "falls back to lsof for sockets that are not visible in /proc" {
+    create_mock_proc_process "12345" "1" "3000"
+    # socket of another user's process, its fd links can't be read
+    rm "$TEST_TEMP_DIR/proc/12345/fd/3"
+    create_mock_process "3000" "12345"
+    
+    run "$UTILITY_SCRIPTS_PATH/killport.sh" 3000 5173
+    
+    assert_success
+    assert_output --partial "Process on port 3000 terminated"
+    assert_output --partial "No process on port 5173"
+    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -nP -iTCP:3000 -sTCP:LISTEN -Fpn"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 12345"
+}
+
+@test "never signals init" {
+    create_mock_proc_process "1" "0" "3000"
+    create_mock_proc_process "12345" "1" "5173"
+    
+    run "$UTILITY_SCRIPTS_PATH/killport.sh" 3000 5173
+    
+    assert_failure
+    assert_output --partial "Refusing to terminate process on port 3000, PID 1 is init or runs killport"
+    assert_output --partial "Process on port 5173 terminated"
+    refute grep -q "kill -15 1$" "$TEST_TEMP_DIR/kill_calls.log"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -15 12345"
+}
+
+@test "never signals the ancestors of killport" {
+    # the listener is e.g. the IDE whose terminal runs killport
+    create_mock_proc_process "5000" "1" "3000"
+    create_mock_proc_process "5001" "5000"
+    
+    run bash -c 'mkdir -p "$TEST_TEMP_DIR/proc/$$" &&
+        echo "$$ (zsh) S 5000 $$ $$ 0 -1 4194560" > "$TEST_TEMP_DIR/proc/$$/stat" &&
+        exec "$UTILITY_SCRIPTS_PATH/killport.sh" 3000'
+    
+    assert_failure
+    assert_output --partial "Refusing to terminate process on port 3000, PID 5000 is init or runs killport"
+    refute grep -q "5000\|5001" "$TEST_TEMP_DIR/kill_calls.log"
+}
@@ -20,7 +20,7 @@ teardown() {
     assert_output --partial "Process on port 3000 terminated"
     
     # Verify lsof was called to find the process
-    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -ti:3000"
+    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -nP -iTCP:3000 -sTCP:LISTEN -Fpn"
     
     # Verify kill was called with SIGKILL (-9)
     assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -9 12345"
@@ -35,7 +35,7 @@ teardown() {
     assert_output --partial "No process on port 8080"
     
     # Verify lsof was called
-    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -ti:8080"
+    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -nP -iTCP:8080 -sTCP:LISTEN -Fpn"
     
     # Verify kill was not called
     assert_no_mock_calls "$TEST_TEMP_DIR/kill_calls.log"
@@ -53,10 +53,11 @@ teardown() {
     assert_output --partial "Process on port 3000 terminated"
     
     # Verify lsof was called
-    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -ti:3000"
+    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -nP -iTCP:3000 -sTCP:LISTEN -Fpn"
     
-    # Should attempt to kill the first PID found with -9
+    # Every process listening on the port is killed
     assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -9 12345"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -9 67890"
 }
 
 @test "works with standard web development ports" {
@@ -89,25 +90,23 @@ teardown() {
     assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -9 33333"
 }
 
-@test "handles invalid port argument gracefully" {
-    # The script doesn't validate port numbers, so this should still work
-    # but lsof will return nothing
-    
+@test "rejects invalid port argument" {
     run "$UTILITY_SCRIPTS_PATH/killport_hard.sh" "invalid"
     
-    assert_success
-    assert_output --partial "No process on port invalid"
-    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -ti:invalid"
+    assert_failure
+    assert_output --partial "Error: Invalid port invalid"
+    
+    # Nothing is scanned or killed
+    assert_no_mock_calls "$TEST_TEMP_DIR/lsof_calls.log"
+    assert_no_mock_calls "$TEST_TEMP_DIR/kill_calls.log"
 }
 
 @test "requires port argument" {
     run "$UTILITY_SCRIPTS_PATH/killport_hard.sh"
     
-    assert_success
-    assert_output --partial "No process on port"
-    
-    # Should still call lsof but with empty port
-    assert_mock_called_with "$TEST_TEMP_DIR/lsof_calls.log" "lsof -ti:"
+    assert_failure
+    assert_output --partial "Usage: killport.sh"
+    assert_no_mock_calls "$TEST_TEMP_DIR/lsof_calls.log"
 }
 
 @test "uses SIGKILL signal for immediate termination" {
@@ -138,4 +137,19 @@ teardown() {
     
     # Verify the output message is the same as killport.sh
     assert_output --partial "Process on port 5000 terminated"
-}
\ No newline at end of file
+}
+
+@test "kills listeners of port ranges together with their child processes" {
+    create_mock_process "3000" "11111"
+    create_mock_process "3002" "22222"
+    create_mock_child_process "22223" "22222"
+    
+    run "$UTILITY_SCRIPTS_PATH/killport_hard.sh" 3000-3002
+    
+    assert_success
+    assert_output --partial "Process on port 3000 terminated"
+    assert_output --partial "Process on port 3002 terminated with 1 child process(es)"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -9 11111"
+    assert_mock_called_with "$TEST_TEMP_DIR/kill_calls.log" "kill -9 22223"
+    refute grep -q "kill -15" "$TEST_TEMP_DIR/kill_calls.log"
+}
@@ -47,6 +47,7 @@ setup_utility_mocks() {
     rm -f "$TEST_TEMP_DIR/sed_calls.log"
     rm -f "$TEST_TEMP_DIR/find_calls.log"
     rm -f "$TEST_TEMP_DIR/cp_calls.log"
+    rm -f "$TEST_TEMP_DIR/ps_calls.log"
     
     # Mock lsof command
     cat > "$TEST_TEMP_DIR/lsof" << 'EOF'
@@ -72,10 +73,34 @@ case "$*" in
             cat "$TEST_TEMP_DIR/mock_process_${port}"
         fi
         ;;
+    "-nP -iTCP:"*" -sTCP:LISTEN -Fpn")
+        # Expand the port list, e.g. -iTCP:3000-3002,5173, and print pid and name fields of the listeners
+        port_list="${2#-iTCP:}"
+        for spec in ${port_list//,/ }; do
+            for (( port=${spec%-*}; port<=${spec#*-}; port++ )); do
+                if [ -f "$TEST_TEMP_DIR/mock_process_${port}" ]; then
+                    while read -r pid; do
+                        [ -n "$pid" ] && printf "p%s\nf3\nn*:%s\n" "$pid" "$port"
+                    done < "$TEST_TEMP_DIR/mock_process_${port}"
+                fi
+            done
+        done
+        ;;
 esac
 exit 0
 EOF
     chmod +x "$TEST_TEMP_DIR/lsof"
+
+    # Mock ps command, prints "pid ppid" lines of the mock process tree
+    cat > "$TEST_TEMP_DIR/ps" << 'EOF'
+#!/usr/bin/env bash
+echo "ps $*" >> "$TEST_TEMP_DIR/ps_calls.log"
+if [ -f "$TEST_TEMP_DIR/mock_process_tree" ]; then
+    cat "$TEST_TEMP_DIR/mock_process_tree"
+fi
+exit 0
+EOF
+    chmod +x "$TEST_TEMP_DIR/ps"
     
     # Mock kill command
     cat > "$TEST_TEMP_DIR/kill" << 'EOF'
@@ -203,6 +228,44 @@ create_mock_process() {
     echo "active" > "$TEST_TEMP_DIR/mock_process_by_pid_${pid}"
 }
 
+# Create a mock child process of a mock process, reported by the ps mock
+create_mock_child_process() {
+    local pid="$1"
+    local ppid="$2"
+
+    echo "$pid $ppid" >> "$TEST_TEMP_DIR/mock_process_tree"
+    echo "active" > "$TEST_TEMP_DIR/mock_process_by_pid_${pid}"
+}
+
+# Create a process in the fake /proc tree, listening on a port if one is given
+# the listening socket is added to net/tcp (or net/tcp6 when the 4th argument is "tcp6")
+create_mock_proc_process() {
+    local pid="$1"
+    local ppid="$2"
+    local port="$3"
+    local table="${4:-tcp}"
+    local proc_dir="$TEST_TEMP_DIR/proc"
+    local header="  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode"
+
+    mkdir -p "$proc_dir/net" "$proc_dir/$pid/fd"
+    [ -f "$proc_dir/net/tcp" ] || echo "$header" > "$proc_dir/net/tcp"
+    [ -f "$proc_dir/net/tcp6" ] || echo "$header" > "$proc_dir/net/tcp6"
+
+    echo "$pid (node server) S $ppid $pid $pid 0 -1 4194560" > "$proc_dir/$pid/stat"
+    echo "active" > "$TEST_TEMP_DIR/mock_process_by_pid_${pid}"
+    ln -s "/dev/null" "$proc_dir/$pid/fd/0"
+
+    if [ -n "$port" ]; then
+        local inode=$((pid + 100000))
+        local address="00000000"
+        [ "$table" = "tcp6" ] && address="00000000000000000000000000000000"
+
+        printf "   0: %s:%04X %s:0000 0A 00000000:00000000 00:00000000 00000000  1000        0 %d 1 0000000000000000 100 0 0 10 0\n" \
+            "$address" "$port" "$address" "$inode" >> "$proc_dir/net/$table"
+        ln -s "socket:[$inode]" "$proc_dir/$pid/fd/3"
+    fi
+}
+
 # Remove mock process from a specific port
 remove_mock_process() {
     local port="$1"
@@ -254,6 +317,7 @@ simulate_user_input() {
 teardown_utility_tests() {
     # Clean up mock files
     rm -f "$TEST_TEMP_DIR/mock_process_"*
+    rm -rf "$TEST_TEMP_DIR/proc"
     rm -f "$TEST_TEMP_DIR/"*.log
     
     # Clean up mock project directories
@@ -294,38 +358,8 @@ assert_file_contains() {
     fi
 }
 
-# Create test copies of launch scripts that use mocked paths
-create_mock_launch_scripts() {
-    # Copy the real launch_appshell_dev_server.sh to test directory and modify paths
-    cp "$UTILITY_SCRIPTS_PATH/launch_appshell_dev_server.sh" "$TEST_TEMP_DIR/launch_appshell_dev_server.sh"
-    
-    # Replace the hardcoded path with our mock path
-    sed -i '' "s|/Users/user/Mysky/projects/app_shell|$MOCK_APPSHELL_DIR|g" "$TEST_TEMP_DIR/launch_appshell_dev_server.sh"
-    
-    # Replace kill builtin with external command to use our mock
-    perl -i -pe 's/kill -/command kill -/g' "$TEST_TEMP_DIR/launch_appshell_dev_server.sh"
-    
-    chmod +x "$TEST_TEMP_DIR/launch_appshell_dev_server.sh"
-
-    # Copy the real launch_spend_dev_server.sh to test directory and modify paths
-    cp "$UTILITY_SCRIPTS_PATH/launch_spend_dev_server.sh" "$TEST_TEMP_DIR/launch_spend_dev_server.sh"
-    
-    # Replace the hardcoded path with our mock path
-    sed -i '' "s|/Users/user/Mysky/projects/_spend/_spend-master|$MOCK_SPEND_DIR|g" "$TEST_TEMP_DIR/launch_spend_dev_server.sh"
-    
-    # Replace kill builtin with external command to use our mock
-    perl -i -pe 's/kill -/command kill -/g' "$TEST_TEMP_DIR/launch_spend_dev_server.sh"
-    
-    chmod +x "$TEST_TEMP_DIR/launch_spend_dev_server.sh"
-}
-
 # Create test environment with all mocks
 setup_test_environment() {
     create_mock_mysky_projects
     setup_utility_mocks
-    
-    # Only create mock launch scripts if not disabled
-    if [ "$SKIP_MOCK_LAUNCH_SCRIPTS" != "true" ]; then
-        create_mock_launch_scripts
-    fi
 }
\ No newline at end of file